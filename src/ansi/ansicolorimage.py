@@ -1,7 +1,15 @@
 #!/usr/bin/env python3
 from PIL import Image, ImageEnhance
+import colorsys
 import re
 
+import ansi.palette
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Optional, the pixels are mapped in Python without it
+
 
 class AnsiColorImage(object):
     """ANSI from an image
@@ -14,28 +22,33 @@ class AnsiColorImage(object):
             # Defaults
             brightness: float = 1.0,
             chars_map: list = None,
+            color_tolerance: float = 0.0,
             contrast: float = 1.0,
             height: int = 20,
             hide_foreground_character: bool = False,
+            palette: ansi.palette.Palette = None,
             show_background_color: bool = False,
             width: int = 40) -> None:
         """Class constructor"""
         self.__default_chars_map = [
             ' ', '´', '.', ':', ';', 'i', '/', 'l', 'j', 'h',
             'N', 'S', 'k', 'W', 'M', 'G', '0', '@', '#', '#']
-        self.__ansi_lines = []
+        self.__ansi_lines = None
         self.__brightness = brightness
         self.__chars_map = chars_map if chars_map else self.__default_chars_map
+        self.__color_tolerance = color_tolerance
         self.__contrast = contrast
         self.__height = height
         self.__hide_foreground_character = hide_foreground_character
+        self.__image = None
         self.__image_accent_color = None
+        self.__palette = palette if palette else ansi.palette.Palette(
+            'truecolor')
+        self.__saved_bytes = 0
         self.__show_background_color = show_background_color
         self.__url_image = url_image
         self.__width = width
 
-        self.update_ascii_lines()
-
     @property
     def ansi_lines(self) -> list:
         """Getter: list
@@ -43,7 +56,10 @@ class AnsiColorImage(object):
         This 'property' does not contain 'setter', so use properties like
         'url_image' together with 'update_ascii_lines()' method to
         update the list.
+        The lines are only made when first used.
         """
+        if self.__ansi_lines is None:
+            self.update_ascii_lines()
         return self.__ansi_lines
 
     @property
@@ -93,6 +109,27 @@ class AnsiColorImage(object):
     def chars_map(self, chars_map: list) -> None:
         self.__chars_map = chars_map if chars_map else self.__default_chars_map
 
+    @property
+    def color_tolerance(self) -> float:
+        """Getter: float
+        Get the color tolerance
+
+        Setter: float
+        Set the color tolerance
+
+        Colors are only written when they change along a line. With a
+        tolerance, a color that is this close to the last written one, by
+        the "redmean" approximation of the perceived distance, is not
+        written either, and the last one is used. The distance goes from
+        0 to about 765, and small values like 8 are hard to notice.
+        Use 'None' to reset. Default is 0.0.
+        """
+        return self.__color_tolerance
+
+    @color_tolerance.setter
+    def color_tolerance(self, tolerance: float) -> None:
+        self.__color_tolerance = tolerance if tolerance else 0.0
+
     @property
     def contrast(self) -> float:
         """Getter: float
@@ -164,37 +201,40 @@ class AnsiColorImage(object):
         if self.__image_accent_color:
             return self.__image_accent_color
 
-        # Colors ['red', 'blue', 'black']
-        colors_found = []
-        for line in self.__ansi_lines:
-            colors_found += re.findall(r'\x1b\[\d+;\d+;\d+;\d+;\d+m', line)
-
-        # Count {'red': 2, 'blue': 5, 'black': 22}
-        colors_count = {}
-        for color in colors_found:
-            rgb = color[7:-1]  # '\x1b[38;2;0;0;0m'[7:-1] -> '0;0;0'
-            r, g, b = rgb.split(';')
-
-            # Remove black and white colors (all combination: rg b, rb g, gb r)
-            if (  # 50 Must have 1 color greater than 50
-                    (int(r) > 50 or int(g) > 50 or int(b) > 50) and
-                    (  # Must have 2 colors smaller than 200
-                        (int(r) < 200 and int(g) < 200) or
-                        (int(r) < 200 and int(b) < 200) or
-                        (int(g) < 200 and int(b) < 200)
-                    )
-            ):
-                if rgb not in colors_count:
-                    colors_count[rgb] = 1
-                else:
-                    colors_count[rgb] += 1
-
-        # Save biggest number color
-        saved_color, saved_num = ('255;255;255', 0)
-        for color, num in colors_count.items():
-            if num > saved_num:
-                saved_color, saved_num = (color, num)
-        self.__image_accent_color = saved_color
+        # Histogram of the colors, in buckets of 16 levels per channel:
+        # {(r, g, b): [pixels, sum of r, sum of g, sum of b]}. Read from
+        # the image, so the ANSI lines are not needed
+        buckets = {}
+        image = self.__get_image()
+        for num, (r, g, b) in image.getcolors(image.width * image.height):
+            bucket = buckets.setdefault((r >> 4, g >> 4, b >> 4), [0, 0, 0, 0])
+            bucket[0] += num
+            bucket[1] += r * num
+            bucket[2] += g * num
+            bucket[3] += b * num
+
+        # Pixels of each of the 12 hues: {hue: [pixels, [buckets]]}
+        hues = {}
+        for num, r_sum, g_sum, b_sum in buckets.values():
+            color = (
+                round(r_sum / num), round(g_sum / num), round(b_sum / num))
+            hue, saturation, value = colorsys.rgb_to_hsv(
+                *[x / 255 for x in color])
+
+            # Remove near-black, near-white and gray colors
+            if value * 255 <= 50 or saturation < 0.2:
+                continue
+
+            hue_bin = hues.setdefault(int(hue * 12) % 12, [0, []])
+            hue_bin[0] += num
+            hue_bin[1].append((num, color))
+
+        # Biggest bucket of the dominant hue
+        self.__image_accent_color = '255;255;255'
+        if hues:
+            _num, colors = max(hues.values(), key=lambda x: x[0])
+            self.__image_accent_color = '{};{};{}'.format(
+                *max(colors, key=lambda x: x[0])[1])
 
         return self.__image_accent_color
 
@@ -209,6 +249,34 @@ class AnsiColorImage(object):
 
         self.__image_accent_color = color
 
+    @property
+    def palette(self) -> ansi.palette.Palette:
+        """Getter: Palette
+        Get the palette of the terminal
+
+        Setter: Palette
+        Set the palette of the terminal
+
+        Colors are written as the closest color of the palette, like
+        'Palette('256')' for 256-color terminals.
+        Use 'None' to reset. Default is 'Palette('truecolor')'.
+        """
+        return self.__palette
+
+    @palette.setter
+    def palette(self, palette: ansi.palette.Palette) -> None:
+        self.__palette = palette if palette else ansi.palette.Palette(
+            'truecolor')
+
+    @property
+    def saved_bytes(self) -> int:
+        """Getter: int
+        Bytes of 'ansi_lines' saved by writing each color only when it
+        changes, compared to one color before every character.
+        This 'property' does not contain 'setter'.
+        """
+        return self.__saved_bytes
+
     @property
     def show_background_color(self) -> bool:
         """Getter: bool
@@ -270,9 +338,31 @@ class AnsiColorImage(object):
         no visible effect if no property has been modified.
         Use the 'ansi_lines' property to get the new updated list.
         """
-        # Reset ansi_lines and accent color
+        # Reset ansi_lines, accent color and image
         self.__ansi_lines = []
         self.__image_accent_color = None
+        self.__image = None
+        image = self.__get_image()
+
+        # Map. Each different color is formatted only once, and each line
+        # is joined once
+        width, height = image.size
+        if numpy is not None:
+            cells = self.__get_cells_vectorized(image)
+        else:
+            cells = self.__get_cells(image)
+
+        self.__saved_bytes = 0
+        escapes = {}
+        for line in range(height):
+            self.__ansi_lines.append(self.__get_line(
+                cells[line * width:(line + 1) * width], line, escapes))
+
+    def __get_image(self) -> Image.Image:
+        # Resized RGB image, with the contrast and brightness adjusted.
+        # Kept until 'update_ascii_lines()'
+        if self.__image is not None:
+            return self.__image
 
         # Image
         image = Image.open(self.__url_image, 'r').convert('RGBA')
@@ -294,47 +384,94 @@ class AnsiColorImage(object):
             brightness = ImageEnhance.Brightness(image)
             image = brightness.enhance(self.__brightness)
 
-        # Map
-        ascii_line = ''
-        loop_count = 0
-        line_count = 0
-        for pixel in list(image.getdata()):
-            # RGB
-            if len(pixel) == 3:
-                r, g, b = pixel
-            else:
-                r, g, b, _a = pixel
-
-            # Foreground:
-            #     set brightness to find ascii_map char index
-            pixel_brightness = (  # brightness: github.com/EbonJaeger/asciifyer
-                    (0.2126 * r) + (0.7152 * g) + (0.0722 * b))
-
-            ascii_map_char_index = int(
-                    (pixel_brightness / 255.0) * (len(self.__chars_map)))
-
-            foreground_character = ' '
-            if not self.__hide_foreground_character:
-                foreground_character = self.__chars_map[ascii_map_char_index]
-
-            # Background:
-            #     \x1b[48... for background or \x1b[38... for hidden background
-            bg_color = 48 if self.__show_background_color else 38
-            ascii_line += '{}{}'.format(
-                f'\x1b[{bg_color};2;{r};{g};{b}m',
-                foreground_character)
-
-            # Loop config
-            if loop_count + 1 == self.__width:
-                # Update line
-                self.__ansi_lines.append(ascii_line + '\x1B[0m')
-                line_count += 1
-
-                # Reset
-                ascii_line = ''
-                loop_count = 0
+        self.__image = image.convert('RGB')
+        return self.__image
+
+    def __get_line(self, cells: list, line_num: int, escapes: dict) -> str:
+        # A color is only written when it changes. The color of a space
+        # is not seen, unless it is the background color.
+        # Escapes: {color: (palette color, escape)}, with the position in
+        # the dithering matrix in the key when it is used
+        is_dithered = (
+            self.__palette.is_dithered and self.__palette.mode != 'truecolor')
+        line = []
+        line_color = None
+        for column, (pixel_color, character) in enumerate(cells):
+            key = (
+                (pixel_color, column % 4, line_num % 4) if is_dithered
+                else pixel_color)
+            if key not in escapes:
+                color = self.__palette.quantize(
+                    *pixel_color, column, line_num)
+                escapes[key] = (color, '\x1b[{}m'.format(self.__palette.sgr(
+                    color, self.__show_background_color)))
+            color, escape = escapes[key]
+
+            if (color == line_color or
+                    character == ' ' and not self.__show_background_color or
+                    self.__color_tolerance and line_color is not None and
+                    self.__get_color_distance(color, line_color) <= (
+                        self.__color_tolerance)):
+                self.__saved_bytes += len(escape)
             else:
-                loop_count += 1
+                line.append(escape)
+                line_color = color
+            line.append(character)
+
+        return ''.join(line) + '\x1B[0m'
+
+    def __get_cells(self, image: Image.Image) -> list:
+        # Color and character of each pixel, with a memo by color
+        pixels = image.tobytes()
+        colors = {}
+        cells = []
+        for num in range(0, len(pixels), 3):
+            color = pixels[num:num + 3]
+            cell = colors.get(color)
+            if cell is None:
+                r, g, b = color
+                # brightness: github.com/EbonJaeger/asciifyer
+                pixel_brightness = (0.2126 * r) + (0.7152 * g) + (0.0722 * b)
+                cell = self.__get_cell(r, g, b, int(
+                    (pixel_brightness / 255.0) * (len(self.__chars_map))))
+                colors[color] = cell
+            cells.append(cell)
+        return cells
+
+    def __get_cells_vectorized(self, image: Image.Image) -> list:
+        # Same as '__get_cells', with the brightness of all the different
+        # colors computed at once. The float operations are the same, so
+        # the characters are too
+        pixels = numpy.asarray(image, dtype=numpy.uint32).reshape(-1, 3)
+        colors, inverse = numpy.unique(
+            (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2],
+            return_inverse=True)
+        r, g, b = colors >> 16, (colors >> 8) & 255, colors & 255
+
+        pixel_brightness = (0.2126 * r) + (0.7152 * g) + (0.0722 * b)
+        indexes = ((pixel_brightness / 255.0) * (
+            len(self.__chars_map))).astype(int)
+
+        color_cells = [
+            self.__get_cell(*color) for color in zip(
+                r.tolist(), g.tolist(), b.tolist(), indexes.tolist())]
+        return [color_cells[x] for x in inverse.reshape(-1).tolist()]
+
+    def __get_cell(self, r: int, g: int, b: int, char_index: int) -> tuple:
+        # Color and character. The color is written by '__get_line()'
+        foreground_character = ' '
+        if not self.__hide_foreground_character:
+            foreground_character = self.__chars_map[char_index]
+        return (r, g, b), foreground_character
+
+    @staticmethod
+    def __get_color_distance(color: tuple, other_color: tuple) -> float:
+        # "Redmean": www.compuphase.com/cmetric.htm
+        red_mean = (color[0] + other_color[0]) / 2
+        r, g, b = (x - y for x, y in zip(color, other_color))
+        return (
+            (2 + red_mean / 256) * r * r + 4 * g * g +
+            (2 + (255 - red_mean) / 256) * b * b) ** 0.5
 
 
 if __name__ == '__main__':
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
+import ansi.palette
 
 
 class ColorBar(object):
     """..."""
-    def __init__(self, color: tuple | list) -> None:
+    def __init__(
+            self, color: tuple | list,
+            palette: ansi.palette.Palette = None) -> None:
         """...
 
         :param color: RGB tuple or list like (255, 255, 255)
+        :param palette: Palette of the terminal. Default is
+            'Palette('truecolor')'
         """
         self.__color = color
+        self.__palette = palette if palette else ansi.palette.Palette(
+            'truecolor')
         self.__color_item_width = 2
         self.__is_legacy = False
         self.__is_mirrored = True
@@ -22,6 +29,7 @@ class ColorBar(object):
     @color.setter
     def color(self, color: tuple | list) -> None:
         self.__color = color
+        self.__colorbar = None
 
     @property
     def color_item_width(self) -> int:
@@ -31,6 +39,7 @@ class ColorBar(object):
     @color_item_width.setter
     def color_item_width(self, width: int) -> None:
         self.__color_item_width = width
+        self.__colorbar = None
 
     @property
     def is_legacy(self) -> bool:
@@ -40,6 +49,7 @@ class ColorBar(object):
     @is_legacy.setter
     def is_legacy(self, value: bool) -> None:
         self.__is_legacy = value
+        self.__colorbar = None
 
     @property
     def is_mirrored(self) -> bool:
@@ -49,6 +59,18 @@ class ColorBar(object):
     @is_mirrored.setter
     def is_mirrored(self, value: bool) -> None:
         self.__is_mirrored = value
+        self.__colorbar = None
+
+    @property
+    def palette(self) -> ansi.palette.Palette:
+        """..."""
+        return self.__palette
+
+    @palette.setter
+    def palette(self, palette: ansi.palette.Palette) -> None:
+        self.__palette = palette if palette else ansi.palette.Palette(
+            'truecolor')
+        self.__colorbar = None
 
     @property
     def colorbar(self) -> str:
@@ -62,17 +84,18 @@ class ColorBar(object):
     def colorbar(self, colorbar: str) -> None:
         self.__colorbar = colorbar
 
-    @staticmethod
-    def __get_legacy_colorbar() -> str:
+    def __get_legacy_colorbar(self) -> str:
         # ...
-        return (
-            '\x1b[48;2;53;53;159m \x1b[48;2;64;113;191m '
-            '\x1b[48;2;64;170;191m \x1b[48;2;127;212;169m '
-            '\x1b[48;2;169;212;127m \x1b[48;2;191;191;64m '
-            '\x1b[48;2;191;170;64m \x1b[48;2;191;148;64m '
-            '\x1b[48;2;191;106;64m \x1b[48;2;196;57;57m '
-            '\x1b[48;2;148;50;50m \x1b[48;2;138;50;116m '
-            '\x1b[48;2;107;61;166m \x1B[0m')
+        return ''.join(self.__get_background(*x) + ' ' for x in [
+            (53, 53, 159), (64, 113, 191), (64, 170, 191), (127, 212, 169),
+            (169, 212, 127), (191, 191, 64), (191, 170, 64), (191, 148, 64),
+            (191, 106, 64), (196, 57, 57), (148, 50, 50), (138, 50, 116),
+            (107, 61, 166)]) + '\x1B[0m'
+
+    def __get_background(self, r: int, g: int, b: int) -> str:
+        # Closest color of the palette
+        return '\x1b[{}m'.format(self.__palette.sgr(
+            self.__palette.quantize(r, g, b), is_background=True))
 
     def __update_colorbar(self) -> None:
         # ...
@@ -80,32 +103,27 @@ class ColorBar(object):
             self.__colorbar = self.__get_legacy_colorbar()
             return
 
-        self.__darken_color(50)
         colors_sig = []
-        for num in self.__color:
+        for num in self.__darken_color(50):
             color_sig = num + '+' if int(num) + 100 < 255 else num + '-'
             colors_sig.append(color_sig)
 
         colors = []
         for _ in range(5):
             update_colors_sig = []
-            ansi = ''
-
-            for num, color in enumerate(colors_sig):
+            new_colors = []
+            for color in colors_sig:
                 if color[-1] == '+':
                     new_color = int(color[:-1]) + 10
                     update_colors_sig.append(str(new_color) + '+')
                 else:
                     new_color = int(color[:-1]) - 10
                     update_colors_sig.append(str(new_color) + '-')
+                new_colors.append(new_color)
 
-                if num == 0:
-                    ansi += '\x1b[48;2;' + str(new_color)
-                elif num == 1:
-                    ansi += ';' + str(new_color)
-                else:
-                    ansi += ';' + str(new_color) + 'm'
-                    ansi += ' ' * self.__color_item_width
+            ansi = (
+                self.__get_background(*new_colors) +
+                ' ' * self.__color_item_width)
 
             colors_sig = update_colors_sig
             colors.append(ansi)
@@ -122,8 +140,8 @@ class ColorBar(object):
 
         self.__colorbar = colorbar + '\x1B[0m'
 
-    def __darken_color(self, weight: int) -> None:
-        # ...
+    def __darken_color(self, weight: int) -> list:
+        # Darker copy, the color itself is kept for the next update
         colors = []
         for num in self.__color:
             int_num = int(num)
@@ -131,4 +149,4 @@ class ColorBar(object):
                 colors.append(str(int_num - weight))
             else:
                 colors.append(num)
-        self.__color = colors
+        return colors
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+
+
+class CachedLogo(object):
+    """A rendered logo, like the result of 'AnsiColorImage'
+
+    Only has what is needed to print it, so it can be read from the cache
+    without importing the image libraries.
+    """
+    def __init__(
+            self, ansi_lines: list, image_accent_color: str,
+            width: int) -> None:
+        """Class constructor
+
+        :param ansi_lines: Lines of the logo, like 'AnsiColorImage'
+        :param image_accent_color: Accent color like '192;0;53'
+        :param width: Width in number of columns
+        """
+        self.__ansi_lines = ansi_lines
+        self.__image_accent_color = image_accent_color
+        self.__width = width
+
+    @property
+    def ansi_lines(self) -> list:
+        """..."""
+        return self.__ansi_lines
+
+    @property
+    def image_accent_color(self) -> str:
+        """..."""
+        return self.__image_accent_color
+
+    @property
+    def width(self) -> int:
+        """..."""
+        return self.__width
+
+
+class LogoCache(object):
+    """Rendered logos, cached on disk
+
+    One small JSON file per logo, named after a hash of the source image
+    path, its modification time and size, and every parameter of the
+    rendering. A changed image or parameter is a different file, so
+    nothing needs to be invalidated. The least recently used files are
+    removed when there are more than 'max_entries'.
+    """
+    # Version of the rendered lines, to add to the parameters of 'key()'.
+    # Increase it when 'AnsiColorImage' or 'Palette' draw differently
+    format_version = 2
+
+    def __init__(self, cache_dir: str, max_entries: int = 16) -> None:
+        """Class constructor
+
+        :param cache_dir: Directory of the files, like
+            '~/.cache/infofetch/logos'
+        :param max_entries: Number of logos to keep
+        """
+        self.__cache_dir = cache_dir
+        self.__max_entries = max_entries
+
+    @property
+    def cache_dir(self) -> str:
+        """..."""
+        return self.__cache_dir
+
+    @staticmethod
+    def key(url_image: str, parameters: dict) -> str | None:
+        """Key of a rendered logo
+
+        :param url_image: Source image, like an SVG before its conversion
+        :param parameters: Everything that changes the rendering, like
+            {'width': 40, 'contrast': 1.3, 'palette_mode': '256'}
+        :return: Hex string, or 'None' if the image can't be read
+        """
+        try:
+            stat = os.stat(url_image)
+        except OSError:
+            return None
+
+        content = json.dumps(
+            [os.path.abspath(url_image), stat.st_mtime_ns, stat.st_size,
+             parameters], sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()[:32]
+
+    def get(self, key: str) -> CachedLogo | None:
+        """A cached logo
+
+        :param key: Key from 'key()'
+        :return: The logo, or 'None' if it is not cached
+        """
+        url = self.__get_url(key)
+        try:
+            with open(url, 'r') as cache_file:
+                content = json.load(cache_file)
+            logo = CachedLogo(
+                content['ansi_lines'], content['image_accent_color'],
+                content['width'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        try:
+            os.utime(url)  # Most recently used
+        except OSError:
+            pass
+        return logo
+
+    def set(self, key: str, logo: CachedLogo) -> None:
+        """Cache a logo
+
+        :param key: Key from 'key()'
+        :param logo: The rendered logo, or anything with the same
+            properties, like an 'AnsiColorImage'
+        """
+        url = self.__get_url(key)
+        try:
+            os.makedirs(self.__cache_dir, exist_ok=True)
+            temp_url = f'{url}.{os.getpid()}.tmp'
+            with open(temp_url, 'w') as cache_file:
+                json.dump({
+                    'ansi_lines': logo.ansi_lines,
+                    'image_accent_color': logo.image_accent_color,
+                    'width': logo.width}, cache_file, separators=(',', ':'))
+            os.replace(temp_url, url)
+        except OSError:
+            # Not being able to cache is not an error
+            return
+
+        self.__remove_least_recently_used()
+
+    def __get_url(self, key: str) -> str:
+        # ...
+        return os.path.join(self.__cache_dir, f'{key}.json')
+
+    def __remove_least_recently_used(self) -> None:
+        # Oldest access times first
+        try:
+            entries = [
+                x for x in os.scandir(self.__cache_dir)
+                if x.name.endswith('.json')]
+            entries.sort(key=lambda x: x.stat().st_mtime_ns)
+        except OSError:
+            return
+
+        for entry in entries[:max(0, len(entries) - self.__max_entries)]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
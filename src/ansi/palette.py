@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import os
+
+
+class Palette(object):
+    """Colors that the terminal can show
+
+    Maps RGB colors to the SGR parameters of a truecolor, 256-color or
+    16-color terminal, like '38;2;192;0;53', '38;5;161' or '91'. Reduced
+    palettes use a lookup table with the palette color of each cell of a
+    32x32x32 RGB cube. The table is filled in as the colors are used, so
+    a logo only pays for the cells of its own colors. An ordered (Bayer)
+    dithering can spread the error of the reduced palettes over
+    neighbouring pixels.
+    """
+    # Threshold map of the ordered dithering, 0 to 15
+    __bayer_matrix = [
+        [0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]]
+
+    # Default colors of xterm, used by most terminals for the first 16
+    __base_colors = [
+        (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+        (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+        (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+        (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255)]
+    __cube_levels = [0, 95, 135, 175, 215, 255]
+
+    def __init__(self, mode: str = None, is_dithered: bool = False) -> None:
+        """Class constructor
+
+        :param mode: 'truecolor', '256' or '16'. Default is
+            'detect_mode()'
+        :param is_dithered: Use ordered dithering on reduced palettes
+        :raise ValueError: If the mode is unknown
+        """
+        self.__mode = mode if mode else self.detect_mode()
+        if self.__mode not in ['truecolor', '256', '16']:
+            raise ValueError(f'Unknown palette mode: {self.__mode}')
+
+        self.__is_dithered = is_dithered
+        self.__lookup_table = None
+        self.__colors = None
+        self.__indexes = None
+
+        # Half the distance between two palette colors, more or less
+        self.__dithering_spread = 48 if self.__mode == '256' else 96
+
+    @staticmethod
+    def detect_mode(environ: dict = None) -> str:
+        """Mode of the terminal, from '$COLORTERM' and '$TERM'
+
+        'truecolor' if '$COLORTERM' says so, for terminals known to
+        support it and without '$TERM', as when the output is not a
+        terminal. '256' for '$TERM' like 'xterm-256color' and '16' for
+        the others, like 'linux' or 'screen'.
+
+        :param environ: Default is 'os.environ'
+        """
+        environ = os.environ if environ is None else environ
+        if environ.get('COLORTERM', '').lower() in ['truecolor', '24bit']:
+            return 'truecolor'
+
+        term = environ.get('TERM', '').lower()
+        if not term or any(x in term for x in [
+                '-direct', 'kitty', 'alacritty', 'wezterm', 'foot']):
+            return 'truecolor'
+        if '256' in term:
+            return '256'
+        return '16'
+
+    @property
+    def mode(self) -> str:
+        """'truecolor', '256' or '16'"""
+        return self.__mode
+
+    @property
+    def is_dithered(self) -> bool:
+        """If ordered dithering is used on reduced palettes"""
+        return self.__is_dithered
+
+    def quantize(
+            self, r: int, g: int, b: int, x: int = None,
+            y: int = None) -> tuple:
+        """The closest palette color
+
+        :param r: Red, 0 to 255
+        :param g: Green, 0 to 255
+        :param b: Blue, 0 to 255
+        :param x: Column of the pixel, for the dithering
+        :param y: Line of the pixel, for the dithering
+        :return: RGB tuple like (215, 0, 95)
+        """
+        if self.__mode == 'truecolor':
+            return r, g, b
+
+        if self.__is_dithered and x is not None and y is not None:
+            offset = round(self.__dithering_spread * (
+                (self.__bayer_matrix[y % 4][x % 4] + 0.5) / 16 - 0.5))
+            r, g, b = (
+                min(max(channel + offset, 0), 255) for channel in (r, g, b))
+
+        if self.__lookup_table is None:
+            self.__lookup_table = [None] * 32768
+        cell = (int(r) >> 3) << 10 | (int(g) >> 3) << 5 | (int(b) >> 3)
+        if self.__lookup_table[cell] is None:
+            # Center of the cell
+            self.__lookup_table[cell] = self.__get_closest_color(
+                (cell >> 10) * 8 + 4, (cell >> 5 & 31) * 8 + 4,
+                (cell & 31) * 8 + 4)
+        return self.__lookup_table[cell]
+
+    def sgr(self, color: tuple | list, is_background: bool = False) -> str:
+        """SGR parameters of a palette color
+
+        Use 'quantize()' first, for a color that is in the palette.
+
+        :param color: RGB tuple like (215, 0, 95)
+        :param is_background: Background instead of foreground color
+        :return: String like '38;2;215;0;95', '38;5;161' or '91', to use as
+            f'\\x1b[{sgr}m'
+        """
+        r, g, b = color
+        if self.__mode == 'truecolor':
+            return f'{48 if is_background else 38};2;{r};{g};{b}'
+
+        index = self.__get_indexes()[(r, g, b)]
+        if self.__mode == '256':
+            return f'{48 if is_background else 38};5;{index}'
+        if index < 8:
+            return str((40 if is_background else 30) + index)
+        return str((100 if is_background else 90) + index - 8)
+
+    def __get_colors(self) -> list:
+        # Colors that the lookup table can return
+        if self.__colors is None:
+            if self.__mode == '16':
+                self.__colors = list(self.__base_colors)
+            else:
+                # 6x6x6 cube and 24 grays, without the 16 base colors,
+                # since they are often changed by the terminal theme
+                self.__colors = [
+                    (r, g, b) for r in self.__cube_levels
+                    for g in self.__cube_levels for b in self.__cube_levels
+                ] + [(x, x, x) for x in range(8, 248, 10)]
+        return self.__colors
+
+    def __get_indexes(self) -> dict:
+        # Color: palette index
+        if self.__indexes is None:
+            first_index = 0 if self.__mode == '16' else 16
+            self.__indexes = {
+                color: num + first_index
+                for num, color in enumerate(self.__get_colors())}
+        return self.__indexes
+
+    def __get_closest_color(self, r: int, g: int, b: int) -> tuple:
+        # Smallest squared distance. In the cube, each channel is the
+        # closest level on its own, so only it and the grays are compared
+        if self.__mode == '16':
+            candidates = self.__get_colors()
+        else:
+            cube = tuple(
+                min(self.__cube_levels, key=lambda level: abs(level - x))
+                for x in (r, g, b))
+            gray = min(
+                range(8, 248, 10), key=lambda level: abs(
+                    level - (r + g + b) / 3))
+            candidates = [cube, (gray, gray, gray)]
+
+        return min(candidates, key=lambda color: (
+            (color[0] - r) ** 2 + (color[1] - g) ** 2 + (color[2] - b) ** 2))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import os
+import signal
+import subprocess
+import threading
+
+
+class ChildProcesses(object):
+    """Child processes started by the probes
+
+    Every process is started in its own process group and registered under
+    the thread that started it, so that the probe scheduler can kill all
+    the processes of a probe that missed its deadline, including their
+    children, like a shell pipeline.
+    """
+    __lock = threading.Lock()
+    __processes = {}
+
+    @staticmethod
+    def run(
+            args: list, timeout: float = None,
+            text: bool = True) -> subprocess.CompletedProcess:
+        """Run a command, like 'subprocess.run' with 'capture_output'
+
+        :param args: Command and its arguments, like ['rpm', '-qa']
+        :param timeout: Seconds to wait before killing the command
+        :param text: Decode the output as text
+        :raise OSError: If the command can't be started
+        :raise subprocess.TimeoutExpired: After 'timeout' seconds
+        """
+        thread_id = threading.get_ident()
+        process = subprocess.Popen(
+            args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, text=text, start_new_session=True)
+
+        with ChildProcesses.__lock:
+            ChildProcesses.__processes.setdefault(thread_id, set()).add(
+                process)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            ChildProcesses.__kill_process(process)
+            process.communicate()
+            raise
+        finally:
+            with ChildProcesses.__lock:
+                ChildProcesses.__processes[thread_id].discard(process)
+                if not ChildProcesses.__processes[thread_id]:
+                    del ChildProcesses.__processes[thread_id]
+
+        return subprocess.CompletedProcess(
+            args, process.returncode, stdout, stderr)
+
+    @staticmethod
+    def kill(thread_id: int) -> int:
+        """Kill the running processes started by a thread
+
+        :param thread_id: Id of the thread, like 'threading.get_ident()'
+        :return: Number of processes killed
+        """
+        with ChildProcesses.__lock:
+            processes = list(ChildProcesses.__processes.get(thread_id, []))
+
+        for process in processes:
+            ChildProcesses.__kill_process(process)
+        return len(processes)
+
+    @staticmethod
+    def __kill_process(process: subprocess.Popen) -> None:
+        # The whole process group, since the command may have children
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+import os
+
+
+class CpuInfo(object):
+    """Processor model, topology and frequencies
+
+    '/proc/cpuinfo' repeats a block for every thread, so only the first
+    block is read and the file is closed there. Counts come from the
+    topology files in '/sys/devices/system/cpu' and frequencies from
+    cpufreq.
+    """
+    def __init__(
+            self, cpuinfo_url: str = '/proc/cpuinfo',
+            cpu_url: str = '/sys/devices/system/cpu') -> None:
+        """Class constructor
+
+        :param cpuinfo_url: Path of the cpuinfo file
+        :param cpu_url: Path of the CPU devices in sysfs
+        """
+        self.__cpuinfo_url = cpuinfo_url
+        self.__cpu_url = cpu_url
+        self.__first_processor = None
+        self.__online = None
+        self.__content = None
+
+    @property
+    def first_processor(self) -> dict:
+        """Fields of the first processor block of '/proc/cpuinfo'
+
+        Example:
+        >>> CpuInfo().first_processor['model name']
+        'Intel(R) Core(TM) i5-7200U CPU @ 2.50GHz'
+        """
+        if self.__first_processor is None:
+            self.__first_processor = self.__parse_first_processor()
+        return self.__first_processor
+
+    @property
+    def online(self) -> list:
+        """Ids of the online logical CPUs, like [0, 1, 2, 3]"""
+        if self.__online is None:
+            self.__online = self.__parse_cpu_list(
+                self.__read(os.path.join(self.__cpu_url, 'online')))
+            if not self.__online:
+                self.__online = list(range(os.cpu_count() or 1))
+        return self.__online
+
+    @property
+    def content(self) -> dict:
+        """All the CPU information
+
+        Keys: 'model', 'vendor', 'sockets', 'cores', 'threads',
+        'min_frequency' and 'max_frequency' (kHz, or 'None' without
+        cpufreq, like in most virtual machines) and 'architecture'.
+
+        Example:
+        >>> CpuInfo().content
+        {'model': 'Intel(R) Core(TM) i5-7200U CPU @ 2.50GHz',
+         'vendor': 'GenuineIntel', 'sockets': 1, 'cores': 2, 'threads': 4,
+         'min_frequency': 400000, 'max_frequency': 3100000,
+         'architecture': 'x86_64'}
+        """
+        if self.__content is None:
+            sockets, cores = self.__get_topology()
+            min_frequency, max_frequency = self.__get_frequencies()
+            self.__content = {
+                'model': self.__get_model(),
+                'vendor': self.first_processor.get('vendor_id'),
+                'sockets': sockets,
+                'cores': cores,
+                'threads': len(self.online),
+                'min_frequency': min_frequency,
+                'max_frequency': max_frequency,
+                'architecture': os.uname().machine}
+        return self.__content
+
+    def __parse_first_processor(self) -> dict:
+        # "model name\t: Intel(R) Core(TM) i5-7200U CPU @ 2.50GHz"
+        fields = {}
+        try:
+            with open(self.__cpuinfo_url, 'r', errors='replace') as cpuinfo:
+                for line in cpuinfo:
+                    key, sep, value = line.partition(':')
+                    if not sep:
+                        if fields and 'processor' in fields:
+                            break  # End of the first block
+                        continue
+
+                    key = key.strip()
+                    if key == 'processor' and 'processor' in fields:
+                        break  # No blank line between blocks
+                    fields.setdefault(key, value.strip())
+        except OSError:
+            pass
+        return fields
+
+    def __get_model(self) -> str | None:
+        # The model field has a different name on each architecture
+        for key in [
+                'model name', 'Model', 'Hardware', 'cpu model', 'cpu',
+                'uarch', 'Processor']:
+            value = self.first_processor.get(key)
+            if value:
+                return value
+        return None
+
+    def __get_topology(self) -> tuple:
+        # Physical cores are the unique (package, core) pairs
+        packages = set()
+        cores = set()
+        for cpu in self.online:
+            topology = os.path.join(self.__cpu_url, f'cpu{cpu}', 'topology')
+            package = self.__read(os.path.join(
+                topology, 'physical_package_id'))
+            core = self.__read(os.path.join(topology, 'core_id'))
+            if not package or not core:
+                continue
+            packages.add(package)
+            cores.add((package, core))
+
+        if not cores:
+            cpu_cores = self.first_processor.get('cpu cores', '')
+            return 1, int(cpu_cores) if cpu_cores.isdigit() else None
+        return len(packages), len(cores)
+
+    def __get_frequencies(self) -> tuple:
+        # Hybrid CPUs have cores with different limits
+        min_frequencies = []
+        max_frequencies = []
+        for cpu in self.online:
+            cpufreq = os.path.join(self.__cpu_url, f'cpu{cpu}', 'cpufreq')
+            min_frequency = self.__read(
+                os.path.join(cpufreq, 'cpuinfo_min_freq'))
+            max_frequency = self.__read(
+                os.path.join(cpufreq, 'cpuinfo_max_freq'))
+            if min_frequency.isdigit():
+                min_frequencies.append(int(min_frequency))
+            if max_frequency.isdigit():
+                max_frequencies.append(int(max_frequency))
+
+        # Without cpufreq, 'cpu MHz' is only the current speed, which
+        # changes all the time, so no limit is known
+        return (
+            min(min_frequencies) if min_frequencies else None,
+            max(max_frequencies) if max_frequencies else None)
+
+    @staticmethod
+    def __parse_cpu_list(cpu_list: str) -> list:
+        # "0-3,6,8-9"
+        cpus = []
+        for item in cpu_list.split(','):
+            first, _sep, last = item.strip().partition('-')
+            if not first.isdigit():
+                continue
+            last = last if last.isdigit() else first
+            cpus.extend(range(int(first), int(last) + 1))
+        return cpus
+
+    @staticmethod
+    def __read(url: str) -> str:
+        # ...
+        try:
+            with open(url, 'r') as sysfs_file:
+                return sysfs_file.read().strip()
+        except OSError:
+            return ''
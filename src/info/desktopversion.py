@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+import glob
+import os
+import re
+import shutil
+import subprocess
+import xml.etree.ElementTree
+
+import info.childprocess
+import info.desktopentryparse
+import info.packagedb
+
+
+class DesktopVersion(object):
+    """Version of the desktop environment
+
+    Read from static metadata, in this order: the package database entry of
+    the core package of the desktop, 'gnome-version.xml', the session files
+    in '/usr/share/xsessions' and the versioned file name of a core library.
+    The desktop binary is only run as a last resort, with a timeout, since
+    some of them load a whole toolkit just to print a version.
+    """
+    def __init__(
+            self, desktop_environment: str,
+            package_database: info.packagedb.PackageDatabase = None,
+            timeout: float = 2.0) -> None:
+        """Class constructor
+
+        :param desktop_environment: Desktop name, like 'Plasma (KDE)' or
+            'ubuntu-GNOME'
+        :param package_database: Default is 'PackageDatabase()'
+        :param timeout: Seconds to wait for the desktop binary
+        """
+        self.__desktop_environment = desktop_environment.lower()
+        self.__package_database = package_database
+        self.__timeout = timeout
+        self.__version = None
+
+        # Desktop: core packages, library file names, binary command and
+        # the output line with the version. Budgie before GNOME, since
+        # '$XDG_CURRENT_DESKTOP' is 'Budgie:GNOME'
+        self.__desktops = {
+            'budgie': (
+                ['budgie-desktop', 'budgie-core'], [],
+                ['budgie-desktop', '--version'], None),
+            'cinnamon': (
+                ['cinnamon'], [], ['cinnamon', '--version'], None),
+            'gnome': (
+                ['gnome-shell'], [], ['gnome-shell', '--version'], None),
+            'kde': (
+                ['plasma-workspace', 'plasma-workspace-libs'],
+                ['libkworkspace6.so.*', 'libkworkspace5.so.*'],
+                ['plasmashell', '--version'], None),
+            'lxqt': (
+                ['lxqt-session', 'liblxqt', 'liblxqt1'], ['liblxqt.so.*'],
+                ['lxqt-about', '-v'], 'liblxqt'),
+            'mate': (
+                ['mate-session-manager'], [],
+                ['mate-session', '--version'], None),
+            'xfce': (
+                ['xfce4-session'], [],
+                ['xfce4-about', '-V'], 'xfce4-about')}
+
+    @property
+    def version(self) -> str | None:
+        """Version, like '5.27.8', or 'None' if it is not found"""
+        if self.__version is None:
+            for desktop, (packages, libraries, command, marker) in (
+                    self.__desktops.items()):
+                if desktop not in self.__desktop_environment:
+                    continue
+
+                for get_version in [
+                        lambda: self.__from_packages(packages),
+                        lambda: self.__from_gnome_version(desktop),
+                        lambda: self.__from_session_files(desktop),
+                        lambda: self.__from_libraries(libraries),
+                        lambda: self.__from_binary(command, marker)]:
+                    self.__version = get_version()
+                    if self.__version:
+                        break
+                break
+
+        return self.__version
+
+    def __from_packages(self, packages: list) -> str | None:
+        # ...
+        if self.__package_database is None:
+            self.__package_database = info.packagedb.PackageDatabase()
+
+        for package in packages:
+            version = self.__package_database.version(package)
+            if version:
+                return version
+        return None
+
+    @staticmethod
+    def __from_gnome_version(desktop: str) -> str | None:
+        # <platform>45</platform><minor>2</minor><micro></micro>
+        if desktop != 'gnome':
+            return None
+
+        try:
+            root = xml.etree.ElementTree.parse(
+                '/usr/share/gnome/gnome-version.xml').getroot()
+        except (OSError, xml.etree.ElementTree.ParseError):
+            return None
+
+        parts = []
+        for tag in ['platform', 'minor', 'micro']:
+            value = root.findtext(tag, '').strip()
+            if not value.isdigit():
+                break
+            parts.append(value)
+        return '.'.join(parts) if parts else None
+
+    @staticmethod
+    def __from_session_files(desktop: str) -> str | None:
+        # Plasma sessions have "X-KDE-PluginInfo-Version=5.27.8"
+        for url in sorted(
+                glob.glob('/usr/share/xsessions/*.desktop') +
+                glob.glob('/usr/share/wayland-sessions/*.desktop')):
+            try:
+                entry = info.desktopentryparse.DesktopFile(url).content.get(
+                    '[Desktop Entry]', {})
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            names = entry.get('DesktopNames', '') + ';' + os.path.basename(url)
+            if desktop not in names.lower():
+                continue
+
+            version = entry.get('X-KDE-PluginInfo-Version', '').strip()
+            if version:
+                return version
+        return None
+
+    @staticmethod
+    def __from_libraries(libraries: list) -> str | None:
+        # "libkworkspace5.so.5.27.8", real file of the soname symlink
+        library_dirs = ['/usr/lib', '/usr/lib64'] + glob.glob(
+            '/usr/lib/*-linux-gnu*')
+        for library in libraries:
+            for library_dir in library_dirs:
+                for url in glob.glob(os.path.join(library_dir, library)):
+                    version = url.rpartition('.so.')[2]
+                    if re.fullmatch(r'\d+\.\d+\.\d+', version):
+                        return version
+        return None
+
+    def __from_binary(self, command: list, marker: str | None) -> str | None:
+        # "plasmashell 5.27.8" or "liblxqt 1.4.0 ..." in the marker line
+        if not shutil.which(command[0]):
+            return None
+
+        try:
+            output = info.childprocess.ChildProcesses.run(
+                command, timeout=self.__timeout).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        for line in output.splitlines():
+            if marker and marker not in line:
+                continue
+            version = re.search(r'\d+(\.\d+)+', line)
+            if version:
+                return version.group()
+        return None
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import glob
+import os
+
+
+class DrmConnectors(object):
+    """Display outputs from '/sys/class/drm'
+
+    Each 'card*-*' directory is a connector of a GPU, like 'card0-HDMI-A-1'.
+    Its 'status' and 'modes' files tell if a monitor is connected and which
+    modes it supports, the preferred one first. This works the same on X11,
+    Wayland and the console, and needs no display server at all.
+    """
+    def __init__(self, drm_url: str = '/sys/class/drm') -> None:
+        """Class constructor
+
+        :param drm_url: Path of the DRM class in sysfs
+        """
+        self.__drm_url = drm_url
+        self.__connectors = None
+
+    @property
+    def connectors(self) -> list:
+        """Every connector, connected or not
+
+        Each item is a dict with: 'card', 'name', 'status', 'enabled',
+        'modes', 'width' and 'height' (of the preferred mode, or 'None').
+
+        Example:
+        >>> DrmConnectors().connectors[0]['name']
+        'eDP-1'
+        """
+        if self.__connectors is None:
+            self.__connectors = self.__get_connectors()
+        return self.__connectors
+
+    @property
+    def connected(self) -> list:
+        """Active outputs: connected, not disabled and with a known mode"""
+        return [
+            x for x in self.connectors
+            if x['status'] == 'connected' and x['enabled'] != 'disabled'
+            and x['width']]
+
+    def __get_connectors(self) -> list:
+        # ...
+        connectors = []
+        for path in sorted(glob.glob(os.path.join(self.__drm_url, 'card*-*'))):
+            card, _sep, name = os.path.basename(path).partition('-')
+            modes = self.__read(path, 'modes').split()
+
+            width, height = None, None
+            if modes:
+                # "1920x1080", or "1920x1080i" for interlaced modes
+                size = modes[0].rstrip('i').split('x')
+                if len(size) == 2 and size[0].isdigit() and size[1].isdigit():
+                    width, height = int(size[0]), int(size[1])
+
+            connectors.append({
+                'card': card,
+                'name': name,
+                'status': self.__read(path, 'status'),
+                'enabled': self.__read(path, 'enabled'),
+                'modes': modes,
+                'width': width,
+                'height': height})
+
+        return connectors
+
+    @staticmethod
+    def __read(path: str, name: str) -> str:
+        # ...
+        try:
+            with open(os.path.join(path, name), 'r') as sysfs_file:
+                return sysfs_file.read().strip()
+        except OSError:
+            return ''
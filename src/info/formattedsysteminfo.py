@@ -1,4 +1,9 @@
 #!/usr/bin/env python3
+import os
+import time
+
+import info.infocache
+import info.probescheduler
 import info.systeminfo
 
 
@@ -9,70 +14,379 @@ class FormattedSystemInfo(object):
     operating system, such as architecture, memory, cpu...
     """
 
-    def __init__(self) -> None:
-        """..."""
+    def __init__(
+            self, max_workers: int = 8, use_cache: bool = True,
+            optional_fields: list = None, timeout: float = None,
+            probe_timeout: float = None, fields: list = None) -> None:
+        """Class constructor
+
+        :param max_workers: Maximum number of probes running at the same time
+        :param use_cache: Keep slow-changing values cached on disk
+        :param optional_fields: Fields to show that are hidden by default,
+            like ['Load', 'Boot time']
+        :param timeout: Seconds to collect everything. 'None' is no limit
+        :param probe_timeout: Seconds each probe may run. 'None' is no
+            limit
+        :param fields: Only these fields, in this order, like ['OS', 'RAM'].
+            Optional fields can be used too. Only the probes they need
+            are run. Default is all the fields
+        """
         self.__sys_info = info.systeminfo.SystemInfo()
         self.__system_fetch_as_dict = None
+        self.__probe_values = {}
+
+        self.__cache = info.infocache.InfoCache() if use_cache else None
+        self.__scheduler = info.probescheduler.ProbeScheduler(
+            max_workers, self.__cache, timeout, probe_timeout)
+        self.__add_probes()
+
+        # Field name: (formatter, probes used by the formatter)
+        self.__fields = {
+            'OS': (self.__format_os_name, [
+                'pretty_name', 'name', 'version', 'codename', 'os_release']),
+            'Kernel': (self.__format_kernel, [
+                'kernel', 'kernel_version', 'kernel_architecture']),
+            'User': (self.__format_user, ['username', 'user_name']),
+            'Hostname': (self.__format_hostname, ['hostname']),
+            'DE': (self.__format_desktop_environment, [
+                'desktop_environment', 'desktop_environment_version']),
+            'WM': (self.__format_window_manager, ['window_manager']),
+            'Display server': (
+                self.__format_display_server, ['display_server']),
+            'Style theme': (
+                self.__format_style_theme, ['kde_style', 'gtk_style']),
+            'Icons theme': (
+                self.__format_icons_theme, ['kde_icons', 'gtk_icons']),
+            'Packages': (self.__format_packages, [
+                'package_manager', 'packages', 'flatpak_packages',
+                'flatpak_details', 'snap_packages']),
+            'Shell': (self.__format_shell, ['shell']),
+            'Uptime': (self.__format_uptime, ['uptime']),
+            'Board': (self.__format_motherboard, [
+                'motherboard', 'motherboard_version']),
+            'Storage': (self.__format_disk, ['storage']),
+            'CPU': (self.__format_cpu, [
+                'cpu', 'cpu_info', 'cpu_architecture']),
+            'GPU': (self.__format_gpu, ['gpu']),
+            'RAM': (self.__format_ram, ['ram', 'ram_used', 'ram_free']),
+            'Swap': (self.__format_swap, ['swap', 'swap_used', 'swap_free']),
+            'Resolution': (self.__format_resolution, ['screen_resolution'])}
+
+        # Values that change while the system runs, see 'refresh()'
+        self.__dynamic_probes = [
+            'ram', 'ram_used', 'ram_free', 'swap', 'swap_used', 'swap_free',
+            'storage', 'uptime', 'load_average']
+
+        # Hidden unless requested in 'optional_fields'
+        self.__optional_fields = {
+            'Load': (self.__format_load_average, ['load_average']),
+            'Boot time': (self.__format_boot_time, ['boot_time'])}
+        for field in optional_fields if optional_fields else []:
+            if field not in self.__optional_fields:
+                raise ValueError(f'Unknown field: {field}')
+            self.__fields[field] = self.__optional_fields[field]
+
+        if fields is not None:
+            available = {**self.__fields, **self.__optional_fields}
+            for field in fields:
+                if field not in available:
+                    raise ValueError(f'Unknown field: {field}')
+            self.__fields = {x: available[x] for x in fields}
+
+    @property
+    def optional_fields(self) -> list:
+        """Names of the fields that are hidden by default"""
+        return list(self.__optional_fields)
 
     @property
     def raw_info(self) -> info.systeminfo.SystemInfo:
         """..."""
         return self.__sys_info
 
+    @property
+    def scheduler(self) -> info.probescheduler.ProbeScheduler:
+        """The scheduler that runs the 'raw_info' probes"""
+        return self.__scheduler
+
+    @property
+    def diagnostics(self) -> list:
+        """A line for each probe that missed its deadline or failed
+
+        Like: "probe 'packages' timed out after 3.0s, killed 1 process,
+        showing the cached value" or "probe 'cpu_info' failed
+        (ValueError: bad value), omitted"
+        """
+        lines = []
+        for name, timed_out in self.__scheduler.timed_out.items():
+            line = f"probe '{name}' timed out"
+            if timed_out['elapsed'] is not None:
+                line += ' after {:.1f}s'.format(timed_out['elapsed'])
+            if timed_out['killed']:
+                line += ', killed {} process{}'.format(
+                    timed_out['killed'],
+                    'es' if timed_out['killed'] > 1 else '')
+            line += (
+                ', showing the cached value' if timed_out['stale']
+                else ', omitted')
+            lines.append(line)
+
+        for name, failed in self.__scheduler.failed.items():
+            lines.append("probe '{}' failed ({}: {}), {}".format(
+                name, type(failed['error']).__name__, failed['error'],
+                'showing the cached value' if failed['stale'] else 'omitted'))
+        return lines
+
+    @property
+    def fields(self) -> list:
+        """Names of the fields, in display order"""
+        return list(self.__fields)
+
+    @property
+    def probes(self) -> list:
+        """Names of the 'raw_info' values that 'value()' can get"""
+        return list(self.__scheduler.probes)
+
     @property
     def info_fetch_as_dict(self) -> dict:
-        """..."""
-        if not self.__system_fetch_as_dict:
-            self.__system_fetch_as_dict = {
-                'OS': self.__format_os_name(),
-                'Kernel': self.__format_kernel(),
-                'User': self.__format_user(),
-                'Hostname': self.__sys_info.hostname,
-                'DE': self.__format_desktop_environment(),
-                'WM': self.__format_window_manager(),
-                'Display server': self.__format_display_server(),
-                'Style theme': self.__format_style_theme(),
-                'Icons theme': self.__format_icons_theme(),
-                'Packages': self.__format_packages(),
-                'Shell': self.__format_shell(),
-                'Uptime': self.__format_uptime(),
-                'Board': self.__format_motherboard(),
-                'Storage': self.__format_disk(),
-                'CPU': self.__format_cpu(),
-                'GPU': self.__format_gpu(),
-                'RAM': self.__format_ram(),
-                'Swap': self.__format_swap(),
-                'Resolution': self.__format_resolution()}
+        """Formatted value of each field
 
+        Fields whose probes missed their deadline show the last cached
+        value, marked with '(stale)', or are 'None' without one.
+        """
+        if self.__system_fetch_as_dict is None:
+            self.collect()
         return self.__system_fetch_as_dict
 
+    def collect(self, callback: callable = None) -> dict:
+        """Collect and format all the fields, like 'info_fetch_as_dict'
+
+        :param callback: Called with the name and the formatted value of
+            each field as soon as all its probes are done, while the slower
+            ones are still running
+        """
+        probes = []
+        for _formatter, field_probes in self.__fields.values():
+            probes += [x for x in field_probes if x not in probes]
+
+        self.__probe_values = {}
+        fetch_as_dict = {}
+
+        def probe_done(name: str, value) -> None:
+            self.__probe_values[name] = value
+            for field, (_formatter, field_probes) in self.__fields.items():
+                if field not in fetch_as_dict and all(
+                        x in self.__probe_values for x in field_probes):
+                    fetch_as_dict[field] = self.__format_field(field)
+                    if callback is not None:
+                        callback(field, fetch_as_dict[field])
+
+        self.__probe_values = self.__scheduler.run(probes, probe_done)
+
+        # Fields left without a value by a probe that timed out
+        for field in self.__fields:
+            if field not in fetch_as_dict:
+                fetch_as_dict[field] = self.__format_field(field)
+                if callback is not None:
+                    callback(field, fetch_as_dict[field])
+
+        self.__system_fetch_as_dict = {
+            x: fetch_as_dict[x] for x in self.__fields}
+        return self.__system_fetch_as_dict
+
+    def value(self, name: str):
+        """A single 'raw_info' value, like 'ram_free'
+
+        Only its probe and the probes it depends on are run, with the
+        same cache and deadlines as the fields.
+
+        :param name: Probe name, one of 'probes'
+        :raise ValueError: If the name is not a probe
+        :return: The value, or 'None' if its probe timed out without a
+            cached value
+        """
+        if name not in self.__scheduler.probes:
+            raise ValueError(f'Unknown value: {name}')
+
+        self.__probe_values.update(self.__scheduler.run([name]))
+        return self.__value(name)
+
+    def refresh(self, callback: callable = None) -> dict:
+        """Collect the dynamic fields again, like RAM and uptime
+
+        The other fields keep their values. A new 'raw_info' is used, so
+        nothing memoized by the old one is reused.
+
+        :param callback: Called with the name and the formatted value of
+            each field that changed
+        :return: Dict with the fields that changed
+        """
+        if self.__system_fetch_as_dict is None:
+            self.collect()
+
+        self.__sys_info = info.systeminfo.SystemInfo()
+        self.__probe_values.update(self.__scheduler.run([
+            x for x in self.__dynamic_probes
+            if any(x in y for _x, y in self.__fields.values())]))
+
+        changed = {}
+        for field, (_formatter, field_probes) in self.__fields.items():
+            if not any(x in self.__dynamic_probes for x in field_probes):
+                continue
+
+            value = self.__format_field(field)
+            if value != self.__system_fetch_as_dict[field]:
+                self.__system_fetch_as_dict[field] = value
+                changed[field] = value
+                if callback is not None:
+                    callback(field, value)
+
+        return changed
+
+    def __format_field(self, field: str) -> str | None:
+        # Stale values are marked, omitted values are 'None'
+        formatter, field_probes = self.__fields[field]
+        if any(x in self.__scheduler.omitted for x in field_probes):
+            return None
+
+        value = formatter()
+        if value and any(x in self.__scheduler.stale for x in field_probes):
+            value = f'{value} (stale)'
+        return value
+
+    def __add_probes(self) -> None:
+        # Probes are 'raw_info' properties. A probe that reads another
+        # property internally, or shares a lazily created object with
+        # another probe, depends on it, so that the value is already there
+        # when it runs
+        depends = {
+            'hostname': ['name'],
+            'cpu': ['cpu_info'],
+            'cpu_architecture': ['cpu_info'],
+            'flatpak_details': ['flatpak_packages'],
+            'desktop_environment_version': ['desktop_environment'],
+            'gtk_style': ['desktop_environment'],
+            'gtk_icons': ['desktop_environment', 'gtk_style'],
+            'packages': ['package_manager'],
+            'pretty_name': ['os_release'],
+            'name': ['os_release'],
+            'version': ['os_release'],
+            'codename': ['os_release'],
+            'ram_used': ['ram'],
+            'ram_free': ['ram'],
+            'swap': ['ram'],
+            'swap_used': ['ram'],
+            'swap_free': ['ram']}
+
+        package_databases = [
+            '/var/lib/dpkg/status',
+            '/var/lib/rpm/rpmdb.sqlite',
+            '/var/lib/rpm/rpmdb.sqlite-wal',
+            '/var/lib/rpm/Packages',
+            '/usr/lib/sysimage/rpm/rpmdb.sqlite',
+            '/usr/lib/sysimage/rpm/rpmdb.sqlite-wal',
+            '/var/lib/pacman/local',
+            '/var/lib/eopkg/package']
+        user_flatpak = os.path.join(
+            os.path.expanduser('~'), '.local', 'share', 'flatpak')
+        flatpak_dirs = [
+            '/var/lib/flatpak/app', '/var/lib/flatpak/runtime',
+            os.path.join(user_flatpak, 'app'),
+            os.path.join(user_flatpak, 'runtime')]
+        dmi = '/sys/devices/virtual/dmi/id'
+
+        # Slow-changing values, cached on disk: (paths, boot, extra)
+        fingerprints = {
+            'kernel_architecture': (None, True, None),
+            'cpu': (None, True, None),
+            'cpu_info': (None, True, None),
+            'cpu_architecture': (None, True, None),
+            'gpu': (None, True, None),
+            'motherboard': ([
+                f'{dmi}/product_name', f'{dmi}/product_version'], True, None),
+            'motherboard_version': ([
+                f'{dmi}/product_name', f'{dmi}/product_version'], True, None),
+            'desktop_environment_version': (
+                package_databases, False,
+                [os.environ.get('XDG_CURRENT_DESKTOP')]),
+            'package_manager': (package_databases, False, None),
+            'packages': (package_databases, False, None),
+            'flatpak_packages': (flatpak_dirs, False, None),
+            'flatpak_details': (flatpak_dirs, False, None),
+            'snap_packages': ([
+                '/var/lib/snapd/snaps', '/snap', '/var/lib/snapd/snap'],
+                False, None)}
+
+        for name in [
+                'os_release', 'pretty_name', 'name', 'version', 'codename',
+                'user_name', 'username', 'hostname', 'kernel',
+                'kernel_version', 'kernel_architecture', 'motherboard',
+                'motherboard_version', 'storage', 'cpu', 'cpu_info',
+                'cpu_architecture', 'gpu', 'ram', 'ram_used', 'ram_free',
+                'swap', 'swap_used', 'swap_free', 'screen_resolution',
+                'uptime', 'load_average', 'boot_time', 'shell',
+                'desktop_environment', 'desktop_environment_version',
+                'window_manager', 'display_server', 'package_manager',
+                'packages',
+                'flatpak_packages', 'flatpak_details', 'snap_packages',
+                'kde_style', 'kde_icons',
+                'gtk_style', 'gtk_icons']:
+            self.__scheduler.add_probe(
+                name, self.__probe_function(name), depends.get(name),
+                self.__fingerprint_function(*fingerprints[name])
+                if name in fingerprints else None)
+
+    def __probe_function(self, name: str) -> callable:
+        # Bind the probe name now, not when the lambda runs
+        return lambda: getattr(self.__sys_info, name)
+
+    def __fingerprint_function(
+            self, paths: list, boot: bool, extra: list) -> callable:
+        # ...
+        if self.__cache is None:
+            return None
+        return lambda: self.__cache.fingerprint(paths, boot, extra)
+
+    def __value(self, name: str):
+        # Value already collected by the scheduler, or collect it now.
+        # Never again for a probe that missed its deadline
+        if name in self.__probe_values:
+            return self.__probe_values[name]
+        if name in self.__scheduler.omitted:
+            return None
+        return getattr(self.__sys_info, name)
+
     def __format_user(self) -> str | None:
         # ...
-        user = self.__sys_info.username
-        username = self.__sys_info.user_name
+        user = self.__value('username')
+        username = self.__value('user_name')
         if user and username:
             return f'{user} [{username}]'
         if user:
             return f'{user}'
         return None
 
+    def __format_hostname(self) -> str | None:
+        # ...
+        hostname = self.__value('hostname')
+        return hostname if hostname else None
+
     def __format_os_name(self) -> str | None:
         # ...
-        os_pretty_name_ = self.__sys_info.pretty_name
+        os_pretty_name_ = self.__value('pretty_name')
         name = (
             os_pretty_name_ if os_pretty_name_ else
-            self.__sys_info.name + ' ' + self.__sys_info.version)
+            self.__value('name') + ' ' + self.__value('version'))
 
         id_like = ''
-        if 'ID_LIKE' in self.__sys_info.os_release:  # "Ubuntu debian"
-            id_like = self.__sys_info.os_release['ID_LIKE'] + ' '
+        if 'ID_LIKE' in self.__value('os_release'):  # "Ubuntu debian"
+            id_like = self.__value('os_release')['ID_LIKE'] + ' '
 
         version_id = ''
-        if 'VERSION_ID' in self.__sys_info.os_release:   # "22.04"
-            version_id = self.__sys_info.os_release['VERSION_ID'] + ' '
+        if 'VERSION_ID' in self.__value('os_release'):   # "22.04"
+            version_id = self.__value('os_release')['VERSION_ID'] + ' '
 
-        codename = (f'({self.__sys_info.codename})'
-                    if self.__sys_info.codename else '')
+        codename = self.__value('codename')
+        codename = f'({codename})' if codename else ''
 
         os_name = f'{name} | {id_like.title()}{version_id}{codename.title()}'
 
@@ -83,11 +397,11 @@ class FormattedSystemInfo(object):
 
     def __format_kernel(self) -> str | None:
         # ...
-        kernel = self.__sys_info.kernel
+        kernel = self.__value('kernel')
         if kernel:
-            kernel = f'{kernel} {self.__sys_info.kernel_version}'
+            kernel = f"{kernel} {self.__value('kernel_version')}"
 
-        architecture = self.__sys_info.kernel_architecture
+        architecture = self.__value('kernel_architecture')
         if kernel and architecture:
             kernel = f'{kernel} [{architecture} bits]'
 
@@ -95,8 +409,8 @@ class FormattedSystemInfo(object):
 
     def __format_motherboard(self) -> str | None:
         # ...
-        motherboard = self.__sys_info.motherboard
-        motherboard_version = self.__sys_info.motherboard_version
+        motherboard = self.__value('motherboard')
+        motherboard_version = self.__value('motherboard_version')
 
         if motherboard and motherboard_version:
             return '{} - {}'.format(motherboard, motherboard_version)
@@ -108,38 +422,38 @@ class FormattedSystemInfo(object):
             return None
 
     def __format_disk(self) -> str | None:
-        """
-        self.__root_disk_size = None
-        self.__root_disk_used = None
-        self.__root_disk_free = None
-        self.__root_disk_used_in_percent = None
+        # '"/" 252Gi, 18Gi used (19%), 80Gi free; "/home" ...'
+        disks = []
+        for mount in self.__value('storage'):
+            if mount['timed_out'] or not mount['size']:
+                continue
 
-        self.__root_disk_mount_point = None
-        self.__root_disk_path = self.root_disk_path
-        """
-        output = ''
+            disks.append('"{}" {}, {} used ({}%), {} free'.format(
+                mount['mount_point'], self.__format_bytes(mount['size']),
+                self.__format_bytes(mount['used']), mount['used_percent'],
+                self.__format_bytes(mount['available'])))
 
-        disk_mount_point = self.__sys_info.root_disk_mount_point
-        disk_path = self.__sys_info.root_disk_path.split("/")[2]
-        disk_size = self.__sys_info.root_disk_size
-        if disk_mount_point and disk_path and disk_size:
-            output += f'"{disk_mount_point}" {disk_size}'
+        return '; '.join(disks) if disks else None
 
-        disk_used = self.__sys_info.root_disk_used
-        disk_used_in_percent = self.__sys_info.root_disk_used_in_percent
-        if disk_used and disk_size:
-            output += f', {disk_used} used ({disk_used_in_percent})'
+    def __format_cpu(self) -> str | None:
+        # 'Intel Core i5-7200U (2 cores / 4 threads) @ 3.10 GHz [x86_64]'
+        cpu = self.__value('cpu')
+        cpu_info = self.__value('cpu_info')
+        architecture = self.__value('cpu_architecture')
 
-        disk_free = self.__sys_info.root_disk_free
-        if disk_free:
-            output += f', {disk_used} free'
+        if cpu and cpu_info['max_frequency']:
+            cpu = cpu.partition(' @ ')[0].strip()  # Base clock in the name
 
-        return output
+        if cpu and cpu_info['cores'] and cpu_info['threads']:
+            sockets = ''
+            if cpu_info['sockets'] and cpu_info['sockets'] > 1:
+                sockets = '{} sockets, '.format(cpu_info['sockets'])
+            cpu = '{} ({}{} cores / {} threads)'.format(
+                cpu, sockets, cpu_info['cores'], cpu_info['threads'])
 
-    def __format_cpu(self) -> str | None:
-        # ...
-        cpu = self.__sys_info.cpu
-        architecture = self.__sys_info.cpu_architecture
+        if cpu and cpu_info['max_frequency']:
+            cpu = '{} @ {:.2f} GHz'.format(
+                cpu, cpu_info['max_frequency'] / 1000000)
 
         if cpu and architecture:
             cpu = f'{cpu} [{architecture}]'
@@ -148,49 +462,98 @@ class FormattedSystemInfo(object):
 
     def __format_gpu(self) -> str | None:
         # ...
-        gpu = self.__sys_info.gpu
+        gpu = self.__value('gpu')
         return gpu if gpu else None
 
     def __format_ram(self) -> str | None:
         # ...
-        ram = self.__sys_info.ram
-        used = self.__sys_info.ram_used
-        free = self.__sys_info.ram_free
+        ram = self.__value('ram')
+        used = self.__value('ram_used')
+        free = self.__value('ram_free')
         return (
-            '{}, {} used, {} free'.format(ram, used, free)
+            '{}, {} used, {} free'.format(
+                self.__format_bytes(ram), self.__format_bytes(used),
+                self.__format_bytes(free))
             if ram else None)
 
     def __format_swap(self) -> str | None:
         # ...
-        swap = self.__sys_info.swap
-        used = self.__sys_info.swap_used
-        free = self.__sys_info.swap_free
+        swap = self.__value('swap')
+        used = self.__value('swap_used')
+        free = self.__value('swap_free')
         return (
-            '{}, {} used, {} free'.format(swap, used, free)
-            if swap else None)
+            '{}, {} used, {} free'.format(
+                self.__format_bytes(swap), self.__format_bytes(used),
+                self.__format_bytes(free))
+            if swap is not None else None)
+
+    @staticmethod
+    def __format_bytes(num: int | None) -> str:
+        # Like 'free -h': 0B, 433Mi, 5.9Gi, 15Gi
+        if num is None:
+            return '?'
+
+        value = float(num)
+        for unit in ['B', 'Ki', 'Mi', 'Gi', 'Ti']:
+            if value < 1024 or unit == 'Ti':
+                break
+            value /= 1024
+
+        if unit == 'B':
+            return f'{num}B'
+        if value < 10:
+            return f'{value:.1f}{unit}'
+        return f'{round(value)}{unit}'
 
     def __format_resolution(self) -> str | None:
         # ...
-        resolution = self.__sys_info.screen_resolution
+        resolution = self.__value('screen_resolution')
         return resolution if resolution else None
 
     def __format_uptime(self) -> str | None:
-        # ...
-        uptime = self.__sys_info.uptime
-        return uptime if uptime else None
+        # '2 days, 3 hours, 5 minutes', like 'uptime -p'
+        uptime = self.__value('uptime')
+        if uptime is None:
+            return None
+
+        minutes = uptime // 60
+        parts = []
+        for unit, unit_minutes in [
+                ('week', 10080), ('day', 1440), ('hour', 60), ('minute', 1)]:
+            count, minutes = divmod(minutes, unit_minutes)
+            if count:
+                parts.append(f'{count} {unit}' + ('s' if count > 1 else ''))
+
+        return ', '.join(parts) if parts else '0 minutes'
+
+    def __format_load_average(self) -> str | None:
+        # '0.52, 0.58, 0.59'
+        load_average = self.__value('load_average')
+        if not load_average:
+            return None
+        return ', '.join(f'{x:.2f}' for x in load_average)
+
+    def __format_boot_time(self) -> str | None:
+        # '2023-10-18 09:12', local time
+        boot_time = self.__value('boot_time')
+        if boot_time is None:
+            return None
+        return time.strftime('%Y-%m-%d %H:%M', time.localtime(boot_time))
 
     def __format_shell(self) -> str | None:
         # ...
-        shell = self.__sys_info.shell
+        shell = self.__value('shell')
+        if not shell:
+            return None
 
         if 'bash' in shell.lower():
             shell = 'Bash'
-        return shell if shell else None
+        return shell
 
     def __format_desktop_environment(self) -> str | None:
         # ...
-        _de = self.__sys_info.desktop_environment
-        _de_version = self.__sys_info.desktop_environment_version
+        _de = self.__value('desktop_environment')
+        _de_version = self.__value('desktop_environment_version')
 
         de = _de if _de else ''
         de_version = _de_version if _de_version else ''
@@ -201,23 +564,23 @@ class FormattedSystemInfo(object):
 
     def __format_window_manager(self) -> str | None:
         # ...
-        wm = self.__sys_info.window_manager
+        wm = self.__value('window_manager')
         return wm if wm else None
 
     def __format_display_server(self) -> str | None:
         # ...
-        ds = self.__sys_info.display_server
+        ds = self.__value('display_server')
         return ds if ds else None
 
     def __format_style_theme(self) -> str | None:
         # ...
         style = []
 
-        qt_style = self.__sys_info.kde_style
+        qt_style = self.__value('kde_style')
         if qt_style:
             style.append(f'Qt={qt_style}')
 
-        gtk_style = self.__sys_info.gtk_style
+        gtk_style = self.__value('gtk_style')
         if gtk_style:
             style.append(f'Gtk={gtk_style}')
 
@@ -227,66 +590,47 @@ class FormattedSystemInfo(object):
         # ...
         icons = []
 
-        qt_icons = self.__sys_info.kde_icons
+        qt_icons = self.__value('kde_icons')
         if qt_icons:
             icons.append(f'Qt={qt_icons}')
 
-        gtk_icons = self.__sys_info.gtk_icons
+        gtk_icons = self.__value('gtk_icons')
         if gtk_icons:
             icons.append(f'Gtk={gtk_icons}')
 
         return ', '.join(icons)
 
     def __format_packages(self) -> str | None:
-        # ...
-        native_packages_name = self.__sys_info.package_manager
+        # "812 dpkg=754, flatpak=52 (12 apps, 40 runtimes), snap=6"
+        native_packages_name = self.__value('package_manager')
         if not native_packages_name:
             return None
 
-        str_num_native_packages = self.__sys_info.packages
+        str_num_native_packages = self.__value('packages')
         if not str_num_native_packages:
             return None
 
-        total_packages = str_num_native_packages
-        packages = '{} {}'.format(total_packages, native_packages_name)
-
-        # If Flatpak or snap
-        str_num_flatpak_packages = self.__sys_info.flatpak_packages
-        str_num_snap_packages = self.__sys_info.snap_packages
-
-        if str_num_flatpak_packages or str_num_snap_packages:
-            # Only Flatpak
-            if str_num_flatpak_packages and not str_num_snap_packages:
-                total_packages = (str(
-                    int(str_num_flatpak_packages)
-                    + int(str_num_native_packages)))
-
-                packages = '{} {}={}, flatpak={}'.format(
-                    total_packages, native_packages_name,
-                    str_num_native_packages, str_num_flatpak_packages)
-
-            # Only Snap
-            elif not str_num_flatpak_packages and str_num_snap_packages:
-                total_packages = (str(
-                    int(str_num_snap_packages) + int(str_num_native_packages)))
-
-                packages = '{} {}={}, snap={}'.format(
-                    total_packages, native_packages_name,
-                    str_num_native_packages, str_num_snap_packages)
-
-            # Flatpak and Snap
-            else:
-                total_packages = str(
-                    int(str_num_flatpak_packages)
-                    + int(str_num_snap_packages)
-                    + int(str_num_native_packages))
-
-                packages = '{} {}={}, flatpak={}, snap={}'.format(
-                    total_packages, native_packages_name,
-                    str_num_native_packages, str_num_flatpak_packages,
-                    str_num_snap_packages)
-
-        return packages
+        total_packages = int(str_num_native_packages)
+        packages = [f'{native_packages_name}={str_num_native_packages}']
+
+        str_num_flatpak_packages = self.__value('flatpak_packages')
+        if str_num_flatpak_packages:
+            total_packages += int(str_num_flatpak_packages)
+            details = self.__value('flatpak_details')
+            packages.append('flatpak={} ({} apps, {} runtimes)'.format(
+                str_num_flatpak_packages,
+                details['system_apps'] + details['user_apps'],
+                details['system_runtimes'] + details['user_runtimes']))
+
+        str_num_snap_packages = self.__value('snap_packages')
+        if str_num_snap_packages:
+            total_packages += int(str_num_snap_packages)
+            packages.append(f'snap={str_num_snap_packages}')
+
+        if len(packages) == 1:
+            return f'{str_num_native_packages} {native_packages_name}'
+
+        return f'{total_packages} ' + ', '.join(packages)
 
 
 if __name__ == '__main__':
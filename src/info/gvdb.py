@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# Reference:
+#   gitlab.gnome.org/GNOME/gvdb/-/blob/main/gvdb/gvdb-format.h
+#   gitlab.gnome.org/GNOME/gvdb/-/blob/main/gvdb/gvdb-reader.c
+import mmap
+import struct
+
+
+class GvdbFile(object):
+    """GVariant database file reader
+
+    GVDB is the on-disk hash table used by dconf, like the user database in
+    '~/.config/dconf/user'. The file is memory-mapped once and each lookup
+    reads only the hash bucket of the key, without D-Bus or 'gsettings'.
+    Only simple value types are decoded: 's', 'b', 'i', 'u' and 'd', and
+    only little-endian files are read, byteswapped ones are ignored.
+    """
+    def __init__(self, url: str) -> None:
+        """Class constructor
+
+        :param url: Path of the database, like '~/.config/dconf/user'
+        """
+        self.__url = url
+        self.__data = None
+        self.__root = None
+        self.__is_loaded = False
+
+    @property
+    def url(self) -> str:
+        """..."""
+        return self.__url
+
+    def get(self, key: str):
+        """The value of a key
+
+        :param key: Full key path, like '/org/gnome/desktop/sound/theme-name'
+        :return: The value, or 'None' if the key is not in the database or
+            its type is not supported
+        """
+        if not self.__load():
+            return None
+
+        item = self.__lookup(key.encode(), self.__root)
+        if item is None or item[4] != b'v'[0]:
+            return None
+
+        value_type, value = self.__split_variant(item[5], item[6])
+        if value_type is None:
+            return None
+        return self.__decode_value(value_type, value)
+
+    def schema_default(self, schema_id: str, key: str):
+        """The default value of a key of compiled GSettings schemas
+
+        For files like '/usr/share/glib-2.0/schemas/gschemas.compiled',
+        where the overrides of the distribution, like a Yaru theme, are
+        already applied to the defaults.
+
+        :param schema_id: Like 'org.gnome.desktop.interface'
+        :param key: Like 'gtk-theme'
+        :return: The value, or 'None' if the key is not in the schema or
+            its type is not supported
+        """
+        if not self.__load():
+            return None
+
+        # Each schema is a nested hash table. Its keys are tuples with the
+        # default value first, then the choices, range and so on
+        item = self.__lookup(schema_id.encode(), self.__root)
+        if item is None or item[4] != b'H'[0]:
+            return None
+        table = self.__load_table(item[5], item[6])
+        if table is None:
+            return None
+
+        item = self.__lookup(key.encode(), table)
+        if item is None or item[4] != b'v'[0]:
+            return None
+        value_type, value = self.__split_variant(item[5], item[6])
+        if value_type is None or not value_type.startswith(b'('):
+            return None
+
+        child_type = value_type[1:2]
+        if value_type == b'(' + child_type + b')':
+            return self.__decode_value(child_type, value)
+        if child_type == b's':
+            # The end of a string that is not the last child is the last
+            # framing offset, whose size depends on the size of the tuple
+            offset_size = 1 if len(value) < 0x100 else (
+                2 if len(value) < 0x10000 else 4)
+            if len(value) < offset_size:
+                return None
+            end = int.from_bytes(value[-offset_size:], 'little')
+            return self.__decode_value(child_type, value[:end])
+
+        size = {b'b': 1, b'i': 4, b'u': 4, b'd': 8}.get(child_type, 0)
+        return self.__decode_value(child_type, value[:size])
+
+    def __load(self) -> bool:
+        # Header: signature[2], version, options, root pointer (start, end)
+        if self.__is_loaded:
+            return self.__data is not None
+        self.__is_loaded = True
+
+        try:
+            with open(self.__url, 'rb') as gvdb_file:
+                self.__data = mmap.mmap(
+                    gvdb_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Missing or empty file
+            return False
+
+        # 'raVGtnai' is a byteswapped file, written for a big-endian host
+        data = self.__data
+        if len(data) < 24 or data[:8] != b'GVariant':
+            self.__data = None
+            return False
+
+        self.__root = self.__load_table(*struct.unpack_from('<II', data, 16))
+        if self.__root is None:
+            self.__data = None
+            return False
+        return True
+
+    def __load_table(self, start: int, end: int) -> tuple | None:
+        # Hash table: bloom filter size, number of buckets, bloom filter,
+        # buckets and then the items. As (buckets, items start, items)
+        if end > len(self.__data) or end - start < 8:
+            return None
+
+        n_bloom_words, n_buckets = struct.unpack_from(
+            '<II', self.__data, start)
+        n_bloom_words &= (1 << 27) - 1
+        buckets_start = start + 8 + n_bloom_words * 4
+        items_start = buckets_start + n_buckets * 4
+        if items_start > end:
+            return None
+
+        buckets = struct.unpack_from(
+            f'<{n_buckets}I', self.__data, buckets_start)
+        return buckets, items_start, (end - items_start) // 24
+
+    def __item(self, itemno: int, table: tuple) -> tuple:
+        # hash, parent, key start, key size, type, unused, value start, end
+        hash_value, parent, key_start, key_size, item_type, _unused, start, \
+            end = struct.unpack_from(
+                '<IIIHBBII', self.__data, table[1] + itemno * 24)
+        return hash_value, parent, key_start, key_size, item_type, start, end
+
+    def __lookup(self, key: bytes, table: tuple) -> tuple | None:
+        # ...
+        buckets, _items_start, n_items = table
+        if not buckets or not n_items:
+            return None
+
+        hash_value = 5381
+        for byte in key:
+            signed_byte = byte - 256 if byte > 127 else byte
+            hash_value = (hash_value * 33 + signed_byte) & 0xffffffff
+
+        bucket = hash_value % len(buckets)
+        itemno = buckets[bucket]
+        lastno = n_items
+        if bucket < len(buckets) - 1:
+            lastno = min(buckets[bucket + 1], n_items)
+
+        while itemno < lastno:
+            item = self.__item(itemno, table)
+            if item[0] == hash_value and self.__check_name(item, key, table):
+                return item
+            itemno += 1
+
+        return None
+
+    def __check_name(self, item: tuple, key: bytes, table: tuple) -> bool:
+        # Items only keep the last part of the key, the rest is in parents
+        for _level in range(len(key) + 1):
+            _hash, parent, key_start, key_size, _type, _start, _end = item
+            if key_size > len(key):
+                return False
+
+            if self.__data[key_start:key_start + key_size] != key[
+                    len(key) - key_size:]:
+                return False
+            key = key[:len(key) - key_size]
+
+            if not key and parent == 0xffffffff:
+                return True
+            if parent >= table[2] or key_size == 0:
+                return False
+            item = self.__item(parent, table)
+
+        return False
+
+    def __split_variant(self, start: int, end: int) -> tuple:
+        # A 'v' variant is the child value, a zero byte and the child type
+        if not 0 <= start <= end <= len(self.__data):
+            return None, None
+
+        data = self.__data[start:end]
+        separator = data.rfind(b'\0')
+        if separator < 0:
+            return None, None
+        return data[separator + 1:], data[:separator]
+
+    @staticmethod
+    def __decode_value(value_type: bytes, value: bytes):
+        # ...
+        if value_type == b's' and value.endswith(b'\0'):
+            return value[:-1].decode(errors='replace')
+        if value_type == b'b' and len(value) == 1:
+            return value != b'\0'
+        if value_type == b'i' and len(value) == 4:
+            return struct.unpack('<i', value)[0]
+        if value_type == b'u' and len(value) == 4:
+            return struct.unpack('<I', value)[0]
+        if value_type == b'd' and len(value) == 8:
+            return struct.unpack('<d', value)[0]
+
+        return None
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+import os
+import pwd
+
+
+class Identity(object):
+    """User, host and session identity
+
+    Reads everything in-process from the environment, the password database
+    and the kernel, so no shell or child process is needed.
+    Values are raw, without any formatting.
+    """
+    def __init__(self) -> None:
+        """Class constructor"""
+        self.__passwd = None
+        self.__uname = None
+
+    @property
+    def passwd(self) -> pwd.struct_passwd | None:
+        """Password database entry of the current user"""
+        if self.__passwd is None:
+            try:
+                self.__passwd = pwd.getpwuid(os.getuid())
+            except KeyError:
+                return None
+        return self.__passwd
+
+    @property
+    def uname(self) -> os.uname_result:
+        """..."""
+        if self.__uname is None:
+            self.__uname = os.uname()
+        return self.__uname
+
+    @property
+    def user_name(self) -> str:
+        """Full name from the GECOS field, like 'Jane Doe'"""
+        if not self.passwd:
+            return ''
+        return self.passwd.pw_gecos.split(',')[0]
+
+    @property
+    def username(self) -> str:
+        """Login name, like 'jane'"""
+        username = os.environ.get('USER', '')
+        if not username and self.passwd:
+            username = self.passwd.pw_name
+        return username
+
+    @property
+    def hostname(self) -> str:
+        """Static host name from '/etc/hostname', or the kernel node name"""
+        try:
+            with open('/etc/hostname', 'r') as hostname_file:
+                hostname = hostname_file.read().strip()
+        except OSError:
+            hostname = ''
+
+        if not hostname:
+            hostname = os.environ.get('HOSTNAME', '')
+        if not hostname:
+            hostname = self.uname.nodename
+        return hostname
+
+    @property
+    def short_hostname(self) -> str:
+        """Host name without the domain, like '${HOSTNAME%%.*}'"""
+        hostname = os.environ.get('HOSTNAME', '')
+        if not hostname:
+            hostname = self.uname.nodename
+        return hostname.split('.')[0]
+
+    @property
+    def shell(self) -> str:
+        """Shell executable name, like 'bash'"""
+        shell = os.environ.get('SHELL', '')
+        if not shell and self.passwd:
+            shell = self.passwd.pw_shell
+        return os.path.basename(shell.rstrip('/'))
+
+    @property
+    def session_type(self) -> str:
+        """$XDG_SESSION_TYPE, like 'x11' or 'wayland'"""
+        return os.environ.get('XDG_SESSION_TYPE', '')
+
+    @property
+    def current_desktop(self) -> str:
+        """$XDG_CURRENT_DESKTOP, like 'KDE' or 'ubuntu:GNOME'"""
+        return os.environ.get('XDG_CURRENT_DESKTOP', '')
+
+    @property
+    def kernel_name(self) -> str:
+        """Kernel name, like 'Linux'"""
+        return self.uname.sysname
+
+    @property
+    def kernel_release(self) -> str:
+        """Kernel release, like '6.5.0-14-generic'"""
+        return self.uname.release
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+import json
+import os
+import threading
+
+
+class InfoCache(object):
+    """Persistent cache for slow-changing information
+
+    Values are stored per user, in '$XDG_CACHE_HOME/infofetch/', together
+    with a fingerprint. A value is only valid while its fingerprint stays
+    the same, so the fingerprints are built from cheap checks, like the
+    modification time of a package database or the current boot id.
+    """
+    def __init__(self, url: str = None) -> None:
+        """Class constructor
+
+        :param url: Cache file path. Default is
+            '$XDG_CACHE_HOME/infofetch/sysinfo.json'
+        """
+        self.__url = url if url else os.path.join(
+            self.cache_dir(), 'sysinfo.json')
+        self.__content = None
+        self.__modified = False
+        self.__stats = {}
+        self.__boot_id = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def cache_dir() -> str:
+        """The infofetch cache directory
+
+        :return: String like '/home/user/.cache/infofetch'
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME')
+        if not cache_home:
+            cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(cache_home, 'infofetch')
+
+    @property
+    def url(self) -> str:
+        """..."""
+        return self.__url
+
+    @property
+    def content(self) -> dict:
+        """Cache contents as a dictionary
+
+        Each key maps to a dict like: {'fingerprint': '...', 'value': ...}
+        """
+        if self.__content is None:
+            self.__load()
+        return self.__content
+
+    def is_valid(self, key: str, fingerprint: str) -> bool:
+        """If the key is cached with this same fingerprint
+
+        :param key: Value name, like 'gpu'
+        :param fingerprint: Current fingerprint of the value
+        """
+        with self.__lock:
+            return (key in self.content and
+                    self.content[key]['fingerprint'] == fingerprint)
+
+    def get(self, key: str):
+        """Cached value
+
+        Use 'is_valid()' first to know if the value can be used.
+
+        :param key: Value name, like 'gpu'
+        :return: The cached value, or 'None'
+        """
+        with self.__lock:
+            return self.content[key]['value'] if key in self.content else None
+
+    def set(self, key: str, fingerprint: str, value) -> None:
+        """Update a cached value
+
+        Nothing is written to disk until 'save()' is called.
+
+        :param key: Value name, like 'gpu'
+        :param fingerprint: Current fingerprint of the value
+        :param value: Any value that can be saved as JSON. Other values
+            are not cached
+        """
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            return
+
+        with self.__lock:
+            self.content[key] = {'fingerprint': fingerprint, 'value': value}
+            self.__modified = True
+
+    def save(self) -> None:
+        """Write the cache to disk, if something has changed"""
+        with self.__lock:
+            if not self.__modified:
+                return
+
+            temp_url = f'{self.__url}.{os.getpid()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.__url), exist_ok=True)
+                with open(temp_url, 'w') as cache_file:
+                    json.dump(self.__content, cache_file)
+                os.replace(temp_url, self.__url)
+            except (OSError, TypeError, ValueError):
+                # Not being able to cache is not an error
+                try:
+                    os.unlink(temp_url)
+                except OSError:
+                    pass
+                return
+
+            self.__modified = False
+
+    def fingerprint(
+            self, paths: list = None, boot: bool = False,
+            extra: list = None) -> str:
+        """Build a fingerprint
+
+        :param paths: Files or directories whose modification time and size
+            invalidate the value. Missing paths are valid parts too
+        :param boot: Invalidate the value on every boot and kernel update
+        :param extra: Any other strings that invalidate the value
+        :return: String to use with 'is_valid()' and 'set()'
+        """
+        parts = []
+        if boot:
+            parts.append(self.__get_boot_id())
+            parts.append(os.uname().release)
+
+        for path in paths if paths else []:
+            parts.append(f'{path}={self.__get_stat(path)}')
+
+        for item in extra if extra else []:
+            parts.append(str(item))
+
+        return '|'.join(parts)
+
+    def clear_stats(self) -> None:
+        """Forget the stats of the paths used by the fingerprints
+
+        Each path is only checked once until this is called, so call it
+        before each new collection, to see the files that changed.
+        """
+        with self.__lock:
+            self.__stats = {}
+
+    def __get_boot_id(self) -> str:
+        # Changes on every boot
+        if self.__boot_id is None:
+            try:
+                with open('/proc/sys/kernel/random/boot_id', 'r') as boot_id:
+                    self.__boot_id = boot_id.read().strip()
+            except OSError:
+                self.__boot_id = ''
+        return self.__boot_id
+
+    def __get_stat(self, path: str) -> str:
+        # One stat per path, even when used by several fingerprints,
+        # until 'clear_stats()'
+        if path not in self.__stats:
+            try:
+                stat = os.stat(path)
+                self.__stats[path] = f'{stat.st_mtime_ns}:{stat.st_size}'
+            except OSError:
+                self.__stats[path] = '-'
+        return self.__stats[path]
+
+    def __load(self) -> None:
+        # ...
+        self.__content = {}
+        try:
+            with open(self.__url, 'r') as cache_file:
+                content = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(content, dict):
+            self.__content = {
+                k: v for k, v in content.items()
+                if isinstance(v, dict) and 'fingerprint' in v and 'value' in v}
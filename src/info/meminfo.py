@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+
+class MemInfo(object):
+    """Memory and swap usage
+
+    Reads '/proc/meminfo' and '/proc/swaps' in a single pass each.
+    All values are exact byte counts.
+    """
+    def __init__(
+            self, meminfo_url: str = '/proc/meminfo',
+            swaps_url: str = '/proc/swaps') -> None:
+        """Class constructor
+
+        :param meminfo_url: Path of the meminfo file
+        :param swaps_url: Path of the swaps file
+        """
+        self.__meminfo_url = meminfo_url
+        self.__swaps_url = swaps_url
+        self.__content = None
+        self.__swap_devices = None
+
+    @property
+    def content(self) -> dict:
+        """All '/proc/meminfo' fields in bytes
+
+        Example:
+        >>> MemInfo().content['MemTotal']
+        16624726016
+        """
+        if self.__content is None:
+            self.__parse_meminfo()
+        return self.__content
+
+    @property
+    def total(self) -> int | None:
+        """..."""
+        return self.content.get('MemTotal')
+
+    @property
+    def free(self) -> int | None:
+        """Completely unused memory"""
+        return self.content.get('MemFree')
+
+    @property
+    def available(self) -> int | None:
+        """Memory available for new programs without swapping"""
+        return self.content.get('MemAvailable')
+
+    @property
+    def buffers(self) -> int | None:
+        """..."""
+        return self.content.get('Buffers')
+
+    @property
+    def cached(self) -> int | None:
+        """Page cache, without the swap cache"""
+        return self.content.get('Cached')
+
+    @property
+    def sreclaimable(self) -> int | None:
+        """Reclaimable kernel slab memory"""
+        return self.content.get('SReclaimable')
+
+    @property
+    def used(self) -> int | None:
+        """Memory in use, like the 'used' column of 'free'"""
+        if self.total is None:
+            return None
+
+        if self.available is not None:
+            return self.total - self.available
+
+        return max(0, self.total - (self.free or 0) - (self.buffers or 0) - (
+            self.cached or 0) - (self.sreclaimable or 0))
+
+    @property
+    def swap_total(self) -> int | None:
+        """..."""
+        return self.content.get('SwapTotal')
+
+    @property
+    def swap_free(self) -> int | None:
+        """..."""
+        return self.content.get('SwapFree')
+
+    @property
+    def swap_used(self) -> int | None:
+        """..."""
+        if self.swap_total is None or self.swap_free is None:
+            return None
+        return self.swap_total - self.swap_free
+
+    @property
+    def swap_devices(self) -> list:
+        """Each active swap area, from '/proc/swaps'
+
+        Example:
+        >>> MemInfo().swap_devices
+        [{'name': '/swapfile', 'type': 'file', 'size': 2147479552,
+          'used': 0, 'priority': -2}]
+        """
+        if self.__swap_devices is None:
+            self.__parse_swaps()
+        return self.__swap_devices
+
+    def __parse_meminfo(self) -> None:
+        # "MemTotal:       16235084 kB"
+        self.__content = {}
+        try:
+            with open(self.__meminfo_url, 'r') as meminfo_file:
+                for line in meminfo_file:
+                    key, _sep, value = line.partition(':')
+                    fields = value.split()
+                    if not fields or not fields[0].isdigit():
+                        continue
+
+                    number = int(fields[0])
+                    if len(fields) > 1 and fields[1] == 'kB':
+                        number *= 1024
+                    self.__content[key] = number
+        except OSError:
+            pass
+
+    def __parse_swaps(self) -> None:
+        # "Filename  Type  Size  Used  Priority" with sizes in KiB
+        self.__swap_devices = []
+        try:
+            with open(self.__swaps_url, 'r') as swaps_file:
+                lines = swaps_file.read().splitlines()[1:]
+        except OSError:
+            return
+
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 5:
+                continue
+
+            self.__swap_devices.append({
+                'name': fields[0].replace('\\040', ' '),
+                'type': fields[1],
+                'size': int(fields[2]) * 1024,
+                'used': int(fields[3]) * 1024,
+                'priority': int(fields[4])})
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Reference:
+#   www.freedesktop.org/software/systemd/man/os-release.html
+import functools
+import os
+
+
+class OsRelease(object):
+    """The os-release file
+
+    Parse the operating system identification file, '/etc/os-release' or
+    '/usr/lib/os-release', into a dictionary.
+    """
+    def __init__(self, url: str = None) -> None:
+        """Class constructor
+
+        :param url: Path of the file. Default is '/etc/os-release', or
+            '/usr/lib/os-release' if the first one does not exist
+        """
+        self.__url = url
+        self.__content = None
+
+    @property
+    def content(self) -> dict:
+        """Contents of the file as a dictionary
+
+        Example:
+        >>> OsRelease().content['PRETTY_NAME']
+        'Ubuntu 22.04.3 LTS'
+        """
+        if self.__content is None:
+            if self.__url:
+                self.__content = dict(parse_os_release(self.__url))
+            else:
+                self.__content = dict(
+                    parse_os_release('/etc/os-release') or
+                    parse_os_release('/usr/lib/os-release'))
+        return self.__content
+
+    @property
+    def url(self) -> str | None:
+        """..."""
+        return self.__url
+
+
+def parse_os_release(url: str) -> tuple:
+    """Parse an os-release file
+
+    The file is read once per process and read again only when its
+    modification time or size change, like after an upgrade. Values follow
+    the shell quoting rules, so quotes are removed and backslash escapes
+    resolved.
+
+    :param url: Path of the file, like '/etc/os-release'
+    :return: Tuple of (key, value) pairs. Empty if the file can't be read
+    """
+    try:
+        stat = os.stat(url)
+    except OSError:
+        return ()
+    return _read_os_release(url, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_os_release(url: str, _mtime_ns: int, _size: int) -> tuple:
+    # Cached by path and version of the file
+    try:
+        with open(url, 'r') as release_file:
+            lines = release_file.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return ()
+
+    items = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+
+        key, value = line.split('=', 1)
+        items.append((key.strip(), unquote(value)))
+
+    return tuple(items)
+
+
+def unquote(value: str) -> str:
+    """Remove shell quoting from an os-release value
+
+    Single quotes keep everything literally. Inside double quotes only
+    '\\', '\\"', '\\$' and '\\`' are escapes. Outside quotes a backslash
+    escapes any character.
+
+    :param value: Raw value, like '"Ubuntu 22.04.3 LTS"'
+    :return: String like 'Ubuntu 22.04.3 LTS'
+    """
+    unquoted = ''
+    quote = ''
+    escape = False
+    for char in value:
+        if escape:
+            if quote == '"' and char not in '\\"$`':
+                unquoted += '\\'
+            unquoted += char
+            escape = False
+        elif char == '\\' and quote != "'":
+            escape = True
+        elif char in '"\'' and not quote:
+            quote = char
+        elif char == quote:
+            quote = ''
+        else:
+            unquoted += char
+
+    return unquoted + ('\\' if escape else '')
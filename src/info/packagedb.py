@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+import os
+import re
+import shutil
+import sqlite3
+import struct
+import subprocess
+
+import info.childprocess
+
+
+class PackageDatabase(object):
+    """Native package database
+
+    Finds the package manager of the system with a 'stat' per backend,
+    and reads its database directly to count the installed packages,
+    without running the package manager. A database without any
+    installed package, like the one of a dpkg installed only for
+    'debootstrap' on another distribution, is skipped.
+    """
+    def __init__(self) -> None:
+        """Class constructor"""
+        # Backend: database paths. The first one with packages is used
+        self.__databases = {
+            'dpkg': ['/var/lib/dpkg/status'],
+            'rpm': [
+                '/var/lib/rpm/rpmdb.sqlite',
+                '/usr/lib/sysimage/rpm/rpmdb.sqlite',
+                '/var/lib/rpm/Packages'],
+            'pacman': ['/var/lib/pacman/local'],
+            'eopkg': ['/var/lib/eopkg/package']}
+
+        self.__backend = None
+        self.__url = None
+        self.__count = None
+        self.__is_detected = False
+
+    @property
+    def backend(self) -> str | None:
+        """Database type: 'dpkg', 'rpm', 'pacman' or 'eopkg'"""
+        self.__detect()
+        return self.__backend
+
+    @property
+    def url(self) -> str | None:
+        """Path of the database file or directory"""
+        self.__detect()
+        return self.__url
+
+    @property
+    def package_manager(self) -> str | None:
+        """Name of the package manager, 'dnf' on rpm systems that use it"""
+        self.__detect()
+        if self.__backend == 'rpm' and shutil.which('dnf'):
+            return 'dnf'
+        return self.__backend
+
+    @property
+    def count(self) -> int | None:
+        """Number of installed packages"""
+        self.__detect()
+        return self.__count
+
+    def version(self, name: str) -> str | None:
+        """Upstream version of an installed package
+
+        The epoch and the distribution release are removed, so
+        '4:5.27.8-0ubuntu1' is '5.27.8'.
+
+        :param name: Package name, like 'plasma-workspace'
+        :return: The version, or 'None' if the package is not installed
+        """
+        self.__detect()
+        if not self.__backend:
+            return None
+
+        readers = {
+            'dpkg': self.__version_dpkg,
+            'rpm': self.__version_rpm,
+            'pacman': self.__version_directories,
+            'eopkg': self.__version_directories}
+        try:
+            version = readers[self.__backend](name)
+        except (OSError, ValueError, sqlite3.Error, struct.error):
+            return None
+        if not version:
+            return None
+
+        # "1:46.0-1+b1": epoch, upstream version and release
+        version = version.split(':', 1)[-1]
+        version = re.split(r'[+~]', version.rsplit('-', 1)[0])[0]
+        return version if version else None
+
+    @staticmethod
+    def list_dir(url: str) -> list:
+        """Directory entries, or an empty list if it can't be read"""
+        try:
+            return os.listdir(url)
+        except OSError:
+            return []
+
+    def __detect(self) -> None:
+        # The first database that exists and has installed packages. Its
+        # count is kept, since it was needed to choose it
+        if self.__is_detected:
+            return
+        self.__is_detected = True
+
+        counters = {
+            'dpkg': self.__count_dpkg,
+            'rpm': self.__count_rpm,
+            'pacman': self.__count_directories,
+            'eopkg': self.__count_directories}
+        for backend, urls in self.__databases.items():
+            for url in urls:
+                if not os.path.exists(url):
+                    continue
+
+                self.__url = url
+                try:
+                    count = counters[backend]()
+                except (OSError, sqlite3.Error):
+                    count = None
+
+                if count:
+                    self.__backend = backend
+                    self.__count = count
+                    return
+
+        self.__url = None
+
+    def __count_dpkg(self) -> int:
+        # Stanzas with "Status: install ok installed" or "hold ok installed"
+        count = 0
+        with open(self.__url, 'rb') as status:
+            for line in status:
+                line = line.strip()
+                if line.startswith(b'Status: ') and line.endswith(
+                        b' installed') and not line.startswith(
+                        b'Status: deinstall'):
+                    count += 1
+        return count
+
+    def __count_rpm(self) -> int | None:
+        # The old Berkeley DB format can only be read by rpm itself
+        if not self.__url.endswith('.sqlite'):
+            try:
+                output = info.childprocess.ChildProcesses.run(
+                    ['rpm', '-qa'], timeout=10).stdout
+            except (OSError, subprocess.SubprocessError):
+                return None
+            return len(output.splitlines())
+
+        connection = sqlite3.connect(f'file:{self.__url}?mode=ro', uri=True)
+        try:
+            return connection.execute(
+                'SELECT COUNT(*) FROM Packages').fetchone()[0]
+        finally:
+            connection.close()
+
+    def __version_dpkg(self, name: str) -> str | None:
+        # Stanzas are separated by blank lines
+        package, version, installed = None, None, False
+        with open(self.__url, 'r', errors='replace') as status:
+            for line in status:
+                if line.startswith('Package: '):
+                    package = line[9:].strip()
+                elif package == name and line.startswith('Version: '):
+                    version = line[9:].strip()
+                elif package == name and line.startswith('Status: '):
+                    installed = line.rstrip().endswith(' installed') and (
+                        not line.startswith('Status: deinstall'))
+                elif not line.strip():
+                    if package == name and installed and version:
+                        return version
+                    package, version, installed = None, None, False
+
+        return version if package == name and installed else None
+
+    def __version_rpm(self, name: str) -> str | None:
+        # The old Berkeley DB format can only be read by rpm itself
+        if not self.__url.endswith('.sqlite'):
+            try:
+                output = info.childprocess.ChildProcesses.run(
+                    ['rpm', '-q', '--qf', '%{VERSION}', name], timeout=10)
+            except (OSError, subprocess.SubprocessError):
+                return None
+            return output.stdout.strip() if output.returncode == 0 else None
+
+        connection = sqlite3.connect(f'file:{self.__url}?mode=ro', uri=True)
+        try:
+            row = connection.execute(
+                'SELECT Packages.blob FROM Packages JOIN Name '
+                'ON Packages.hnum = Name.hnum WHERE Name.key = ?',
+                (name,)).fetchone()
+        finally:
+            connection.close()
+
+        return self.__rpm_header_string(row[0], 1001) if row else None
+
+    @staticmethod
+    def __rpm_header_string(blob: bytes, tag: int) -> str | None:
+        # Header: index length, data length, index entries (tag, type,
+        # offset, count) and the data. Big endian. 1001 is VERSION
+        index_length, data_length = struct.unpack_from('>II', blob, 0)
+        data_start = 8 + index_length * 16
+        for num in range(index_length):
+            entry_tag, entry_type, offset, _count = struct.unpack_from(
+                '>IIII', blob, 8 + num * 16)
+            if entry_tag == tag and entry_type == 6 and offset < data_length:
+                start = data_start + offset
+                end = blob.index(b'\0', start)
+                return blob[start:end].decode(errors='replace')
+        return None
+
+    def __version_directories(self, name: str) -> str | None:
+        # "plasma-workspace-5.27.8-1": name, version and release
+        for directory in self.list_dir(self.__url):
+            if not directory.startswith(f'{name}-'):
+                continue
+            version = directory[len(name) + 1:]
+            if version.count('-') == 1:
+                return version
+        return None
+
+    def __count_directories(self) -> int:
+        # One directory per installed package
+        with os.scandir(self.__url) as entries:
+            return sum(1 for x in entries if x.is_dir())
+
+
+class FlatpakInstallations(object):
+    """Installed Flatpak apps and runtimes
+
+    Reads the system installation, '/var/lib/flatpak', and the user one,
+    '~/.local/share/flatpak', directly from disk. Each deployed
+    'id/arch/branch' counts once, like in 'flatpak list'.
+    """
+    def __init__(
+            self, system_url: str = '/var/lib/flatpak',
+            user_url: str = None) -> None:
+        """Class constructor
+
+        :param system_url: Path of the system installation
+        :param user_url: Path of the user installation. Default is
+            '~/.local/share/flatpak'
+        """
+        self.__system_url = system_url
+        self.__user_url = user_url if user_url else os.path.join(
+            os.path.expanduser('~'), '.local', 'share', 'flatpak')
+        self.__counts = None
+
+    @property
+    def counts(self) -> dict:
+        """Counts by installation and kind
+
+        Example:
+        >>> FlatpakInstallations().counts
+        {'system_apps': 12, 'system_runtimes': 30, 'user_apps': 1,
+         'user_runtimes': 0}
+        """
+        if self.__counts is None:
+            self.__counts = {}
+            for installation, url in [
+                    ('system', self.__system_url), ('user', self.__user_url)]:
+                for kind in ['app', 'runtime']:
+                    self.__counts[f'{installation}_{kind}s'] = (
+                        self.__count_refs(os.path.join(url, kind)))
+        return self.__counts
+
+    @property
+    def apps(self) -> int:
+        """..."""
+        return self.counts['system_apps'] + self.counts['user_apps']
+
+    @property
+    def runtimes(self) -> int:
+        """..."""
+        return self.counts['system_runtimes'] + self.counts['user_runtimes']
+
+    @property
+    def total(self) -> int:
+        """..."""
+        return self.apps + self.runtimes
+
+    @staticmethod
+    def __count_refs(url: str) -> int:
+        # "app/org.gnome.Maps/x86_64/stable/active"
+        count = 0
+        for ref_id in PackageDatabase.list_dir(url):
+            for arch in PackageDatabase.list_dir(os.path.join(url, ref_id)):
+                for branch in PackageDatabase.list_dir(
+                        os.path.join(url, ref_id, arch)):
+                    if os.path.lexists(
+                            os.path.join(url, ref_id, arch, branch, 'active')):
+                        count += 1
+        return count
+
+
+class SnapPackages(object):
+    """Installed Snap packages
+
+    Reads the snap files kept by snapd, or the snap mount directory,
+    without talking to snapd.
+    """
+    def __init__(self, snaps_url: str = '/var/lib/snapd/snaps') -> None:
+        """Class constructor
+
+        :param snaps_url: Directory of the '<name>_<revision>.snap' files
+        """
+        self.__snaps_url = snaps_url
+        self.__names = None
+
+    @property
+    def names(self) -> list:
+        """Installed snap names, like ['core22', 'firefox', 'snapd']"""
+        if self.__names is None:
+            names = set()
+            for file_name in PackageDatabase.list_dir(self.__snaps_url):
+                if file_name.endswith('.snap') and '_' in file_name:
+                    names.add(file_name.rsplit('_', 1)[0])
+
+            # Without the snap files, the mounted snaps
+            if not names:
+                for mount_url in ['/snap', '/var/lib/snapd/snap']:
+                    for name in PackageDatabase.list_dir(mount_url):
+                        if os.path.lexists(
+                                os.path.join(mount_url, name, 'current')):
+                            names.add(name)
+
+            self.__names = sorted(names)
+        return self.__names
+
+    @property
+    def total(self) -> int:
+        """..."""
+        return len(self.names)
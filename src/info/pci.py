@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+import glob
+import os
+
+import info.infocache
+
+
+class PciIds(object):
+    """Names of PCI vendors and devices
+
+    The 'pci.ids' database is a large text file, so it is converted once
+    into a sorted index in the infofetch cache directory. Each lookup is a
+    binary search over that file, without reading it all.
+    """
+    def __init__(
+            self, url: str = None, index_url: str = None) -> None:
+        """Class constructor
+
+        :param url: Path of the 'pci.ids' file. Default is the first one
+            found in the usual locations
+        :param index_url: Path of the index. Default is
+            '$XDG_CACHE_HOME/infofetch/pci.ids.idx'
+        """
+        self.__url = url if url else self.__find_pci_ids()
+        self.__index_url = index_url if index_url else os.path.join(
+            info.infocache.InfoCache.cache_dir(), 'pci.ids.idx')
+        self.__index_is_ready = False
+
+    @property
+    def url(self) -> str | None:
+        """..."""
+        return self.__url
+
+    @property
+    def index_url(self) -> str:
+        """..."""
+        return self.__index_url
+
+    def vendor_name(self, vendor_id: str) -> str | None:
+        """Vendor name, like 'Intel Corporation'
+
+        :param vendor_id: Hexadecimal vendor id, like '8086'
+        """
+        return self.__lookup(vendor_id.lower())
+
+    def device_name(self, vendor_id: str, device_id: str) -> str | None:
+        """Device name, like 'HD Graphics 620'
+
+        :param vendor_id: Hexadecimal vendor id, like '8086'
+        :param device_id: Hexadecimal device id, like '5916'
+        """
+        return self.__lookup(f'{vendor_id.lower()}:{device_id.lower()}')
+
+    @staticmethod
+    def __find_pci_ids() -> str | None:
+        # ...
+        for url in [
+                '/usr/share/hwdata/pci.ids', '/usr/share/misc/pci.ids',
+                '/usr/share/pci.ids', '/usr/share/pciids/pci.ids']:
+            if os.path.isfile(url):
+                return url
+        return None
+
+    def __lookup(self, key: str) -> str | None:
+        # Binary search over the sorted "key\tname" lines
+        if not self.__update_index():
+            return None
+
+        target = key.encode()
+        with open(self.__index_url, 'rb') as index:
+            index.readline()  # Header
+            lo = index.tell()
+            hi = os.fstat(index.fileno()).st_size
+
+            while lo < hi:
+                mid = (lo + hi) // 2
+                index.seek(mid)
+                index.readline()
+                line_start = index.tell()
+                if line_start >= hi:
+                    hi = mid
+                    continue
+
+                if index.readline().split(b'\t', 1)[0] <= target:
+                    lo = line_start
+                else:
+                    hi = mid
+
+            index.seek(lo)
+            for line in index:
+                line_key, _sep, name = line.rstrip(b'\n').partition(b'\t')
+                if line_key == target:
+                    return name.decode(errors='replace')
+                if line_key > target:
+                    break
+
+        return None
+
+    def __update_index(self) -> bool:
+        # Rebuild when 'pci.ids' changes
+        if self.__index_is_ready:
+            return True
+        if not self.__url:
+            return False
+
+        try:
+            stat = os.stat(self.__url)
+        except OSError:
+            return False
+        header = f'# {self.__url} {stat.st_mtime_ns} {stat.st_size}\n'
+
+        try:
+            with open(self.__index_url, 'r', encoding='utf-8') as index:
+                if index.readline() == header:
+                    self.__index_is_ready = True
+                    return True
+        except (OSError, UnicodeError):
+            pass
+
+        try:
+            entries = self.__parse_pci_ids()
+            os.makedirs(os.path.dirname(self.__index_url), exist_ok=True)
+            temp_url = f'{self.__index_url}.{os.getpid()}.tmp'
+            with open(temp_url, 'w', encoding='utf-8') as index:
+                index.write(header)
+                index.writelines(
+                    f'{k}\t{v}\n' for k, v in sorted(entries.items()))
+            os.replace(temp_url, self.__index_url)
+        except (OSError, UnicodeError):
+            return False
+
+        self.__index_is_ready = True
+        return True
+
+    def __parse_pci_ids(self) -> dict:
+        # "8086  Intel Corporation" and "\t5916  HD Graphics 620"
+        entries = {}
+        vendor_id = None
+        with open(
+                self.__url, 'r', encoding='utf-8',
+                errors='replace') as pci_ids:
+            for line in pci_ids:
+                if line.startswith('C '):
+                    break  # Device classes, the last section
+                if not line.strip() or line.startswith('#'):
+                    continue
+
+                if line.startswith('\t\t'):
+                    continue  # Subsystems
+                elif line.startswith('\t'):
+                    item_id, _sep, name = line.strip().partition('  ')
+                    if vendor_id:
+                        entries[f'{vendor_id}:{item_id.lower()}'] = name
+                else:
+                    item_id, _sep, name = line.strip().partition('  ')
+                    vendor_id = item_id.lower()
+                    entries[vendor_id] = name
+
+        return entries
+
+
+class PciDevices(object):
+    """PCI devices from '/sys/bus/pci/devices'"""
+    def __init__(
+            self, pci_ids: PciIds = None,
+            devices_url: str = '/sys/bus/pci/devices') -> None:
+        """Class constructor
+
+        :param pci_ids: Names database. Default is 'PciIds()'
+        :param devices_url: Path of the PCI devices in sysfs
+        """
+        self.__pci_ids = pci_ids if pci_ids else PciIds()
+        self.__devices_url = devices_url
+        self.__display_controllers = None
+
+    @property
+    def display_controllers(self) -> list:
+        """Every GPU, the one used at boot first
+
+        Each item is a dict with: 'slot', 'vendor_id', 'device_id',
+        'vendor', 'device', 'name', 'driver', 'vram' (bytes, when the
+        driver exposes it) and 'boot_vga'.
+
+        Example:
+        >>> PciDevices().display_controllers[0]['name']
+        'Intel Corporation HD Graphics 620'
+        """
+        if self.__display_controllers is None:
+            self.__display_controllers = self.__get_devices(0x03)
+        return self.__display_controllers
+
+    def __get_devices(self, device_class: int) -> list:
+        # ...
+        devices = []
+        for path in sorted(glob.glob(os.path.join(self.__devices_url, '*'))):
+            pci_class = self.__read(path, 'class')
+            if not pci_class or int(pci_class, 16) >> 16 != device_class:
+                continue
+
+            vendor_id = self.__read(path, 'vendor').lower().replace('0x', '')
+            device_id = self.__read(path, 'device').lower().replace('0x', '')
+            vendor = self.__pci_ids.vendor_name(vendor_id)
+            device = self.__pci_ids.device_name(vendor_id, device_id)
+
+            driver = None
+            if os.path.islink(os.path.join(path, 'driver')):
+                driver = os.path.basename(
+                    os.readlink(os.path.join(path, 'driver')))
+
+            vram = self.__read(path, 'mem_info_vram_total')
+
+            devices.append({
+                'slot': os.path.basename(path),
+                'vendor_id': vendor_id,
+                'device_id': device_id,
+                'vendor': vendor,
+                'device': device,
+                'name': '{} {}'.format(
+                    vendor if vendor else vendor_id,
+                    device if device else f'Device {device_id}'),
+                'driver': driver,
+                'vram': int(vram) if vram.isdigit() else None,
+                'boot_vga': self.__read(path, 'boot_vga') == '1'})
+
+        devices.sort(key=lambda x: not x['boot_vga'])
+        return devices
+
+    @staticmethod
+    def __read(path: str, name: str) -> str:
+        # ...
+        try:
+            with open(os.path.join(path, name), 'r') as sysfs_file:
+                return sysfs_file.read().strip()
+        except OSError:
+            return ''
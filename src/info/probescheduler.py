@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+import queue
+import threading
+import time
+
+import info.childprocess
+import info.infocache
+
+
+class Probe(object):
+    """A single unit of information gathering
+
+    Wraps a callable that collects one piece of information, along with the
+    names of the other probes that must finish before it can start.
+    """
+    def __init__(
+            self, name: str, function: callable, depends: list = None,
+            fingerprint: callable = None, timeout: float = None) -> None:
+        """Class constructor
+
+        :param name: Unique probe name, like 'hostname'
+        :param function: Callable without arguments that returns the value
+        :param depends: Names of the probes that must run first
+        :param fingerprint: Callable without arguments that returns the
+            fingerprint of the value, for values that can be cached on disk
+        :param timeout: Seconds the probe may run. 'None' uses the default
+            timeout of the scheduler
+        """
+        self.__name = name
+        self.__function = function
+        self.__depends = list(depends) if depends else []
+        self.__fingerprint = fingerprint
+        self.__timeout = timeout
+
+    @property
+    def name(self) -> str:
+        """..."""
+        return self.__name
+
+    @property
+    def function(self) -> callable:
+        """..."""
+        return self.__function
+
+    @property
+    def depends(self) -> list:
+        """..."""
+        return self.__depends
+
+    @property
+    def fingerprint(self) -> callable:
+        """..."""
+        return self.__fingerprint
+
+    @property
+    def timeout(self) -> float | None:
+        """..."""
+        return self.__timeout
+
+
+class ProbeScheduler(object):
+    """Run probes concurrently following their dependency graph
+
+    Most of the probes are waiting on child processes or files, so running
+    the independent ones at the same time on a bounded number of threads
+    hides most of that latency. A probe only starts when all of its
+    dependencies have finished.
+    Probes with a fingerprint are served from the cache while their
+    fingerprint does not change.
+
+    A probe that misses its deadline, or is still running at the run
+    deadline, is abandoned: the child processes it started are killed and
+    its last cached value is used, marked as stale. A probe that raises
+    an exception is handled the same way. Without a cached
+    value, the probe and the probes that depend on it are omitted.
+    Probes run in daemon threads, so an abandoned one can't hold the exit.
+    """
+    def __init__(
+            self, max_workers: int = 8,
+            cache: info.infocache.InfoCache = None,
+            timeout: float = None, probe_timeout: float = None) -> None:
+        """Class constructor
+
+        :param max_workers: Maximum number of probes running at the same time
+        :param cache: Cache for the probes that have a fingerprint
+        :param timeout: Seconds a whole run may take. 'None' is no limit
+        :param probe_timeout: Default seconds each probe may run. 'None' is
+            no limit
+        """
+        self.__max_workers = max_workers if max_workers else 8
+        self.__cache = cache
+        self.__timeout = timeout
+        self.__probe_timeout = probe_timeout
+        self.__probes = {}
+        self.__stale = []
+        self.__omitted = []
+        self.__timed_out = {}
+        self.__failed = {}
+
+    @property
+    def max_workers(self) -> int:
+        """..."""
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int) -> None:
+        self.__max_workers = max_workers if max_workers else 8
+
+    @property
+    def timeout(self) -> float | None:
+        """Seconds a whole run may take"""
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float | None) -> None:
+        self.__timeout = timeout
+
+    @property
+    def probe_timeout(self) -> float | None:
+        """Default seconds each probe may run"""
+        return self.__probe_timeout
+
+    @probe_timeout.setter
+    def probe_timeout(self, probe_timeout: float | None) -> None:
+        self.__probe_timeout = probe_timeout
+
+    @property
+    def cache(self) -> info.infocache.InfoCache | None:
+        """..."""
+        return self.__cache
+
+    @property
+    def probes(self) -> dict:
+        """All probes added, by name, in the order they were added"""
+        return self.__probes
+
+    @property
+    def stale(self) -> list:
+        """Probes whose last run gave an old cached value"""
+        return self.__stale
+
+    @property
+    def omitted(self) -> list:
+        """Probes whose last run gave no value
+
+        Probes that timed out or failed without a cached value, and the
+        probes that depend on them. Kept until they run again.
+        """
+        return self.__omitted
+
+    @property
+    def timed_out(self) -> dict:
+        """Probes that missed their deadline the last time they ran
+
+        Each value is a dict with: 'elapsed' (seconds, or 'None' if the
+        probe never started), 'killed' (number of child processes killed)
+        and 'stale' ('True' if the cached value is used).
+        """
+        return self.__timed_out
+
+    @property
+    def failed(self) -> dict:
+        """Probes that raised an exception the last time they ran
+
+        Each value is a dict with: 'error' (the exception) and 'stale'
+        ('True' if the cached value is used).
+        """
+        return self.__failed
+
+    def add_probe(
+            self, name: str, function: callable, depends: list = None,
+            fingerprint: callable = None, timeout: float = None) -> None:
+        """Declare a probe
+
+        :param name: Unique probe name, like 'hostname'
+        :param function: Callable without arguments that returns the value
+        :param depends: Names of the probes that must run first
+        :param fingerprint: Callable without arguments that returns the
+            fingerprint of the value, for values that can be cached on disk
+        :param timeout: Seconds the probe may run. 'None' uses
+            'probe_timeout'
+        """
+        self.__probes[name] = Probe(
+            name, function, depends, fingerprint, timeout)
+
+    def run(self, names: list = None, callback: callable = None) -> dict:
+        """Run the probes
+
+        Runs the requested probes and everything they depend on. Probes
+        whose dependencies are all done run concurrently.
+
+        :param names: Probe names to run. Use 'None' to run all probes
+        :param callback: Called with the name and the value of each probe
+            as soon as it has one, from the thread that called 'run'
+        :return: Dict with the value of each probe that ran, in the order
+            the probes were added. Probes that timed out without a cached
+            value are not in it
+        """
+        pending = self.__resolve(
+            names if names is not None else list(self.__probes))
+        results = {}
+        running = {}  # Name: (thread id, start time)
+        finished = queue.Queue()
+
+        # Only the status of the probes that run again is forgotten, the
+        # others keep the one of their last run
+        self.__stale = [x for x in self.__stale if x not in pending]
+        self.__omitted = [x for x in self.__omitted if x not in pending]
+        for name in pending:
+            self.__timed_out.pop(name, None)
+            self.__failed.pop(name, None)
+        if self.__cache is not None:
+            self.__cache.clear_stats()  # Files may have changed since
+
+        start = time.monotonic()
+        deadline = start + self.__timeout if self.__timeout else None
+
+        while pending or running:
+            # Dependencies that timed out without a value
+            for name in list(pending):
+                if any(x in self.__omitted
+                       for x in self.__probes[name].depends):
+                    pending.remove(name)
+                    self.__omitted.append(name)
+
+            for name in list(pending):
+                if len(running) >= self.__max_workers:
+                    break
+                if all(x in results for x in self.__probes[name].depends):
+                    pending.remove(name)
+                    running[name] = (None, time.monotonic())
+                    threading.Thread(
+                        target=self.__call_probe,
+                        args=(self.__probes[name], finished),
+                        daemon=True).start()
+
+            if not running:
+                continue
+
+            try:
+                event, name, thread_id, value, error = finished.get(
+                    timeout=self.__next_timeout(running, deadline))
+            except queue.Empty:
+                event = None
+
+            # Events of abandoned probes are ignored
+            if event == 'started' and name in running:
+                running[name] = (thread_id, running[name][1])
+            elif event == 'finished' and name in running:
+                running.pop(name)
+                if error is not None:
+                    self.__abandon(
+                        name, None, None, results, callback, error)
+                else:
+                    results[name] = value
+                    if callback is not None:
+                        callback(name, value)
+
+            now = time.monotonic()
+            for running_name, (thread_id, probe_start) in list(
+                    running.items()):
+                probe_timeout = self.__get_probe_timeout(running_name)
+                if (deadline is None or now < deadline) and (
+                        probe_timeout is None or
+                        now < probe_start + probe_timeout):
+                    continue
+
+                running.pop(running_name)
+                self.__abandon(
+                    running_name, thread_id, now - probe_start, results,
+                    callback)
+
+            # Past the run deadline, nothing new starts
+            if deadline is not None and time.monotonic() >= deadline:
+                for name in pending:
+                    self.__abandon(name, None, None, results, callback)
+                pending = []
+
+        if self.__cache is not None:
+            self.__cache.save()
+
+        return {x: results[x] for x in self.__probes if x in results}
+
+    def __call_probe(self, probe: Probe, finished: queue.Queue) -> None:
+        # Runs in its own thread. The thread id is sent first, so the
+        # processes of the probe can be killed if it times out
+        thread_id = threading.get_ident()
+        finished.put(('started', probe.name, thread_id, None, None))
+        try:
+            value = self.__get_value(probe)
+        except Exception as error:
+            finished.put(('finished', probe.name, thread_id, None, error))
+        else:
+            finished.put(('finished', probe.name, thread_id, value, None))
+
+    def __get_value(self, probe: Probe):
+        # Cached value while the fingerprint stays the same
+        if probe.fingerprint is None or self.__cache is None:
+            return probe.function()
+
+        fingerprint = probe.fingerprint()
+        if self.__cache.is_valid(probe.name, fingerprint):
+            return self.__cache.get(probe.name)
+
+        value = probe.function()
+        self.__cache.set(probe.name, fingerprint, value)
+        return value
+
+    def __abandon(
+            self, name: str, thread_id: int | None, elapsed: float | None,
+            results: dict, callback: callable,
+            error: Exception = None) -> None:
+        # Kill the processes of the probe and use the cached value. With an
+        # error, the probe has already finished
+        killed = 0
+        if thread_id is not None:
+            killed = info.childprocess.ChildProcesses.kill(thread_id)
+
+        stale = (
+            self.__cache is not None and
+            self.__probes[name].fingerprint is not None and
+            name in self.__cache.content)
+        if stale:
+            results[name] = self.__cache.get(name)
+            self.__stale.append(name)
+        else:
+            self.__omitted.append(name)
+
+        if error is not None:
+            self.__failed[name] = {'error': error, 'stale': stale}
+        else:
+            self.__timed_out[name] = {
+                'elapsed': elapsed, 'killed': killed, 'stale': stale}
+        if stale and callback is not None:
+            callback(name, results[name])
+
+    def __get_probe_timeout(self, name: str) -> float | None:
+        # ...
+        if self.__probes[name].timeout is not None:
+            return self.__probes[name].timeout
+        return self.__probe_timeout
+
+    def __next_timeout(
+            self, running: dict, deadline: float | None) -> float | None:
+        # Seconds until the next deadline of a running probe, or of the run
+        deadlines = [deadline] if deadline is not None else []
+        for name, (_thread_id, probe_start) in running.items():
+            probe_timeout = self.__get_probe_timeout(name)
+            if probe_timeout is not None:
+                deadlines.append(probe_start + probe_timeout)
+
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def __resolve(self, names: list) -> list:
+        # Requested probes and all their transitive dependencies
+        resolved = []
+        visiting = []
+
+        def visit(name: str) -> None:
+            if name in resolved:
+                return
+            if name not in self.__probes:
+                raise KeyError(f"Unknown probe '{name}'")
+            if name in visiting:
+                raise ValueError(
+                    f"Circular dependency: {' -> '.join(visiting + [name])}")
+
+            visiting.append(name)
+            for depend in self.__probes[name].depends:
+                visit(depend)
+            visiting.pop()
+            resolved.append(name)
+
+        for probe_name in names:
+            visit(probe_name)
+
+        return resolved
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+import math
+import os
+import re
+import threading
+import time
+
+
+class Storage(object):
+    """Mounted filesystems and their usage
+
+    Parses '/proc/self/mountinfo' once and queries each real filesystem
+    with 'os.statvfs'. Pseudo filesystems and bind mounts of an already
+    listed filesystem are skipped. Each 'statvfs' call runs in its own
+    thread with a timeout, so a stale network mount can't hang the caller.
+    A mount whose previous call is still running, from this or an earlier
+    'Storage', is reported as timed out without starting another thread.
+    """
+    # Mount point: (thread, result) of the 'statvfs' calls not joined yet
+    __running = {}
+    __running_lock = threading.Lock()
+
+    def __init__(
+            self, timeout: float = 1.0,
+            mountinfo_url: str = '/proc/self/mountinfo') -> None:
+        """Class constructor
+
+        :param timeout: Seconds to wait for the usage of each mount
+        :param mountinfo_url: Path of the mountinfo file
+        """
+        self.__timeout = timeout
+        self.__mountinfo_url = mountinfo_url
+        self.__mounts = None
+
+        # Kernel virtual filesystems, never storage
+        self.__pseudo_fs_types = {
+            'autofs', 'binfmt_misc', 'bpf', 'cgroup', 'cgroup2', 'configfs',
+            'debugfs', 'devpts', 'devtmpfs', 'efivarfs', 'fusectl',
+            'hugetlbfs', 'mqueue', 'nsfs', 'proc', 'pstore', 'ramfs',
+            'rpc_pipefs', 'securityfs', 'selinuxfs', 'squashfs', 'sysfs',
+            'tmpfs', 'tracefs', 'fuse.gvfsd-fuse', 'fuse.portal',
+            'fuse.snapfuse', 'fuse.lxcfs'}
+
+        # Real filesystems whose source is not a device path
+        self.__sourceless_fs_types = {
+            'btrfs', 'zfs', 'nfs', 'nfs4', 'cifs', 'smb3', 'fuse.sshfs',
+            '9p', 'virtiofs', 'ceph', 'glusterfs'}
+
+    @property
+    def timeout(self) -> float:
+        """..."""
+        return self.__timeout
+
+    @property
+    def mounts(self) -> list:
+        """Real mounted filesystems, in mount order
+
+        Each item is a dict with: 'mount_point', 'device', 'fs_type',
+        'size', 'used', 'free', 'available' (bytes), 'used_percent' (like
+        'df'), 'inodes', 'inodes_used', 'inodes_free' and 'timed_out'.
+        Sizes are 'None' when 'timed_out' is 'True'.
+
+        Example:
+        >>> Storage().mounts[0]['mount_point']
+        '/'
+        """
+        if self.__mounts is None:
+            self.__mounts = self.__get_mounts()
+            self.__update_usage()
+        return self.__mounts
+
+    def mount(self, mount_point: str) -> dict | None:
+        """The filesystem mounted at 'mount_point', like '/home'"""
+        for mount in self.mounts:
+            if mount['mount_point'] == mount_point:
+                return mount
+        return None
+
+    def __get_mounts(self) -> list:
+        # "36 35 98:0 /mnt1 /mnt/parent rw - ext3 /dev/root rw,errors=cont"
+        try:
+            with open(self.__mountinfo_url, 'r') as mountinfo:
+                lines = mountinfo.read().splitlines()
+        except OSError:
+            return []
+
+        mounts = []
+        seen_roots = {}
+        for line in lines:
+            fields, _sep, fs_fields = line.partition(' - ')
+            fields, fs_fields = fields.split(), fs_fields.split()
+            if len(fields) < 5 or len(fs_fields) < 2:
+                continue
+
+            dev, root, mount_point = fields[2], fields[3], fields[4]
+            fs_type, source = fs_fields[0], fs_fields[1]
+            root = self.__unescape(root)
+            mount_point = self.__unescape(mount_point)
+
+            if fs_type in self.__pseudo_fs_types:
+                continue
+            if fs_type == 'overlay' and mount_point != '/':
+                continue  # Container layers
+            if (not source.startswith('/') and fs_type != 'overlay' and
+                    fs_type not in self.__sourceless_fs_types):
+                continue
+
+            # Bind mount of something already listed
+            if any(self.__is_sub_path(root, x)
+                   for x in seen_roots.get(dev, [])):
+                continue
+            seen_roots.setdefault(dev, []).append(root)
+
+            mounts.append({
+                'mount_point': mount_point,
+                'device': self.__unescape(source),
+                'fs_type': fs_type,
+                'size': None, 'used': None, 'free': None, 'available': None,
+                'used_percent': None, 'inodes': None, 'inodes_used': None,
+                'inodes_free': None, 'timed_out': False})
+
+        return mounts
+
+    def __update_usage(self) -> None:
+        # Daemon threads: one stuck in a dead NFS mount won't block the exit
+        calls = []
+        with self.__running_lock:
+            for mount in self.__mounts:
+                call = self.__running.get(mount['mount_point'])
+                if call is not None and call[0].is_alive():
+                    # Still stuck since an earlier refresh, don't pile up
+                    calls.append(None)
+                    continue
+
+                result = {}
+                thread = threading.Thread(
+                    target=self.__statvfs, args=(mount['mount_point'], result),
+                    daemon=True)
+                thread.start()
+                self.__running[mount['mount_point']] = (thread, result)
+                calls.append((thread, result))
+
+        deadline = time.monotonic() + self.__timeout
+        for mount, call in zip(self.__mounts, calls):
+            if call is not None:
+                call[0].join(max(0.0, deadline - time.monotonic()))
+            if call is None or 'stat' not in call[1]:
+                mount['timed_out'] = True
+                continue
+
+            with self.__running_lock:
+                if self.__running.get(mount['mount_point']) is call:
+                    del self.__running[mount['mount_point']]
+
+            stat = call[1]['stat']
+            if stat is None:
+                continue
+
+            size = stat.f_blocks * stat.f_frsize
+            free = stat.f_bfree * stat.f_frsize
+            available = stat.f_bavail * stat.f_frsize
+            used = size - free
+            mount.update({
+                'size': size, 'used': used, 'free': free,
+                'available': available,
+                'used_percent': (
+                    math.ceil(used * 100 / (used + available))
+                    if used + available else 0),
+                'inodes': stat.f_files,
+                'inodes_used': stat.f_files - stat.f_ffree,
+                'inodes_free': stat.f_ffree})
+
+        self.__mounts = [
+            x for x in self.__mounts if x['size'] or x['timed_out']]
+
+    @staticmethod
+    def __statvfs(mount_point: str, result: dict) -> None:
+        # ...
+        try:
+            result['stat'] = os.statvfs(mount_point)
+        except OSError:
+            result['stat'] = None
+
+    @staticmethod
+    def __is_sub_path(path: str, parent: str) -> bool:
+        # '/@home/user' is inside '/@home', '/@home' is not inside '/@'
+        return path == parent or path.startswith(parent.rstrip('/') + '/')
+
+    @staticmethod
+    def __unescape(path: str) -> str:
+        # Spaces and other special characters are octal escapes: '\040'
+        return re.sub(
+            r'\\([0-7]{3})', lambda x: chr(int(x.group(1), 8)), path)
@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
 import os
 import re
-import subprocess
+import struct
 
+import info.cpuinfo
 import info.desktopentryparse
+import info.desktopversion
+import info.drm
+import info.gvdb
+import info.identity
+import info.meminfo
+import info.osrelease
+import info.packagedb
+import info.pci
+import info.storage
+import info.uptime
+import info.wayland
+import info.x11
 
 
 class SystemInfo(object):
@@ -18,10 +31,11 @@ class SystemInfo(object):
         all properties start out empty and are filled in as the accessor
         methods are used.
         """
+        self.__identity = info.identity.Identity()
         self.__user_name = None
         self.__username = None
         self.__hostname = None
-        self.__os_release = self.os_release
+        self.__os_release = None
         self.__pretty_name = None
         self.__name = None
         self.__name_id = None
@@ -32,35 +46,31 @@ class SystemInfo(object):
         self.__kernel_architecture = None
         self.__motherboard = None
         self.__motherboard_version = None
-        self.__root_disk_size = None
-        self.__root_disk_used = None
-        self.__root_disk_free = None
-        self.__root_disk_used_in_percent = None
-        self.__root_disk_mount_point = None
-        self.__root_disk_path = self.root_disk_path
+        self.__storage = None
+        self.__cpu_info = None
         self.__cpu = None
         self.__cpu_architecture = None
         self.__gpu = None
-        self.__ram = self.ram
-        self.__ram_used = None
-        self.__ram_free = None
-        self.__swap = None
-        self.__swap_used = None
-        self.__swap_free = None
+        self.__gpus = None
+        self.__meminfo = None
+        self.__displays = None
         self.__screen_resolution = None
-        self.__uptime = None
+        self.__uptime = info.uptime.Uptime()
         self.__shell = None
         self.__desktop_environment = None
         self.__desktop_environment_version = None
         self.__window_manager = None
         self.__packages = None
-        self.__package_manager = self.package_manager
+        self.__package_manager = None
         self.__display_server = None
+        self.__flatpak = None
         self.__flatpak_packages = None
         self.__snap_packages = None
         self.__kde_style = None
         self.__kde_icons = None
         self.__gtk_style = None
+        self.__dconf = None
+        self.__gsettings_schemas = None
         self.__gtk_icons = None
 
     @property
@@ -74,9 +84,7 @@ class SystemInfo(object):
         if self.__user_name:
             return self.__user_name
 
-        user_name = subprocess.getoutput(
-            "cat /etc/passwd | grep `echo $HOME` | awk -F ':' '{print $5}'"
-        ).strip().strip(',').strip("'").strip('"')
+        user_name = self.__identity.user_name.strip().strip("'").strip('"')
         self.__user_name = user_name if user_name else None
 
         return self.__user_name
@@ -93,7 +101,7 @@ class SystemInfo(object):
         if self.__username:
             return self.__username
 
-        username = os.environ['USER'].strip()
+        username = self.__identity.username.strip()
         self.__username = username if username else None
 
         return self.__username
@@ -109,15 +117,11 @@ class SystemInfo(object):
         if self.__hostname:
             return self.__hostname
 
-        # Fix $HOSTNAME missing
-        if subprocess.getoutput('cat /etc/hostname ; echo $?')[-1] == '0':
-            hostname = subprocess.getoutput('cat /etc/hostname')
-        else:
-            hostname = subprocess.getoutput('echo $HOSTNAME')
+        hostname = self.__identity.hostname
 
         # Fix $HOSTNAME in Fedora
-        if 'fedora' in self.name.lower():
-            hostname = subprocess.getoutput('printf "${HOSTNAME%%.*}"')
+        if self.name and 'fedora' in self.name.lower():
+            hostname = self.__identity.short_hostname
 
         self.__hostname = hostname.strip() if hostname.strip() else None
         return self.__hostname
@@ -130,62 +134,33 @@ class SystemInfo(object):
 
         :return: Dict containing information from the '/etc/os-release' file
         """
-        all_release_info = {}
+        if self.__os_release is not None:
+            return self.__os_release
 
-        cat_release = subprocess.getoutput('cat /etc/os-release').split('\n')
-        for item_release in cat_release:
-            items = item_release.split('=')
-            all_release_info[items[0]] = items[1].strip('"').strip("'")
+        all_release_info = info.osrelease.OsRelease().content
 
         # HACK: Identify some known distributions that do not configure
-        # version information as they should
-        hack_name = False
-        name = str()
-        name_id = str()
-
-        if 'ubuntu' in all_release_info['NAME'].lower():
-            # Kubuntu
-            if 'kubuntu-default-settings' in os.listdir('/usr/share/'):
-                if 'settings.ini' in os.listdir(
-                        '/usr/share/kubuntu-default-settings/'):
-                    hack_name = True
-                    name = 'Kubuntu'
-                    name_id = 'kubuntu'
-
-            # Lubuntu
-            elif 'lubuntu' in os.listdir('/usr/share/'):
-                if 'openbox' in os.listdir('/usr/share/lubuntu/'):
-                    hack_name = True
-                    name = 'Lubuntu'
-                    name_id = 'lubuntu'
-
-            # ubuntu Budgie
-            elif 'Budgie Welcome' in subprocess.getoutput(
-                    'ubuntu-budgie-welcome.budgie-welcome --version'):
-                hack_name = True
-                name = 'Ubuntu Budgie'
-                name_id = 'ubuntubudgie'
-
-            # Xubuntu
-            elif 'xubuntu' in os.listdir('/usr/share/'):
-                if 'applications' in os.listdir('/usr/share/xubuntu/'):
-                    hack_name = True
-                    name = 'Xubuntu'
-                    name_id = 'xubuntu'
-
-            # Ubuntu Mate
-            elif 'ubuntu-mate' in os.listdir('/usr/share/'):
-                if 'settings-overlay' in os.listdir('/usr/share/ubuntu-mate/'):
-                    hack_name = True
-                    name = 'Ubuntu MATE'
-                    name_id = 'ubuntumate'
-
-        if hack_name:
-            all_release_info['NAME'] = name
-            all_release_info['ID'] = name_id
-            if 'PRETTY_NAME' in all_release_info:
-                all_release_info['PRETTY_NAME'] = all_release_info[
-                    'PRETTY_NAME'].replace('Ubuntu', name)
+        # version information as they should.
+        # (name, name id, marker path), the first marker found wins
+        flavors = [
+            ('Kubuntu', 'kubuntu',
+             '/usr/share/kubuntu-default-settings/settings.ini'),
+            ('Lubuntu', 'lubuntu', '/usr/share/lubuntu/openbox'),
+            ('Ubuntu Budgie', 'ubuntubudgie',
+             '/snap/bin/ubuntu-budgie-welcome.budgie-welcome'),
+            ('Xubuntu', 'xubuntu', '/usr/share/xubuntu/applications'),
+            ('Ubuntu MATE', 'ubuntumate',
+             '/usr/share/ubuntu-mate/settings-overlay')]
+
+        if 'ubuntu' in all_release_info.get('NAME', '').lower():
+            for name, name_id, marker in flavors:
+                if os.path.exists(marker):
+                    all_release_info['NAME'] = name
+                    all_release_info['ID'] = name_id
+                    if 'PRETTY_NAME' in all_release_info:
+                        all_release_info['PRETTY_NAME'] = all_release_info[
+                            'PRETTY_NAME'].replace('Ubuntu', name)
+                    break
 
         self.__os_release = all_release_info
         return self.__os_release
@@ -201,8 +176,8 @@ class SystemInfo(object):
         if self.__pretty_name:
             return self.__pretty_name
 
-        self.__pretty_name = (self.__os_release['PRETTY_NAME']
-                              if 'PRETTY_NAME' in self.__os_release else None)
+        self.__pretty_name = (self.os_release['PRETTY_NAME']
+                              if 'PRETTY_NAME' in self.os_release else None)
 
         return self.__pretty_name
 
@@ -218,8 +193,8 @@ class SystemInfo(object):
         if self.__name:
             return self.__name
 
-        self.__name = (self.__os_release['NAME']
-                       if 'NAME' in self.__os_release else None)
+        self.__name = (self.os_release['NAME']
+                       if 'NAME' in self.os_release else None)
         return self.__name
 
     @property
@@ -235,10 +210,10 @@ class SystemInfo(object):
             return self.__name_id
 
         name_id = ''
-        if 'ID' in self.__os_release:
-            name_id = self.__os_release['ID']
-        elif 'NAME' in self.__os_release:
-            name_id = self.__os_release['NAME'].lower()
+        if 'ID' in self.os_release:
+            name_id = self.os_release['ID']
+        elif 'NAME' in self.os_release:
+            name_id = self.os_release['NAME'].lower()
 
         self.__name_id = name_id.strip() if name_id.strip() else None
         return self.__name_id
@@ -257,10 +232,10 @@ class SystemInfo(object):
             return self.__codename
 
         codename = ''
-        if 'VERSION_CODENAME' in self.__os_release:
-            codename = self.__os_release['VERSION_CODENAME']
-        elif 'CODENAME' in self.__os_release:
-            codename = self.__os_release['CODENAME']
+        if 'VERSION_CODENAME' in self.os_release:
+            codename = self.os_release['VERSION_CODENAME']
+        elif 'CODENAME' in self.os_release:
+            codename = self.os_release['CODENAME']
         self.__codename = codename.strip() if codename.strip() else None
 
         return self.__codename
@@ -277,10 +252,10 @@ class SystemInfo(object):
             return self.__version
 
         version = ''
-        if 'VERSION_ID' in self.__os_release:
-            version = self.__os_release['VERSION_ID']
-        elif 'VERSION' in self.__os_release:
-            version = self.__os_release['VERSION']
+        if 'VERSION_ID' in self.os_release:
+            version = self.os_release['VERSION_ID']
+        elif 'VERSION' in self.os_release:
+            version = self.os_release['VERSION']
         self.__version = version.strip() if version.strip() else None
 
         return self.__version
@@ -296,8 +271,7 @@ class SystemInfo(object):
         if self.__kernel:
             return self.__kernel
 
-        kernel = subprocess.getoutput(
-            'cat /proc/sys/kernel/ostype').title().strip()
+        kernel = self.__identity.kernel_name.title().strip()
         self.__kernel = kernel if kernel else None
 
         return self.__kernel
@@ -315,7 +289,7 @@ class SystemInfo(object):
 
         regex = re.compile(r'(\.x\d.+|x\d.+)')
         kernel_version = regex.sub(
-            '', subprocess.getoutput('cat /proc/sys/kernel/osrelease')).strip()
+            '', self.__identity.kernel_release).strip()
         self.__kernel_version = kernel_version if kernel_version else None
 
         return self.__kernel_version
@@ -326,8 +300,8 @@ class SystemInfo(object):
         if self.__kernel_architecture:
             return self.__kernel_architecture
 
-        architecture = subprocess.getoutput(
-            'getconf LONG_BIT').title().strip()
+        # Word size of the userland, like 'getconf LONG_BIT'
+        architecture = str(struct.calcsize('P') * 8)
         self.__kernel_architecture = architecture if architecture else None
         return self.__kernel_architecture
 
@@ -337,8 +311,8 @@ class SystemInfo(object):
         if self.__motherboard:
             return self.__motherboard
 
-        motherboard = subprocess.getoutput(
-            'cat /sys/devices/virtual/dmi/id/product_name').strip()
+        motherboard = self.__read_file(
+            '/sys/devices/virtual/dmi/id/product_name')
         self.__motherboard = motherboard if motherboard else None
 
         return self.__motherboard
@@ -349,52 +323,69 @@ class SystemInfo(object):
         if self.__motherboard_version:
             return self.__motherboard_version
 
-        version = subprocess.getoutput(
-            'cat /sys/devices/virtual/dmi/id/product_version').strip()
+        version = self.__read_file(
+            '/sys/devices/virtual/dmi/id/product_version')
         self.__motherboard_version = version if version else None
 
         return self.__motherboard_version
 
     @property
-    def root_disk_path(self) -> str | None:
-        """..."""
-        disk_info = [
-            x.split() for x in subprocess.getoutput('df -h /').split('\n')][1]
+    def storage(self) -> list:
+        """Every real mounted filesystem and its usage in bytes
 
-        if len(disk_info) == 6:
-            self.__root_disk_path = disk_info[0]
-            self.__root_disk_size = disk_info[1]
-            self.__root_disk_used = disk_info[2]
-            self.__root_disk_free = disk_info[3]
-            self.__root_disk_used_in_percent = disk_info[4]
-            self.__root_disk_mount_point = disk_info[5]
+        See 'info.storage.Storage.mounts' for the keys of each item.
+        """
+        if self.__storage is None:
+            self.__storage = info.storage.Storage().mounts
+        return self.__storage
 
-        return self.__root_disk_path
+    @property
+    def root_disk(self) -> dict | None:
+        """The filesystem mounted at '/', like an item of 'storage'"""
+        for mount in self.storage:
+            if mount['mount_point'] == '/':
+                return mount
+        return None
 
     @property
-    def root_disk_size(self) -> str | None:
-        """..."""
-        return self.__root_disk_size
+    def root_disk_path(self) -> str | None:
+        """Source of the root filesystem, like '/dev/sda2' or 'overlay'"""
+        return self.root_disk['device'] if self.root_disk else None
 
     @property
-    def root_disk_used(self) -> str | None:
+    def root_disk_size(self) -> int | None:
         """..."""
-        return self.__root_disk_used
+        return self.root_disk['size'] if self.root_disk else None
 
     @property
-    def root_disk_free(self) -> str | None:
+    def root_disk_used(self) -> int | None:
         """..."""
-        return self.__root_disk_free
+        return self.root_disk['used'] if self.root_disk else None
+
+    @property
+    def root_disk_free(self) -> int | None:
+        """Space available to unprivileged users, like 'df'"""
+        return self.root_disk['available'] if self.root_disk else None
 
     @property
-    def root_disk_used_in_percent(self) -> str | None:
+    def root_disk_used_in_percent(self) -> int | None:
         """..."""
-        return self.__root_disk_used_in_percent
+        return self.root_disk['used_percent'] if self.root_disk else None
 
     @property
     def root_disk_mount_point(self) -> str | None:
         """..."""
-        return self.__root_disk_mount_point
+        return self.root_disk['mount_point'] if self.root_disk else None
+
+    @property
+    def cpu_info(self) -> dict:
+        """Processor model, topology and frequencies
+
+        See 'info.cpuinfo.CpuInfo.content' for the keys.
+        """
+        if self.__cpu_info is None:
+            self.__cpu_info = info.cpuinfo.CpuInfo().content
+        return self.__cpu_info
 
     @property
     def cpu(self) -> str | None:
@@ -402,10 +393,8 @@ class SystemInfo(object):
         if self.__cpu:
             return self.__cpu
 
-        cpu = re.sub(
-            r'\(\w+\)', '', subprocess.getoutput(
-                "cat /proc/cpuinfo | grep 'model name' | sed -n 1p")
-            .split('\t')[-1].strip(":").strip())
+        model = self.cpu_info['model']
+        cpu = re.sub(r'\(\w+\)', '', model).strip() if model else ''
 
         self.__cpu = cpu if cpu else None
 
@@ -417,56 +406,33 @@ class SystemInfo(object):
         if self.__cpu_architecture:
             return self.__cpu_architecture
 
-        cpu = subprocess.getoutput(
-            "lscpu | grep Architecture | awk '{print $2}'").strip()
+        cpu = self.cpu_info['architecture']
         self.__cpu_architecture = cpu if cpu else None
 
         return self.__cpu_architecture
 
+    @property
+    def gpus(self) -> list:
+        """Every GPU, the one used at boot first
+
+        See 'info.pci.PciDevices.display_controllers' for the keys of each
+        item.
+        """
+        if self.__gpus is None:
+            self.__gpus = info.pci.PciDevices().display_controllers
+        return self.__gpus
+
     @property
     def gpu(self) -> str | None:
-        """..."""
+        """Names of all GPUs, separated by commas"""
         if self.__gpu:
             return self.__gpu
 
-        gpu = ''
-        found = False
-
-        # 1° method ||| dica para achar os drivers: lspci -v
-        gpuread = subprocess.getoutput('lspci | grep 3D')
-        if 'lspci:' not in gpuread and '/bin/sh:' not in gpuread and gpuread:
-            regex = re.findall(r'^.+: (.+) \(rev .+$', gpuread)
-            if regex:
-                gpu = regex[0]
-                found = True
-
-        # 2° method
-        if not found:
-            board = str()
-            id_cmd = "lspci |grep -i graphics| awk '{ print $1 }'"
-            gpuid = subprocess.getoutput(id_cmd)
-            if gpuid.replace(':', '').replace('.', '').isdigit():
-                gpu_cmd = f'cat "/sys/bus/pci/devices/0000:{gpuid}/label"'
-                gpu_board = subprocess.getoutput(gpu_cmd).strip()
-                board = gpu_board if 'cat: ' not in gpu_board else board
-                # board = gpu_board if 'cat: ' not in gpuread else board
-
-            gpuread = subprocess.getoutput('lspci | grep VGA')
-            if 'lspci:' in gpuread or '/bin/sh:' in gpuread:
-                gpuread = board
-
-            regex = re.findall(r'.+: (.+)', gpuread)
-            remove = re.findall(r'\(.+\)', gpuread)
-            if regex:
-                gpuread = regex[0]
-            if remove:
-                gpu = gpuread.replace(remove[0], '')
-
-            gpu += board
-            found = True
-
-        # Clear
-        if found:
+        names = []
+        for device in self.gpus:
+            gpu = device['name']
+
+            # Clear
             if 'intel' in gpu.lower():
                 dirt = [
                     'Corporation',
@@ -477,79 +443,104 @@ class SystemInfo(object):
 
             if 'virtualbox' in gpu.lower():
                 gpu = 'VirtualBox Graphics Adapter'
-        else:
-            gpu = ''
 
-        gpu = gpu.replace('  ', ' ').strip()
+            gpu = gpu.replace('  ', ' ').strip()
+            if gpu and gpu not in names:
+                names.append(gpu)
+
+        gpu = ', '.join(names)
         self.__gpu = gpu if gpu else None
 
         return self.__gpu
 
     @property
-    def ram(self) -> str | None:
-        """..."""
-        # Somente um método pega todas as informações das memórias
-        # para evitar repetir o comando do 'shell'
+    def meminfo(self) -> info.meminfo.MemInfo:
+        """Memory and swap reader
 
-        # Pegar linhas da memória ram e swap
-        memory_info = subprocess.getoutput("free -h")
-        memory_info = memory_info.replace(',', '.').split('\n')
-
-        ram_line = memory_info[1].split(' ')  # "memory_info[0]" é o cabeçalho
-        swap_line = memory_info[2].split(' ')
+        All memory properties share it, so '/proc/meminfo' is read once.
+        """
+        if self.__meminfo is None:
+            self.__meminfo = info.meminfo.MemInfo()
+        return self.__meminfo
 
-        # Lista para armazenar as informações das memórias ram e swap
-        ram_info = []
-        swap_info = []
+    @property
+    def ram(self) -> int | None:
+        """Total memory in bytes"""
+        return self.meminfo.total
 
-        # Preencher as listas com caracteres válidos, removendo vazios
-        for ram in ram_line:
-            if ram != '':
-                ram_info.append(ram.strip())
-        for swap in swap_line:
-            if swap != '':
-                swap_info.append(swap.strip())
+    @property
+    def ram_used(self) -> int | None:
+        """Used memory in bytes, like the 'used' column of 'free'"""
+        return self.meminfo.used
 
-        # Atribuir valores da memória ram
-        self.__ram = ram_info[1] if ram_info[1] else None
-        self.__ram_used = ram_info[2] if ram_info[2] else None
-        self.__ram_free = ram_info[3] if ram_info[3] else None
-        # Atribuir valores da memória swap
-        self.__swap = swap_info[1] if swap_info[1] else None
-        self.__swap_used = swap_info[2] if swap_info[2] else None
-        self.__swap_free = swap_info[3] if swap_info[3] else None
+    @property
+    def ram_free(self) -> int | None:
+        """Unused memory in bytes"""
+        return self.meminfo.free
 
-        return self.__ram
+    @property
+    def ram_available(self) -> int | None:
+        """Memory available for new programs in bytes"""
+        return self.meminfo.available
 
     @property
-    def ram_used(self) -> str | None:
+    def ram_buffers(self) -> int | None:
         """..."""
-        # Already updated in self.ram
-        return self.__ram_used
+        return self.meminfo.buffers
 
     @property
-    def ram_free(self) -> str | None:
+    def ram_cached(self) -> int | None:
         """..."""
-        # Already updated in self.ram
-        return self.__ram_free
+        return self.meminfo.cached
 
     @property
-    def swap(self) -> str | None:
+    def ram_sreclaimable(self) -> int | None:
         """..."""
-        # Already updated in self.ram
-        return self.__swap
+        return self.meminfo.sreclaimable
+
+    @property
+    def swap(self) -> int | None:
+        """Total swap in bytes"""
+        return self.meminfo.swap_total
 
     @property
-    def swap_used(self) -> str | None:
+    def swap_used(self) -> int | None:
         """..."""
-        # Already updated in self.ram
-        return self.__swap_used
+        return self.meminfo.swap_used
 
     @property
-    def swap_free(self) -> str | None:
+    def swap_free(self) -> int | None:
         """..."""
-        # Already updated in self.ram
-        return self.__swap_free
+        return self.meminfo.swap_free
+
+    @property
+    def swap_devices(self) -> list:
+        """Usage of each swap area, see 'MemInfo.swap_devices'"""
+        return self.meminfo.swap_devices
+
+    @property
+    def displays(self) -> list:
+        """Connected monitors
+
+        Each item is a dict with: 'card', 'name', 'status', 'enabled',
+        'modes', 'width' and 'height', like in 'DrmConnectors().connected'.
+        Without any DRM connector, like under Xvnc, the size of each X
+        screen is used, with the 'name' 'X11'.
+        """
+        if self.__displays is None:
+            self.__displays = info.drm.DrmConnectors().connected
+
+            if not self.__displays and (
+                    self.__identity.session_type.lower() != 'wayland'):
+                x11 = info.x11.X11Connection()
+                self.__displays = [
+                    {'card': None, 'name': 'X11', 'status': 'connected',
+                     'enabled': 'enabled', 'modes': [],
+                     'width': x['width'], 'height': x['height']}
+                    for x in x11.screens]
+                x11.close()
+
+        return self.__displays
 
     @property
     def screen_resolution(self) -> str | None:
@@ -557,38 +548,30 @@ class SystemInfo(object):
         if self.__screen_resolution:
             return self.__screen_resolution
 
-        resolution = ''
-        if subprocess.getoutput('xrandr ; echo $?')[-1] == '0':
-            resolution = subprocess.getoutput(
-                "xrandr | grep current | awk -F , '{print $2}'")
-            resolution = resolution.replace(
-                ' current ', '').replace(' x ', 'x').strip()
-
-        if not resolution:
-            if os.path.isfile('/sys/class/drm/card0-Virtual-1/modes'):
-                with open('/sys/class/drm/card0-Virtual-1/modes', 'r') as fl:
-                    lines = fl.readlines()
-                resolution = lines[0].strip('\n') if lines else None
+        # One "WIDTHxHEIGHT" per monitor
+        resolution = ', '.join(
+            '{}x{}'.format(x['width'], x['height'])
+            for x in self.displays)
 
         self.__screen_resolution = resolution if resolution else None
 
         return self.__screen_resolution
 
     @property
-    def uptime(self) -> str | None:
-        """..."""
-        if self.__uptime:
-            return self.__uptime
+    def uptime(self) -> int | None:
+        """Seconds since boot"""
+        seconds = self.__uptime.seconds
+        return int(seconds) if seconds is not None else None
 
-        uptime = subprocess.getoutput('uptime -p')
-        if uptime[:7] == 'uptime:':
-            uptime = subprocess.getoutput(
-                'uptime').split(',')[0][9:].replace('up', '').strip() + ' Hs'
-        else:
-            uptime = uptime.replace('up ', '').strip()
+    @property
+    def load_average(self) -> tuple | None:
+        """Load averages of the last 1, 5 and 15 minutes"""
+        return self.__uptime.load_average
 
-        self.__uptime = uptime if uptime else None
-        return self.__uptime
+    @property
+    def boot_time(self) -> int | None:
+        """Boot time, in seconds since the epoch"""
+        return self.__uptime.boot_time
 
     @property
     def shell(self) -> str | None:
@@ -596,7 +579,7 @@ class SystemInfo(object):
         if self.__shell:
             return self.__shell
 
-        shell = subprocess.getoutput('basename $SHELL').strip()
+        shell = self.__identity.shell.strip()
         self.__shell = shell if shell else None
 
         return self.__shell
@@ -607,8 +590,7 @@ class SystemInfo(object):
         if self.__desktop_environment:
             return self.__desktop_environment
 
-        de_env = subprocess.getoutput(
-            'echo $XDG_CURRENT_DESKTOP').replace(':', '-').strip()
+        de_env = self.__identity.current_desktop.replace(':', '-').strip()
 
         # Limpar
         dirt_to_clean = ['(', ')', "'", '"', 'X-']
@@ -630,24 +612,12 @@ class SystemInfo(object):
         if self.__desktop_environment_version:
             return self.__desktop_environment_version
 
-        cmd_version = {
-            # 'budgie': "budgie-desktop --version | awk '{print $2}'",
-            'cinnamon': "cinnamon --version | awk '{print $2}'",
-            # deepin
-            'gnome': "gnome-shell --version | awk '{print $3}'",
-            'kde': "plasmashell --version | awk '{print $2}'",
-            # lxde
-            'lxqt': "lxqt-about -v | grep liblxqt | awk '{print $2}'",
-            # pantheon elementary
-            'xfce': "xfce4-about -V | grep xfce4-about | awk '{print $2}'",
-        }
-        de = self.desktop_environment.lower()
-        de_version = ''
-        for cmd_version_key, cmd_version_value in cmd_version.items():
-            if cmd_version_key in de:
-                de_version = subprocess.getoutput(
-                    cmd_version_value).strip()
-                break
+        if not self.desktop_environment:
+            return None
+
+        de_version = info.desktopversion.DesktopVersion(
+            self.desktop_environment).version
+        de_version = de_version if de_version else ''
 
         # Limpar
         dirt_to_clean = ['(', ')', "'", '"', 'X-']
@@ -670,27 +640,18 @@ class SystemInfo(object):
         if self.__window_manager:
             return self.__window_manager
 
-        cmd_xprop = subprocess.getoutput(
-            'xprop -root -notype _NET_SUPPORTING_WM_CHECK')
-        cmd_window_manager = subprocess.getoutput(
-            'xprop -id {} -notype -len 100 -f _NET_WM_NAME 8t '
-            '| grep WM_KEY'.format(
-                cmd_xprop.split()[-1])).split('=')[-1].replace('"', '').strip()
-
-        if cmd_window_manager == '':
-            cmd_xprop = subprocess.getoutput(
-                'xprop -root -notype _NET_SUPPORTING_WM_CHECK')
-            cmd_window_manager = subprocess.getoutput(
-                'xprop -id {} -notype -len 100 -f _NET_WM_NAME 8t '
-                '| grep WM_NAME'.format(
-                    cmd_xprop.split()[-1])).split('=')[-1].replace(
-                '"', '').strip()
-
-        window_manager = cmd_window_manager.replace(',', ' | ').replace(
-            '(', '').replace(')', '').strip()
+        # Wayland sessions never try X, even with Xwayland running
+        if self.__identity.session_type.lower() == 'wayland' or (
+                os.environ.get('WAYLAND_DISPLAY') and
+                not self.__identity.session_type):
+            window_manager = info.wayland.WaylandCompositor().name
+        else:
+            x11 = info.x11.X11Connection()
+            window_manager = x11.window_manager_name()
+            x11.close()
 
-        if 'xprop:' in cmd_window_manager:
-            window_manager = ''
+        window_manager = (window_manager if window_manager else '').replace(
+            ',', ' | ').replace('(', '').replace(')', '').strip()
 
         # Custom
         if window_manager:
@@ -706,7 +667,7 @@ class SystemInfo(object):
         if self.__display_server:
             return self.__display_server
 
-        display_server = subprocess.getoutput('echo $XDG_SESSION_TYPE').strip()
+        display_server = self.__identity.session_type.strip()
 
         # Custom
         if 'wayland' in display_server.lower():
@@ -718,86 +679,61 @@ class SystemInfo(object):
     @property
     def package_manager(self) -> str | None:
         """..."""
-        # /etc/arch-release = pacman
-        # /etc/debian_version = apt-get
-        # /etc/gentoo-release = emerge
-
-        # /etc/redhat-release = yum
-        # /etc/SuSE-release = zypp
-
-        # /etc/alpine-release = apk
-
-        cmd_packages = {
-            'dpkg': 'dpkg --get-selections | grep -cv deinstall$',
-            'rpm': 'rpm -qa | wc -l',
-            'pacman': 'pacman -Qq --color never | wc -l',
-            'eopkg': 'eopkg list-installed | wc -l'}
-
-        package_manager = ''
-        packages = ''
-        for cmd_packages_key, cmd_packages_value in cmd_packages.items():
-            num = subprocess.getoutput(cmd_packages_value).split()[-1].strip()
-            number = int(num) if num.isdigit() else None
-
-            if number is not None and number > 0:
-                package_manager = cmd_packages_key
-                packages = str(number)
-                break
+        if self.__package_manager:
+            return self.__package_manager
 
-        if package_manager not in cmd_packages.keys():
+        database = info.packagedb.PackageDatabase()
+        count = database.count
+
+        if count:
+            self.__package_manager = database.package_manager
+            self.__packages = str(count)
+        else:
             self.__package_manager = None
             self.__packages = None
-        else:
-            self.__package_manager = package_manager
-            self.__packages = packages
-
-        if self.__package_manager == 'rpm':
-            if '/' in subprocess.getoutput('whereis dnf'):
-                self.__package_manager = 'dnf'
 
         return self.__package_manager
 
     @property
     def packages(self) -> str | None:
         """..."""
-        # Already updated in self.package_manager
+        # Updated in self.package_manager
+        if self.__packages is None and self.__package_manager is None:
+            _package_manager = self.package_manager
         return self.__packages
 
     @property
     def flatpak_packages(self) -> str | None:
-        """..."""
+        """Number of Flatpak apps and runtimes"""
         if self.__flatpak_packages:
             return self.__flatpak_packages
 
-        num = subprocess.getoutput('flatpak list | wc -l').split()[-1].strip()
-        number = int(num) if num.isdigit() else None
-
-        packages = ''
-        if number and number > 0:
-            packages = str(number)
+        if self.__flatpak is None:
+            self.__flatpak = info.packagedb.FlatpakInstallations()
 
-        self.__flatpak_packages = packages if packages else None
+        number = self.__flatpak.total
+        self.__flatpak_packages = str(number) if number > 0 else None
         return self.__flatpak_packages
 
+    @property
+    def flatpak_details(self) -> dict:
+        """Flatpak counts by installation and kind
+
+        Keys: 'system_apps', 'system_runtimes', 'user_apps' and
+        'user_runtimes'.
+        """
+        if self.__flatpak is None:
+            self.__flatpak = info.packagedb.FlatpakInstallations()
+        return self.__flatpak.counts
+
     @property
     def snap_packages(self) -> str | None:
         """..."""
         if self.__snap_packages:
             return self.__snap_packages
 
-        # Remove cabeçalho com: grep -v "^Name"
-        # number = int(subprocess.getoutput(
-        # 'snap list | grep -v "^Name" | wc -l').split()[-1])
-
-        # Remove cabeçalho com '-1' no fim
-        num = subprocess.getoutput('snap list | wc -l').split()[-1].strip()
-        number = int(num) - 1 if num.isdigit() else None
-
-        packages = ''
-        if number and number > 0:
-            packages = str(number)
-
-        self.__snap_packages = packages if packages else None
+        number = info.packagedb.SnapPackages().total
+        self.__snap_packages = str(number) if number > 0 else None
         return self.__snap_packages
 
     @property
@@ -838,14 +774,7 @@ class SystemInfo(object):
         if self.__gtk_style:
             return self.__gtk_style
 
-        if self.desktop_environment == 'MATE':
-            gtk_style = subprocess.getoutput(
-                'dconf read /org/mate/desktop/interface/gtk-theme').strip("'")
-        else:
-            gtk_style = subprocess.getoutput(
-                'gsettings get org.gnome.desktop.interface gtk-theme').strip(
-                "'")
-
+        gtk_style = self.__get_gtk_setting('gtk-theme', 'gtk-theme-name')
         self.__gtk_style = gtk_style if gtk_style else None
 
         return self.__gtk_style
@@ -856,19 +785,66 @@ class SystemInfo(object):
         if self.__gtk_icons:
             return self.__gtk_icons
 
-        if self.desktop_environment == 'MATE':
-            gtk_icons = subprocess.getoutput(
-                'dconf read /org/mate/desktop/interface/icon-theme').strip(
-                "'")
-        else:
-            gtk_icons = subprocess.getoutput(
-                'gsettings get org.gnome.desktop.interface icon-theme').strip(
-                "'")
-
+        gtk_icons = self.__get_gtk_setting('icon-theme', 'gtk-icon-theme-name')
         self.__gtk_icons = gtk_icons if gtk_icons else None
 
         return self.__gtk_icons
 
+    def __get_gtk_setting(self, dconf_key: str, ini_key: str) -> str | None:
+        # The dconf user database, the same one that 'gsettings' and
+        # 'dconf read' use, then the default of the compiled schemas, then
+        # the GTK 'settings.ini' files
+        config_home = os.environ.get('XDG_CONFIG_HOME')
+        if not config_home:
+            config_home = os.path.join(os.path.expanduser('~'), '.config')
+
+        if self.__dconf is None:
+            self.__dconf = info.gvdb.GvdbFile(
+                os.path.join(config_home, 'dconf', 'user'))
+
+        schema_id = ('org.mate.desktop.interface'
+                     if self.desktop_environment == 'MATE' else
+                     'org.gnome.desktop.interface')
+        value = self.__dconf.get(
+            '/' + schema_id.replace('.', '/') + '/' + dconf_key)
+        if isinstance(value, str) and value:
+            return value
+
+        if self.__gsettings_schemas is None:
+            self.__gsettings_schemas = [
+                info.gvdb.GvdbFile(os.path.join(
+                    x, 'glib-2.0', 'schemas', 'gschemas.compiled'))
+                for x in (os.environ.get('XDG_DATA_DIRS') or
+                          '/usr/local/share:/usr/share').split(':') if x]
+        for schemas in self.__gsettings_schemas:
+            value = schemas.schema_default(schema_id, dconf_key)
+            if value is not None:
+                if isinstance(value, str) and value:
+                    return value
+                break  # The first directory with the schema is used
+
+        for gtk_version in ['gtk-4.0', 'gtk-3.0']:
+            settings_ini = os.path.join(
+                config_home, gtk_version, 'settings.ini')
+            if not os.path.isfile(settings_ini):
+                continue
+
+            settings = info.desktopentryparse.DesktopFile(settings_ini)
+            if ('[Settings]' in settings.content and
+                    ini_key in settings.content['[Settings]']):
+                return settings.content['[Settings]'][ini_key].strip()
+
+        return None
+
+    @staticmethod
+    def __read_file(url: str) -> str:
+        # Stripped content, or an empty string if it can't be read
+        try:
+            with open(url, 'r') as text_file:
+                return text_file.read().strip()
+        except (OSError, UnicodeDecodeError):
+            return ''
+
 
 if __name__ == '__main__':
     print('System info:')
@@ -887,16 +863,21 @@ if __name__ == '__main__':
     print('                motherboard:', linux_info.motherboard)
     print('        motherboard-version:', linux_info.motherboard_version)
     print('                        cpu:', linux_info.cpu)
+    print('                   cpu-info:', linux_info.cpu_info)
     print('           cpu-architecture:', linux_info.cpu_architecture)
     print('                        gpu:', linux_info.gpu)
     print('                        ram:', linux_info.ram)
     print('                   ram-used:', linux_info.ram_used)
     print('                   ram-free:', linux_info.ram_free)
+    print('              ram-available:', linux_info.ram_available)
     print('                       swap:', linux_info.swap)
     print('                  swap-used:', linux_info.swap_used)
     print('                  swap-free:', linux_info.swap_free)
+    print('               swap-devices:', linux_info.swap_devices)
     print('          screen-resolution:', linux_info.screen_resolution)
     print('                     uptime:', linux_info.uptime)
+    print('               load-average:', linux_info.load_average)
+    print('                  boot-time:', linux_info.boot_time)
     print('                      shell:', linux_info.shell)
     print('        desktop-environment:', linux_info.desktop_environment)
     print('desktop-environment-version:',
@@ -906,6 +887,7 @@ if __name__ == '__main__':
     print('            package-manager:', linux_info.package_manager)
     print('                   packages:', linux_info.packages)
     print('           flatpak-packages:', linux_info.flatpak_packages)
+    print('            flatpak-details:', linux_info.flatpak_details)
     print('              snap-packages:', linux_info.snap_packages)
     print('                  kde-style:', linux_info.kde_style)
     print('                  kde-icons:', linux_info.kde_icons)
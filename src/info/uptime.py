@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+
+class Uptime(object):
+    """Uptime, load averages and boot time from '/proc'
+
+    Each value is one small read of a kernel file, and is read again on
+    every access, since all of them change over time.
+    """
+    def __init__(
+            self, uptime_url: str = '/proc/uptime',
+            loadavg_url: str = '/proc/loadavg',
+            stat_url: str = '/proc/stat') -> None:
+        """Class constructor
+
+        :param uptime_url: Path of the uptime file
+        :param loadavg_url: Path of the loadavg file
+        :param stat_url: Path of the kernel stat file
+        """
+        self.__uptime_url = uptime_url
+        self.__loadavg_url = loadavg_url
+        self.__stat_url = stat_url
+
+    @property
+    def seconds(self) -> float | None:
+        """Seconds since boot, like 3723.42"""
+        # "3723.42 14170.63": uptime and idle time
+        fields = self.__read(self.__uptime_url).split()
+        try:
+            return float(fields[0])
+        except (IndexError, ValueError):
+            return None
+
+    @property
+    def load_average(self) -> tuple | None:
+        """Load averages of the last 1, 5 and 15 minutes"""
+        # "0.52 0.58 0.59 2/1234 56789"
+        fields = self.__read(self.__loadavg_url).split()
+        try:
+            return float(fields[0]), float(fields[1]), float(fields[2])
+        except (IndexError, ValueError):
+            return None
+
+    @property
+    def boot_time(self) -> int | None:
+        """Boot time, in seconds since the epoch"""
+        # "btime 1697612345", after one line per CPU
+        try:
+            with open(self.__stat_url, 'r') as stat:
+                for line in stat:
+                    if line.startswith('btime '):
+                        value = line.split()[-1]
+                        return int(value) if value.isdigit() else None
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def __read(url: str) -> str:
+        # ...
+        try:
+            with open(url, 'r') as proc_file:
+                return proc_file.read()
+        except OSError:
+            return ''
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import os
+import socket
+import struct
+
+
+class WaylandCompositor(object):
+    """The Wayland compositor of the session
+
+    Connects to the '$WAYLAND_DISPLAY' socket and asks the kernel which
+    process is listening on it (SO_PEERCRED), then reads the process name
+    from '/proc'. No Wayland message is exchanged and X is never used.
+    """
+    def __init__(self, display: str = None) -> None:
+        """Class constructor
+
+        :param display: Socket name or path. Default is '$WAYLAND_DISPLAY',
+            or 'wayland-0'
+        """
+        self.__display = display if display else os.environ.get(
+            'WAYLAND_DISPLAY', 'wayland-0')
+        self.__pid = None
+
+        # Process name: compositor name
+        self.__names = {
+            'gnome-shell': 'Mutter',
+            'kwin_wayland': 'KWin',
+            'kwin_wayland_wr': 'KWin',
+            'sway': 'Sway',
+            'Hyprland': 'Hyprland',
+            'weston': 'Weston',
+            'wayfire': 'Wayfire',
+            'river': 'River',
+            'labwc': 'Labwc',
+            'cosmic-comp': 'COSMIC',
+            'budgie-wm': 'Budgie',
+            'mutter': 'Mutter',
+            'niri': 'Niri',
+            'hikari': 'Hikari',
+            'gamescope': 'Gamescope',
+            'cage': 'Cage',
+            'enlightenment': 'Enlightenment'}
+
+    @property
+    def url(self) -> str:
+        """Path of the socket"""
+        if os.path.isabs(self.__display):
+            return self.__display
+        return os.path.join(
+            os.environ.get('XDG_RUNTIME_DIR', f'/run/user/{os.getuid()}'),
+            self.__display)
+
+    @property
+    def pid(self) -> int | None:
+        """Process id of the compositor"""
+        if self.__pid is None:
+            try:
+                with socket.socket(
+                        socket.AF_UNIX, socket.SOCK_STREAM) as wayland:
+                    wayland.settimeout(1.0)
+                    wayland.connect(self.url)
+                    credentials = wayland.getsockopt(
+                        socket.SOL_SOCKET, socket.SO_PEERCRED,
+                        struct.calcsize('3i'))
+            except (OSError, AttributeError):  # SO_PEERCRED is Linux only
+                return None
+
+            pid, _uid, _gid = struct.unpack('3i', credentials)
+            self.__pid = pid if pid > 0 else None
+        return self.__pid
+
+    @property
+    def process_name(self) -> str | None:
+        """Name of the compositor process, like 'kwin_wayland'"""
+        if not self.pid:
+            return None
+
+        try:
+            with open(f'/proc/{self.pid}/comm', 'r') as comm:
+                return comm.read().strip()
+        except OSError:
+            return None
+
+    @property
+    def name(self) -> str | None:
+        """Name of the compositor, like 'KWin'"""
+        process_name = self.process_name
+        if not process_name:
+            return None
+        return self.__names.get(process_name, process_name)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# Reference:
+#   www.x.org/releases/current/doc/xproto/x11protocol.html
+import os
+import socket
+import struct
+
+
+class X11Connection(object):
+    """Minimal X11 client
+
+    Speaks just enough of the core X11 protocol, over the local '$DISPLAY'
+    UNIX socket, to read window properties. Independent requests are sent
+    together in a single write, so they share one round trip.
+    Remote (TCP) displays are not supported.
+    """
+    def __init__(self, display: str = None, timeout: float = 1.0) -> None:
+        """Class constructor
+
+        :param display: Display name, like ':0'. Default is '$DISPLAY'
+        :param timeout: Seconds to wait for the X server on each read
+        """
+        self.__display = display if display else os.environ.get(
+            'DISPLAY', '')
+        self.__timeout = timeout
+        self.__socket = None
+        self.__is_connected = None
+        self.__roots = []
+
+    @property
+    def display(self) -> str:
+        """..."""
+        return self.__display
+
+    @property
+    def is_connected(self) -> bool:
+        """If the connection to the X server was accepted"""
+        if self.__is_connected is None:
+            try:
+                self.__is_connected = self.__connect()
+            except (OSError, struct.error):
+                self.__is_connected = False
+            if not self.__is_connected:
+                self.close()
+        return self.__is_connected
+
+    @property
+    def screens(self) -> list:
+        """Root window of each screen, with its size
+
+        Each item is a dict with: 'root', 'width', 'height', 'width_mm'
+        and 'height_mm'.
+        """
+        return self.__roots if self.is_connected else []
+
+    @property
+    def root(self) -> int | None:
+        """Root window of the '$DISPLAY' screen"""
+        if not self.screens:
+            return None
+
+        screen = self.__display.rpartition(':')[2].partition('.')[2]
+        screen = int(screen) if screen.isdigit() else 0
+        return self.screens[min(screen, len(self.screens) - 1)]['root']
+
+    def close(self) -> None:
+        """..."""
+        if self.__socket is not None:
+            self.__socket.close()
+            self.__socket = None
+
+    def intern_atoms(self, names: list) -> list:
+        """Atom of each name, or 0 for names the server does not know
+
+        :param names: Atom names, like ['_NET_WM_NAME', 'UTF8_STRING']
+        """
+        if not self.is_connected:
+            return [0] * len(names)
+
+        requests = b''
+        for name in names:
+            name = name.encode()
+            requests += struct.pack(
+                '<BBHHxx', 16, 1, 2 + (len(name) + 3) // 4,
+                len(name)) + self.__pad(name)
+
+        try:
+            self.__socket.sendall(requests)
+            return [
+                struct.unpack_from('<I', x, 8)[0] if x else 0
+                for x in self.__read_replies(len(names))]
+        except (OSError, struct.error):
+            self.close()
+            self.__is_connected = False
+            return [0] * len(names)
+
+    def get_properties(self, requests: list) -> list:
+        """Get several window properties in one round trip
+
+        :param requests: List of (window, atom) tuples
+        :return: Value of each property as bytes, or 'None' if it is not
+            set. 32 bit values, like windows, are in the first 4 bytes
+        """
+        if not self.is_connected:
+            return [None] * len(requests)
+
+        data = b''
+        for window, atom in requests:
+            # GetProperty: any type, up to 1024 * 4 bytes
+            data += struct.pack('<BBHIIIII', 20, 0, 6, window, atom, 0, 0,
+                                1024)
+
+        try:
+            self.__socket.sendall(data)
+            properties = []
+            for reply in self.__read_replies(len(requests)):
+                if not reply:
+                    properties.append(None)
+                    continue
+
+                value_format = reply[1]
+                value_type, _bytes_after, length = struct.unpack_from(
+                    '<III', reply, 8)
+                if not value_type:
+                    properties.append(None)
+                    continue
+                properties.append(
+                    reply[32:32 + length * max(value_format // 8, 1)])
+            return properties
+        except (OSError, struct.error):
+            self.close()
+            self.__is_connected = False
+            return [None] * len(requests)
+
+    def window_manager_name(self) -> str | None:
+        """Name of the EWMH window manager, like 'KWin'
+
+        Reads '_NET_SUPPORTING_WM_CHECK' from the root window and then
+        '_NET_WM_NAME', or 'WM_NAME', from the window it points to.
+        """
+        if self.root is None:
+            return None
+
+        wm_check, wm_name = self.intern_atoms(
+            ['_NET_SUPPORTING_WM_CHECK', '_NET_WM_NAME'])
+        if not wm_check:
+            return None
+
+        check_window = self.get_properties([(self.root, wm_check)])[0]
+        if not check_window or len(check_window) < 4:
+            return None
+        window = struct.unpack_from('<I', check_window)[0]
+
+        # WM_NAME is the predefined atom 39
+        net_name, name = self.get_properties(
+            [(window, wm_name), (window, 39)] if wm_name else [
+                (window, 39), (window, 39)])
+        value = net_name if net_name else name
+        if not value:
+            return None
+
+        return value.split(b'\0')[0].decode(errors='replace').strip()
+
+    def __connect(self) -> bool:
+        # ':0', ':0.0' or 'unix:0'
+        host, _sep, number = self.__display.rpartition(':')
+        number = number.partition('.')[0]
+        if host not in ('', 'unix') or not number.isdigit():
+            return False
+
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__socket.settimeout(self.__timeout)
+        try:
+            self.__socket.connect(f'/tmp/.X11-unix/X{number}')
+        except OSError:
+            self.__socket.connect(f'\0/tmp/.X11-unix/X{number}')
+
+        auth_name, auth_data = self.__get_auth(number)
+        self.__socket.sendall(
+            struct.pack('<BxHHHHxx', 0x6c, 11, 0, len(auth_name),
+                        len(auth_data)) +
+            self.__pad(auth_name) + self.__pad(auth_data))
+
+        status, _reason, _major, _minor, length = struct.unpack(
+            '<BBHHH', self.__recv(8))
+        setup = self.__recv(length * 4)
+        if status != 1:
+            return False
+
+        # Vendor name and pixmap formats come before the screens
+        vendor_length, = struct.unpack_from('<H', setup, 16)
+        n_screens, n_formats = setup[20], setup[21]
+        offset = 32 + (vendor_length + 3) // 4 * 4 + n_formats * 8
+
+        for _screen in range(n_screens):
+            root, = struct.unpack_from('<I', setup, offset)
+            width, height, width_mm, height_mm = struct.unpack_from(
+                '<HHHH', setup, offset + 20)
+            self.__roots.append({
+                'root': root, 'width': width, 'height': height,
+                'width_mm': width_mm, 'height_mm': height_mm})
+
+            # Skip the allowed depths and their visuals
+            n_depths = setup[offset + 39]
+            offset += 40
+            for _depth in range(n_depths):
+                n_visuals, = struct.unpack_from('<H', setup, offset + 2)
+                offset += 8 + n_visuals * 24
+
+        return True
+
+    def __get_auth(self, number: str) -> tuple:
+        # MIT-MAGIC-COOKIE-1 from the Xauthority file, if there is one.
+        # Entries: family, address, display number, name and data
+        url = os.environ.get('XAUTHORITY')
+        if not url:
+            url = os.path.join(os.path.expanduser('~'), '.Xauthority')
+
+        try:
+            with open(url, 'rb') as xauthority:
+                data = xauthority.read()
+        except OSError:
+            return b'', b''
+
+        hostname = socket.gethostname().encode()
+        offset = 0
+        while offset + 2 <= len(data):
+            family, = struct.unpack_from('>H', data, offset)
+            offset += 2
+            fields = []
+            for _field in range(4):
+                if offset + 2 > len(data):
+                    return b'', b''
+                length, = struct.unpack_from('>H', data, offset)
+                fields.append(data[offset + 2:offset + 2 + length])
+                offset += 2 + length
+            address, display_number, name, cookie = fields
+
+            # FamilyLocal (256) or FamilyWild (65535)
+            if (family == 65535 or (family == 256 and address == hostname)) \
+                    and display_number in (b'', number.encode()) \
+                    and name == b'MIT-MAGIC-COOKIE-1':
+                return name, cookie
+
+        return b'', b''
+
+    def __read_replies(self, count: int) -> list:
+        # Replies come in request order. Errors become empty replies and
+        # events are skipped
+        replies = []
+        while len(replies) < count:
+            reply = self.__recv(32)
+            if reply[0] == 0:
+                replies.append(b'')
+            elif reply[0] == 1:
+                extra_length, = struct.unpack_from('<I', reply, 4)
+                replies.append(reply + self.__recv(extra_length * 4))
+        return replies
+
+    def __recv(self, size: int) -> bytes:
+        # ...
+        data = b''
+        while len(data) < size:
+            chunk = self.__socket.recv(size - len(data))
+            if not chunk:
+                raise OSError('X server closed the connection')
+            data += chunk
+        return data
+
+    @staticmethod
+    def __pad(data: bytes) -> bytes:
+        # Requests are made of 4 byte units
+        return data + b'\0' * (-len(data) % 4)
@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
+import re
+import shutil
 import sys
 import os
-import subprocess
+import tempfile
+import time
+import unicodedata
 
 from xdg import IconTheme
-import cairosvg
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-import ansi.ansicolorimage
 import ansi.colorbar
+import ansi.logocache
+import ansi.palette
+import info.infocache
 import info.systeminfo
 import info.formattedsysteminfo
 import info.desktopentryparse
@@ -18,22 +23,34 @@ import info.desktopentryparse
 class InfoFetch(object):
     """..."""
 
-    def __init__(self) -> None:
-        """..."""
+    def __init__(
+            self, timeout: float = 5.0, probe_timeout: float = 3.0,
+            fields: list = None) -> None:
+        """Class constructor
+
+        Nothing is collected or drawn here, the logo is only loaded when
+        the output is.
+
+        :param timeout: Seconds to collect all the information. Fields
+            still missing after it show their cached value or are omitted
+        :param probe_timeout: Seconds each piece of information may take
+        :param fields: Only these fields, like ['OS', 'Kernel', 'RAM'].
+            Default is all the fields
+        """
         self.__base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.__sys_info = info.formattedsysteminfo.FormattedSystemInfo()
+        self.__sys_info = info.formattedsysteminfo.FormattedSystemInfo(
+            timeout=timeout, probe_timeout=probe_timeout, fields=fields)
 
         self.__logo_height = 20
         self.__logo_width = 20
-        self.__logo = self.__get_logo()
-
-        self.__infos = self.__get_infos()
+        self.__logo = None
+        self.__palette = ansi.palette.Palette()
 
+        self.__is_progressive = True
         self.__colorbar_item_width = 1
         self.__colorbar_is_legacy = False
         self.__colorbar_is_mirrored = True
-        self.__colorbar = ansi.colorbar.ColorBar(
-            self.__logo.image_accent_color.split(';'))
+        self.__colorbar = None
 
     @property
     def colobar_item_width(self) -> int:
@@ -43,7 +60,7 @@ class InfoFetch(object):
     @colobar_item_width.setter
     def colobar_item_width(self, value: int) -> None:
         self.__colorbar_item_width = value
-        self.__colorbar.color_item_width = self.__colorbar_item_width
+        self.__colorbar = None
 
     @property
     def colorbar_is_legacy(self) -> bool:
@@ -53,7 +70,7 @@ class InfoFetch(object):
     @colorbar_is_legacy.setter
     def colorbar_is_legacy(self, value: bool) -> None:
         self.__colorbar_is_legacy = value
-        self.__colorbar.is_legacy = self.__colorbar_is_legacy
+        self.__colorbar = None
 
     @property
     def colorbar_is_mirrored(self) -> bool:
@@ -63,18 +80,174 @@ class InfoFetch(object):
     @colorbar_is_mirrored.setter
     def colorbar_is_mirrored(self, value: bool) -> None:
         self.__colorbar_is_mirrored = value
-        self.__colorbar.is_mirrored = self.__colorbar_is_mirrored
+        self.__colorbar = None
+
+    @property
+    def is_progressive(self) -> bool:
+        """Draw the fields as they are ready, on a terminal
+
+        The logo and the fields that are already known are printed at once,
+        with a placeholder for the others, and each line is rewritten in
+        place when its field is ready. When the output is not a terminal,
+        everything is printed at the end.
+        """
+        return self.__is_progressive
+
+    @is_progressive.setter
+    def is_progressive(self, value: bool) -> None:
+        self.__is_progressive = value
+
+    @property
+    def palette_mode(self) -> str:
+        """'truecolor', '256' or '16'
+
+        The colors of the terminal, used by the logo, the keys and the
+        color bar. Use 'None' for 'Palette.detect_mode()', the default.
+        """
+        return self.__palette.mode
+
+    @palette_mode.setter
+    def palette_mode(self, mode: str | None) -> None:
+        self.__set_palette(mode, self.__palette.is_dithered)
+
+    @property
+    def is_dithered(self) -> bool:
+        """Use ordered dithering on the logo, with 256 or 16 colors"""
+        return self.__palette.is_dithered
+
+    @is_dithered.setter
+    def is_dithered(self, value: bool) -> None:
+        self.__set_palette(self.__palette.mode, value)
+
+    @property
+    def sys_info(self) -> info.formattedsysteminfo.FormattedSystemInfo:
+        """..."""
+        return self.__sys_info
+
+    def render(self, columns: int = None) -> str:
+        """The logo and the information, as printed by 'fetch()'
+
+        :param columns: Terminal width. Default is the current terminal
+        """
+        return ''.join(
+            line + '\n' for line in self.__get_lines(self.__get_infos(
+                self.__sys_info.info_fetch_as_dict, columns=columns)))
 
     def fetch(self) -> int:
         """..."""
-        self.__set_same_amount_of_lines_for_logo_and_info()
-        for img_line, text_line in zip(
-                self.__logo.ansi_lines, self.__infos):
-            print(img_line, text_line)
+        if self.__is_progressive and sys.stdout.isatty():
+            self.__fetch_progressively()
+        else:
+            sys.stdout.write(self.render())
+
+        for line in self.__sys_info.diagnostics:
+            print(f'infofetch: {line}', file=sys.stderr)
         return 0
 
-    def __get_logo(self) -> ansi.ansicolorimage:
-        # ...
+    def watch(self, interval: float = 2.0) -> int:
+        """Show the information until interrupted, updating it in place
+
+        Only the dynamic fields, like RAM and uptime, are collected again
+        every 'interval' seconds, and only the terminal cells whose text
+        changed are written. Everything is drawn again when the terminal
+        is resized.
+
+        :param interval: Seconds between updates
+        :return: Exit code, 1 if the output is not a terminal
+        """
+        if not sys.stdout.isatty():
+            print('infofetch: the watch mode needs a terminal',
+                  file=sys.stderr)
+            return 1
+
+        lines = []
+        size = None
+        sys.stdout.write('\x1b[?25l')  # Hide the cursor
+        try:
+            while True:
+                new_size = shutil.get_terminal_size()
+                new_lines = self.__get_lines(self.__get_infos(
+                    self.__sys_info.info_fetch_as_dict,
+                    columns=new_size.columns))[:new_size.lines]
+
+                if new_size != size or len(new_lines) != len(lines):
+                    sys.stdout.write(
+                        '\x1b[H\x1b[2J' + '\r\n'.join(new_lines))
+                else:
+                    for row, (line, new_line) in enumerate(
+                            zip(lines, new_lines)):
+                        if line != new_line:
+                            sys.stdout.write(
+                                self.__get_line_update(row, line, new_line))
+                sys.stdout.flush()
+                lines, size = new_lines, new_size
+
+                time.sleep(interval)
+                self.__sys_info.refresh()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sys.stdout.write(f'\x1b[{len(lines) + 1};1H\x1b[?25h')
+            sys.stdout.flush()
+        return 0
+
+    @staticmethod
+    def __get_line_update(row: int, line: str, new_line: str) -> str:
+        # Only the end of the line that changed, from its first changed
+        # column. The color in use at that point is set again
+        start = 0
+        while (start < min(len(line), len(new_line))
+               and line[start] == new_line[start]):
+            start += 1
+
+        prefix = new_line[:start]
+        escape = prefix.rfind('\x1b')
+        if escape != -1 and not re.match(r'\x1b\[[\d;]*m', prefix[escape:]):
+            # Inside an escape sequence
+            start, prefix = escape, prefix[:escape]
+
+        colors = re.findall(r'\x1b\[[\d;]*m', prefix)
+        text = re.sub(r'\x1b\[[\d;]*m', '', prefix)
+        if any(unicodedata.east_asian_width(x) in 'WF' or
+               unicodedata.category(x) in ['Mn', 'Me', 'Cf']
+               for x in text + new_line[start:start + 1]
+               if not x.isascii()):
+            # Wide or zero-width characters, like CJK or a combining
+            # accent, the column is unknown. The whole line is written
+            return '\x1b[{};1H{}\x1b[K'.format(row + 1, new_line)
+
+        column = len(text)
+        return '\x1b[{};{}H{}{}\x1b[K'.format(
+            row + 1, column + 1, colors[-1] if colors else '',
+            new_line[start:])
+
+    def __set_palette(self, mode: str | None, is_dithered: bool) -> None:
+        # The logo is drawn again only when it changes
+        palette = ansi.palette.Palette(mode, is_dithered)
+        if (palette.mode == self.__palette.mode and
+                palette.is_dithered == self.__palette.is_dithered):
+            return
+
+        self.__palette = palette
+        self.__colorbar = None
+        self.__logo = None
+
+    def __get_colorbar(self) -> ansi.colorbar.ColorBar:
+        # Made with the accent color of the logo, when first needed
+        if self.__colorbar is None:
+            self.__colorbar = ansi.colorbar.ColorBar(
+                self.__get_logo().image_accent_color.split(';'),
+                self.__palette)
+            self.__colorbar.color_item_width = self.__colorbar_item_width
+            self.__colorbar.is_legacy = self.__colorbar_is_legacy
+            self.__colorbar.is_mirrored = self.__colorbar_is_mirrored
+        return self.__colorbar
+
+    def __get_logo(self) -> ansi.logocache.CachedLogo:
+        # Loaded once, when first needed, from the cache if possible
+        if self.__logo is not None:
+            return self.__logo
+
         img_path = ''
         logo_id = info.desktopentryparse.DesktopFile(
             os.path.join(self.__base_dir, 'statics', 'logobyidrc'))
@@ -106,15 +279,6 @@ class InfoFetch(object):
                         self.__sys_info.raw_info.os_release['LOGO'],
                         theme=self.__sys_info.raw_info.kde_icons)
 
-                    if img_path and img_path.endswith('.svg'):
-                        cairosvg.svg2png(
-                            url=img_path,
-                            write_to=f'/tmp/infofetch-logo.png',
-                            output_width=self.__logo_width,
-                            output_height=self.__logo_height)
-
-                        img_path = '/tmp/infofetch-logo.png'
-
                     if not img_path:
                         img_path = ''
 
@@ -122,47 +286,139 @@ class InfoFetch(object):
         if not os.path.isfile(img_path):
             img_path = os.path.join(self.__base_dir, 'statics', 'linux.png')
 
-        return ansi.ansicolorimage.AnsiColorImage(
-            url_image=img_path, contrast=1.3, brightness=0.85)
-
-    def __get_infos(self) -> list:
-        # ...
+        # Keyed by the source image, so an SVG is only converted on a miss
+        cache = ansi.logocache.LogoCache(
+            os.path.join(info.infocache.InfoCache.cache_dir(), 'logos'))
+        key = cache.key(img_path, {
+            'format_version': cache.format_version, 'width': 40,
+            'height': 20, 'contrast': 1.3, 'brightness': 0.85,
+            'chars_map': None, 'svg_width': self.__logo_width,
+            'svg_height': self.__logo_height,
+            'palette_mode': self.__palette.mode,
+            'is_dithered': self.__palette.is_dithered})
+
+        self.__logo = cache.get(key) if key else None
+        if self.__logo is None:
+            self.__logo = self.__render_logo(img_path)
+            if key:
+                cache.set(key, self.__logo)
+        return self.__logo
+
+    def __render_logo(self, img_path: str) -> ansi.logocache.CachedLogo:
+        # The image libraries are only imported here, when the logo is not
+        # cached
+        import ansi.ansicolorimage
+
+        if img_path.endswith('.svg'):
+            import cairosvg
+
+            # A private file, since the daemon and the clients can convert
+            # at the same time. Removed once the logo is drawn
+            with tempfile.NamedTemporaryFile(
+                    prefix='infofetch-logo-', suffix='.png') as png_file:
+                cairosvg.svg2png(
+                    url=img_path,
+                    write_to=png_file.name,
+                    output_width=self.__logo_width,
+                    output_height=self.__logo_height)
+                return self.__render_logo(png_file.name)
+
+        logo = ansi.ansicolorimage.AnsiColorImage(
+            url_image=img_path, width=40, height=20, contrast=1.3,
+            brightness=0.85, palette=self.__palette)
+        return ansi.logocache.CachedLogo(
+            logo.ansi_lines, logo.image_accent_color, logo.width)
+
+    def __fetch_progressively(self) -> None:
+        # One line per field while collecting, so that each one has a
+        # fixed row. Fields without a value are removed at the end
+        values = {x: None for x in self.__sys_info.fields}
+        placeholder = '\x1b[2m...\x1B[0m'
+        lines = self.__get_lines(self.__get_infos(
+            {x: placeholder for x in values}, keep_empty=True))
+
+        if len(lines) >= shutil.get_terminal_size().lines:
+            # Rows that scroll out can't be rewritten
+            sys.stdout.write(self.render())
+            return
+
+        pending = list(values)
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+
+        def field_ready(field: str, value: str | None) -> None:
+            values[field] = value
+            pending.remove(field)
+            new_lines = self.__get_lines(self.__get_infos(
+                {x: placeholder if x in pending else values[x]
+                 for x in values}, keep_empty=True))
+            for row, line in enumerate(new_lines):
+                if line != lines[row]:
+                    lines[row] = line
+                    up = len(lines) - row
+                    sys.stdout.write(
+                        f'\x1b[{up}A\r\x1b[2K{line}\x1b[{up}B\r')
+            sys.stdout.flush()
+
+        self.__sys_info.collect(field_ready)
+
+        # Same final output as without the progressive mode
+        final_lines = self.__get_lines(self.__get_infos(values))
+        if final_lines != lines:
+            sys.stdout.write(f'\x1b[{len(lines)}A\r')
+            for line in final_lines:
+                sys.stdout.write(f'\x1b[2K{line}\n')
+            sys.stdout.write('\x1b[J')
+            sys.stdout.flush()
+
+    def __get_infos(
+            self, values: dict, keep_empty: bool = False,
+            columns: int = None) -> list:
+        # "Key: value" lines, ending with an empty line
         infos = ''
-        _cmd = subprocess.Popen(
-            ['tput', 'cols'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        tput_cols, _stderr = _cmd.communicate()
+        if not columns:
+            columns = shutil.get_terminal_size().columns
 
         accent_color = (
             '200;200;200' if self.__sys_info.raw_info.name_id == 'manjaro'
-            else self.__logo.image_accent_color)
+            else self.__get_logo().image_accent_color)
+        accent_color = self.__palette.sgr(self.__palette.quantize(
+            *[int(x) for x in accent_color.split(';')]))
 
-        for key, value in self.__sys_info.info_fetch_as_dict.items():
-            value_width = int(tput_cols) - len(key) - self.__logo.width - 3
+        for key, value in values.items():
+            value_width = columns - len(key) - self.__get_logo().width - 3
 
             if value:
                 if len(value) > value_width:
-                    infos += "\x1b[38;2;{}m{}\x1B[0m: {}\n".format(
+                    infos += "\x1b[{}m{}\x1B[0m: {}\n".format(
                         accent_color, key, value[:value_width - 3] + '...')
                 else:
-                    infos += "\x1b[38;2;{}m{}\x1B[0m: {}\n".format(
+                    infos += "\x1b[{}m{}\x1B[0m: {}\n".format(
                         accent_color, key, value)
+            elif keep_empty:
+                infos += '\n'
 
         return infos.split('\n')
 
-    def __set_same_amount_of_lines_for_logo_and_info(self) -> None:
-        # Same height
-        len_image = len(self.__logo.ansi_lines)
-        len_info = len(self.__infos)
+    def __get_lines(self, infos: list) -> list:
+        # Logo and info side by side, with the same height. The color bar
+        # takes the last info line
+        logo_lines = list(self.__get_logo().ansi_lines)
+        infos = list(infos)
 
-        if len_image < len_info:
-            self.__infos[-1] = self.__colorbar.colorbar
-            for _ in range(len_info - len_image):
-                self.__logo.ansi_lines.append(' ' * self.__logo.width)
+        if len(logo_lines) < len(infos):
+            infos[-1] = self.__get_colorbar().colorbar
+            for _ in range(len(infos) - len(logo_lines)):
+                logo_lines.append(' ' * self.__get_logo().width)
         else:
-            for _ in range(len_image - len_info):
-                self.__infos.append(' ')
+            for _ in range(len(logo_lines) - len(infos)):
+                infos.append(' ')
+
+            infos[-1] = self.__get_colorbar().colorbar
 
-            self.__infos[-1] = self.__colorbar.colorbar
+        return [
+            f'{img_line} {text_line}'
+            for img_line, text_line in zip(logo_lines, infos)]
 
 
 def main() -> None:
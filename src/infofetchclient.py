@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import json
+import os
+import socket
+
+
+class InfoFetchClient(object):
+    """Client of the 'infofetchd' daemon
+
+    Asks the daemon of the user for the already rendered output, so
+    nothing is collected or drawn here. Only the standard library is
+    imported, which keeps the start of the client fast.
+    """
+    def __init__(self, url: str = None, timeout: float = 0.5) -> None:
+        """Class constructor
+
+        :param url: Path of the daemon socket. Default is 'socket_url()'
+        :param timeout: Seconds to wait for the daemon
+        """
+        self.__url = url if url else self.socket_url()
+        self.__timeout = timeout
+
+    @staticmethod
+    def socket_url() -> str | None:
+        """'$XDG_RUNTIME_DIR/infofetch.sock'
+
+        'None' without '$XDG_RUNTIME_DIR', since other places, like '/tmp',
+        are not private to the user.
+        """
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        if not runtime_dir:
+            return None
+        return os.path.join(runtime_dir, 'infofetch.sock')
+
+    @staticmethod
+    def environ() -> dict:
+        """The variables of the session that change the output
+
+        Like the shell, the desktop and the display server. The daemon
+        only answers clients with the same ones, since it was perhaps
+        started from another session, a TTY or 'systemd --user'.
+        """
+        return {x: os.environ.get(x) for x in [
+            'SHELL', 'XDG_CURRENT_DESKTOP', 'XDG_SESSION_TYPE', 'DISPLAY',
+            'WAYLAND_DISPLAY', 'USER']}
+
+    @property
+    def url(self) -> str | None:
+        """..."""
+        return self.__url
+
+    def request(self, options: dict) -> str | None:
+        """The output of the daemon
+
+        :param options: Like {'columns': 120, 'colorbar_is_legacy': False}
+        :return: The text to print, or 'None' if the daemon is not running,
+            does not answer in time or is in another session
+        """
+        if not self.__url:
+            return None
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.settimeout(self.__timeout)
+                client.connect(self.__url)
+                client.sendall(json.dumps(
+                    {**options, 'environ': self.environ()}).encode() + b'\n')
+                client.shutdown(socket.SHUT_WR)
+
+                chunks = []
+                while True:
+                    chunk = client.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+        except OSError:
+            return None
+
+        output = b''.join(chunks).decode(errors='replace')
+        return output if output else None
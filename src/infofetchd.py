@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import infofetch
+import infofetchclient
+
+
+class InfoFetchDaemon(object):
+    """Per-user daemon that answers 'infofetch' instantly
+
+    Keeps the information and the logo ready in memory, refreshes the
+    dynamic fields, like RAM and uptime, every 'refresh_interval' seconds,
+    and renders the output for each client on its UNIX socket in
+    '$XDG_RUNTIME_DIR'. Everything is collected again, logo included,
+    every 'reload_interval' seconds, for things like new packages. Only
+    clients in the same session as the daemon are answered, the others
+    fetch by themselves.
+
+    Refreshes and reloads run in a background thread. A lock keeps them
+    from changing the information while a client is answered, and the
+    clients from changing each other's options.
+    """
+    def __init__(
+            self, url: str = None, refresh_interval: float = 2.0,
+            reload_interval: float = 600.0,
+            read_timeout: float = 0.2) -> None:
+        """Class constructor
+
+        :param url: Path of the socket. Default is
+            '$XDG_RUNTIME_DIR/infofetch.sock'
+        :param refresh_interval: Seconds between refreshes of the dynamic
+            fields
+        :param reload_interval: Seconds between full reloads
+        :param read_timeout: Seconds a client has to send its request, in
+            total. Less than the timeout of 'InfoFetchClient', since the
+            clients are answered one at a time
+        """
+        self.__url = url if url else (
+            infofetchclient.InfoFetchClient.socket_url())
+        self.__refresh_interval = refresh_interval
+        self.__reload_interval = reload_interval
+        self.__read_timeout = read_timeout
+        self.__app = None
+        self.__environ = infofetchclient.InfoFetchClient.environ()
+        self.__stopped = threading.Event()
+        self.__lock = threading.Lock()
+
+    @property
+    def url(self) -> str | None:
+        """..."""
+        return self.__url
+
+    def serve(self) -> int:
+        """Answer the clients until interrupted
+
+        :return: Exit code, 1 if the socket can't be used
+        """
+        if not self.__url:
+            print('infofetchd: $XDG_RUNTIME_DIR is not set', file=sys.stderr)
+            return 1
+
+        if infofetchclient.InfoFetchClient(self.__url).request(
+                {'columns': 80}) is not None:
+            print(f'infofetchd: already running on {self.__url}',
+                  file=sys.stderr)
+            return 1
+        if os.path.exists(self.__url):
+            os.unlink(self.__url)  # Left by a daemon that was killed
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o077)
+        try:
+            server.bind(self.__url)
+        finally:
+            os.umask(umask)
+        server.listen(16)
+
+        self.__app = self.__load()
+        self.__stopped.clear()
+        threading.Thread(target=self.__update, daemon=True).start()
+        try:
+            while True:
+                connection, _address = server.accept()
+                with connection:
+                    self.__answer(connection)
+        except KeyboardInterrupt:
+            return 0
+        finally:
+            self.__stopped.set()
+            server.close()
+            if os.path.exists(self.__url):
+                os.unlink(self.__url)
+
+    @staticmethod
+    def __load() -> infofetch.InfoFetch:
+        # Collect everything and load the logo now, not on the first
+        # request
+        app = infofetch.InfoFetch()
+        app.sys_info.collect()
+        app.render()
+        return app
+
+    def __update(self) -> None:
+        # Background thread. A reload builds a new app and only replaces
+        # the one in use when it is ready. An error is reported and the
+        # last values are kept until the next try
+        next_reload = time.monotonic() + self.__reload_interval
+        while not self.__stopped.wait(self.__refresh_interval):
+            try:
+                if time.monotonic() >= next_reload:
+                    next_reload = time.monotonic() + self.__reload_interval
+                    app = self.__load()
+                    with self.__lock:
+                        self.__app = app
+                else:
+                    with self.__lock:
+                        self.__app.sys_info.refresh()
+            except Exception as error:
+                print(f'infofetchd: update failed: {error!r}',
+                      file=sys.stderr)
+
+    def __answer(self, connection: socket.socket) -> None:
+        # One JSON line with the options, the output as the answer. A
+        # client that doesn't send it in time is dropped, so it can't hold
+        # up the others
+        deadline = time.monotonic() + self.__read_timeout
+        request = b''
+        try:
+            while not request.endswith(b'\n'):
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return
+                connection.settimeout(timeout)
+                chunk = connection.recv(4096)
+                if not chunk or len(request) > 65536:
+                    break
+                request += chunk
+            options = json.loads(request)
+        except (OSError, ValueError):
+            return
+        if not isinstance(options, dict):
+            return
+        if options.get('environ') != self.__environ:
+            return  # Another session, the client fetches by itself
+
+        with self.__lock:
+            output = self.__render(options)
+        try:
+            connection.sendall(output.encode())
+        except OSError:
+            pass
+
+    def __render(self, options: dict) -> str:
+        # With the options of the client
+        app = self.__app
+        app.colobar_item_width = self.__option(
+            options, 'colorbar_item_width', int, 1)
+        app.colorbar_is_legacy = self.__option(
+            options, 'colorbar_is_legacy', bool, False)
+        app.colorbar_is_mirrored = self.__option(
+            options, 'colorbar_is_mirrored', bool, True)
+
+        # The terminal of the client, not the one of the daemon
+        palette_mode = self.__option(options, 'palette_mode', str, None)
+        app.palette_mode = (
+            palette_mode if palette_mode in ['truecolor', '256', '16']
+            else 'truecolor')
+        app.is_dithered = self.__option(
+            options, 'is_dithered', bool, False)
+
+        return app.render(self.__option(options, 'columns', int, 80))
+
+    @staticmethod
+    def __option(options: dict, key: str, value_type: type, default):
+        # ...
+        value = options.get(key, default)
+        return value if type(value) is value_type else default
+
+
+def main() -> int:
+    """..."""
+    return InfoFetchDaemon().serve()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
+import json
 import logging
+import shutil
 import sys
 
-import infofetch
+import ansi.palette
+import infofetchclient
 
 
 class Application(object):
@@ -11,7 +14,21 @@ class Application(object):
         """..."""
         self.__args_k_v = {}
         self.__errors_found = False
-        self.__app = infofetch.InfoFetch()
+        self.__timeout = 5.0
+        self.__probe_timeout = 3.0
+        self.__use_daemon = True
+        self.__watch = None
+        self.__fields = None
+        self.__get = None
+
+        # InfoFetch property: value
+        self.__options = {
+            'colobar_item_width': 1,
+            'colorbar_is_legacy': False,
+            'colorbar_is_mirrored': True,
+            'is_progressive': True,
+            'palette_mode': ansi.palette.Palette.detect_mode(),
+            'is_dithered': False}
 
     def __create_args(self) -> None:
         # ...
@@ -19,13 +36,13 @@ class Application(object):
             arg = arg.strip().strip('"').strip("'")
             if num > 0:
                 if ' ' in arg:
-                    key, value = arg.split(' ')
+                    key, value = arg.split(' ', 1)
                     self.__args_k_v['-' + key] = value.strip('"').strip("'")
                 else:
                     self.__args_k_v['-' + arg] = ''
 
     def __set_args(self) -> None:
-        # ...
+        # Only reads the options, the app is created by 'main()'
         if len(sys.argv) <= 1:
             return
 
@@ -37,6 +54,24 @@ class Application(object):
                 self.__arg_colorbar_legacy(value)
             elif key == '--colorbar-small':
                 self.__arg_colorbar_small(value)
+            elif key == '--progressive':
+                self.__arg_progressive(value)
+            elif key == '--timeout':
+                self.__timeout = self.__arg_seconds(key, value, 5.0)
+            elif key == '--probe-timeout':
+                self.__probe_timeout = self.__arg_seconds(key, value, 3.0)
+            elif key == '--colors':
+                self.__arg_colors(value)
+            elif key == '--dithering':
+                self.__arg_dithering(value)
+            elif key == '--watch':
+                self.__watch = self.__arg_seconds(key, value or 'auto', 2.0)
+            elif key == '--fields':
+                self.__fields = [x.strip() for x in value.split(',')]
+            elif key == '--get':
+                self.__get = value
+            elif key == '--daemon':
+                self.__arg_daemon(value)
             elif key == '--help' or key == '-h':
                 self.__arg_help(value)
             else:
@@ -49,9 +84,9 @@ class Application(object):
     def __arg_colobar_item_width(self, value) -> None:
         # ...
         if value.isdigit():
-            self.__app.colobar_item_width = int(value)
+            self.__options['colobar_item_width'] = int(value)
         elif value == 'auto':
-            self.__app.colobar_item_width = 1
+            self.__options['colobar_item_width'] = 1
         else:
             self.__errors_found = True
             print(f"Error: --colorbar-item-width '{value}'.\nThe value must "
@@ -61,9 +96,9 @@ class Application(object):
     def __arg_colorbar_legacy(self, value) -> None:
         # ...
         if value == 'true':
-            self.__app.colorbar_is_legacy = True
+            self.__options['colorbar_is_legacy'] = True
         elif value == 'false' or value == 'auto':
-            self.__app.colorbar_is_legacy = False
+            self.__options['colorbar_is_legacy'] = False
         else:
             self.__errors_found = True
             print(f"Error: --colorbar-legacy '{value}'.\nThe value needs to be"
@@ -72,14 +107,78 @@ class Application(object):
     def __arg_colorbar_small(self, value) -> None:
         # ...
         if value == 'true':
-            self.__app.colorbar_is_mirrored = False
+            self.__options['colorbar_is_mirrored'] = False
         elif value == 'false' or value == 'auto':
-            self.__app.colorbar_is_mirrored = True
+            self.__options['colorbar_is_mirrored'] = True
         else:
             self.__errors_found = True
             print(f"Error: --colorbar-small '{value}'.\nThe value needs to be "
                   "'true', 'false' or 'auto' for the default value.")
 
+    def __arg_progressive(self, value) -> None:
+        # ...
+        if value == 'true' or value == 'auto':
+            self.__options['is_progressive'] = True
+        elif value == 'false':
+            self.__options['is_progressive'] = False
+        else:
+            self.__errors_found = True
+            print(f"Error: --progressive '{value}'.\nThe value needs to be "
+                  "'true', 'false' or 'auto' for the default value.")
+
+    def __arg_colors(self, value) -> None:
+        # ...
+        if value == 'auto':
+            self.__options['palette_mode'] = (
+                ansi.palette.Palette.detect_mode())
+        elif value in ['truecolor', '256', '16']:
+            self.__options['palette_mode'] = value
+        else:
+            self.__errors_found = True
+            print(f"Error: --colors '{value}'.\nThe value needs to be "
+                  "'truecolor', '256', '16' or 'auto' for the default value.")
+
+    def __arg_dithering(self, value) -> None:
+        # ...
+        if value == 'true':
+            self.__options['is_dithered'] = True
+        elif value == 'false' or value == 'auto':
+            self.__options['is_dithered'] = False
+        else:
+            self.__errors_found = True
+            print(f"Error: --dithering '{value}'.\nThe value needs to be "
+                  "'true', 'false' or 'auto' for the default value.")
+
+    def __arg_daemon(self, value) -> None:
+        # ...
+        if value == 'true' or value == 'auto':
+            self.__use_daemon = True
+        elif value == 'false':
+            self.__use_daemon = False
+        else:
+            self.__errors_found = True
+            print(f"Error: --daemon '{value}'.\nThe value needs to be "
+                  "'true', 'false' or 'auto' for the default value.")
+
+    def __arg_seconds(
+            self, key: str, value: str, default: float) -> float | None:
+        # ...
+        if value == 'auto':
+            return default
+        if value == 'none':
+            return None
+        try:
+            if float(value) > 0:
+                return float(value)
+        except ValueError:
+            pass
+
+        self.__errors_found = True
+        print(f"Error: {key} '{value}'.\nThe value must be a number of "
+              "seconds such as '2' or '0.5', 'none' for no limit or 'auto' "
+              "for the default value.")
+        return default
+
     @staticmethod
     def __arg_help(value) -> None:
         # ...
@@ -93,13 +192,79 @@ class Application(object):
             '--help, -h                Display this help and exit\n'
             '--colobar-item-width <1>  Chars num each color uses\n'
             '--colorbar-legacy <true>  Use the old color bar\n'
-            '--colorbar-small <false>  Only half of the color bar\n')
+            '--colorbar-small <false>  Only half of the color bar\n'
+            '--progressive <true>      Fill in the fields as they are ready\n'
+            '--colors <auto>           truecolor, 256 or 16 colors. Auto is\n'
+            '                          from $COLORTERM and $TERM\n'
+            '--dithering <false>       Dither the logo with 256 or 16 colors\n'
+            '--timeout <5>             Seconds to collect everything\n'
+            '--probe-timeout <3>       Seconds each information may take\n'
+            '--daemon <true>           Use infofetchd.py when it is running\n'
+            '--watch <2>               Update the fields every N seconds\n'
+            '--fields <OS,Kernel,RAM>  Show only these fields\n'
+            '--get <ram_free>          Print only this value and exit\n')
         sys.exit(0)
 
-    def main(self) -> None:
+    def __print_value(self) -> int:
+        # Without the logo, so nothing but the value's probes is imported
+        # or run
+        import info.formattedsysteminfo
+
+        sys_info = info.formattedsysteminfo.FormattedSystemInfo(
+            timeout=self.__timeout, probe_timeout=self.__probe_timeout)
+        try:
+            value = sys_info.value(self.__get)
+        except ValueError as error:
+            print(f"Error: {error}.\nThe value needs to be one of: "
+                  f"{', '.join(sys_info.probes)}")
+            return 1
+
+        for line in sys_info.diagnostics:
+            print(f'infofetch: {line}', file=sys.stderr)
+        if value is None:
+            return 1
+
+        print(json.dumps(value) if isinstance(
+            value, (list, tuple, dict)) else value)
+        return 0
+
+    def main(self) -> int:
         """..."""
         self.__set_args()
-        self.__app.fetch()
+
+        if self.__get is not None:
+            return self.__print_value()
+
+        if (self.__use_daemon and self.__watch is None and
+                self.__fields is None):
+            output = infofetchclient.InfoFetchClient().request({
+                'columns': shutil.get_terminal_size().columns,
+                'colorbar_item_width': self.__options['colobar_item_width'],
+                'colorbar_is_legacy': self.__options['colorbar_is_legacy'],
+                'colorbar_is_mirrored': self.__options[
+                    'colorbar_is_mirrored'],
+                'palette_mode': self.__options['palette_mode'],
+                'is_dithered': self.__options['is_dithered']})
+            if output is not None:
+                sys.stdout.write(output)
+                return 0
+
+        # Only imported without the daemon, since it loads the image
+        # libraries and collects everything
+        import infofetch
+
+        try:
+            app = infofetch.InfoFetch(
+                self.__timeout, self.__probe_timeout, self.__fields)
+        except ValueError as error:
+            print(f'Error: {error}. Use --help.')
+            return 1
+        for key, value in self.__options.items():
+            setattr(app, key, value)
+
+        if self.__watch is not None:
+            return app.watch(self.__watch)
+        return app.fetch()
 
 
 if __name__ == '__main__':